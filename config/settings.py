@@ -86,6 +86,11 @@ class Settings(BaseSettings):
         le=500,
     )
 
+    vector_store_backend: str = Field(
+        default="chroma",
+        description="Vector store backend (chroma: persistent ChromaDB, memory: in-process)",
+    )
+
     embedding_model: str = Field(
         default="sentence-transformers/all-MiniLM-L6-v2",
         description="Sentence transformer model for embeddings",
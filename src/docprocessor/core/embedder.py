@@ -61,6 +61,7 @@ class Embedder:
         texts: List[str],
         batch_size: int = 32,
         show_progress: bool = True,
+        normalize: bool = False,
     ) -> np.ndarray:
         """
         Generate embeddings for multiple texts in batches.
@@ -69,6 +70,7 @@ class Embedder:
             texts: List of texts to embed
             batch_size: Number of texts to process at once
             show_progress: Show progress bar
+            normalize: Scale embeddings to unit length, so cosine similarity is a dot product
 
         Returns:
             Numpy array of embeddings (shape: [num_texts, embedding_dim])
@@ -85,6 +87,7 @@ class Embedder:
                 batch_size=batch_size,
                 show_progress_bar=show_progress,
                 convert_to_numpy=True,
+                normalize_embeddings=normalize,
             )
             logger.info(f"Successfully generated {len(embeddings)} embeddings")
             return embeddings
@@ -124,7 +127,7 @@ class Embedder:
         )
 
         for chunk, embedding in zip(chunks, embeddings):
-            chunk.embedding = embedding.tolist()
+            chunk.embedding = embedding
 
         logger.info(f"Successfully added embeddings to {len(chunks)} chunks")
         return chunks
@@ -181,16 +181,10 @@ class FigureExtractor:
             logger.error(f"Error extracting figures from {document_path}: {e}")
             result.errors.append(str(e))
 
-        # Calculate statistics
-        result.total_figures = len(result.figures)
+        # Calculate statistics (counts, figures_by_type and lookup indexes)
+        result.update_statistics()
         result.extraction_time_seconds = time.time() - start_time
 
-        # Update figures_by_type
-        result.figures_by_type = {}
-        for figure in result.figures:
-            fig_type = figure.figure_type.value
-            result.figures_by_type[fig_type] = result.figures_by_type.get(fig_type, 0) + 1
-
         return result
 
     def _extract_from_txt(self, file_path: Path) -> List[ExtractedFigure]:
@@ -17,6 +17,28 @@ from config.settings import settings
 
 from ..models.project import Project, ProjectSettings
 
+# ProjectSettings overrides for each project template; only the requested
+# template is instantiated
+_TEMPLATE_SETTINGS: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    "academic": {
+        "default_output_format": "markdown+docx",
+        "include_citations": True,
+        "temperature": 0.5,
+    },
+    "legal": {"default_output_format": "docx", "include_citations": True, "temperature": 0.3},
+    "creative": {
+        "default_output_format": "markdown",
+        "include_citations": False,
+        "temperature": 0.8,
+    },
+    "technical": {
+        "default_output_format": "markdown+docx",
+        "include_citations": True,
+        "temperature": 0.4,
+    },
+}
+
 
 class ProjectManager:
     """Manages document processing projects.
@@ -610,23 +632,11 @@ class ProjectManager:
         Returns:
             ProjectSettings or None if template not found
         """
-        templates = {
-            "default": ProjectSettings(),
-            "academic": ProjectSettings(
-                default_output_format="markdown+docx", include_citations=True, temperature=0.5
-            ),
-            "legal": ProjectSettings(
-                default_output_format="docx", include_citations=True, temperature=0.3
-            ),
-            "creative": ProjectSettings(
-                default_output_format="markdown", include_citations=False, temperature=0.8
-            ),
-            "technical": ProjectSettings(
-                default_output_format="markdown+docx", include_citations=True, temperature=0.4
-            ),
-        }
-
-        return templates.get(template_name)
+        overrides = _TEMPLATE_SETTINGS.get(template_name)
+        if overrides is None:
+            return None
+        # Fresh instance per call: the new project owns and mutates its settings
+        return ProjectSettings(**overrides)
 
     def exists(self, project_id: str) -> bool:
         """Check if a project exists.
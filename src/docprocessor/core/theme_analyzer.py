@@ -258,8 +258,8 @@ class ThemeAnalyzer:
         # Extract keywords (most common words in chunks)
         keywords = self._extract_keywords(cluster_chunks)
 
-        # Create Theme object
-        theme = Theme(
+        # Create Theme object; every field is built here, so skip validation
+        theme = Theme.model_construct(
             label=label,
             description=description,
             chunk_ids=[UUID(chunk["id"]) for chunk in cluster_chunks],
@@ -5,6 +5,7 @@ from typing import Dict, List, Optional
 from uuid import UUID
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings as ChromaSettings
 
 from config.settings import settings
@@ -14,6 +15,118 @@ from docprocessor.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+class _MemoryCollection:
+    """In-process stand-in for the part of the ChromaDB collection API VectorStore uses.
+
+    Search is exact (brute-force) cosine similarity over a NumPy matrix, which
+    beats an ANN index at the small sizes this backend is meant for (tests and
+    throwaway stores). ``where`` filters support plain equality only.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._ids: List[str] = []
+        self._embeddings: List[np.ndarray] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict] = []
+        # Row-normalized embedding matrix, rebuilt after adds/deletes
+        self._matrix: Optional[np.ndarray] = None
+
+    def count(self) -> int:
+        return len(self._ids)
+
+    def add(self, ids, embeddings, documents, metadatas) -> None:
+        vectors = [np.asarray(embedding, dtype=np.float32) for embedding in embeddings]
+        # Like ChromaDB, reject embeddings whose dimension differs from the collection's
+        if vectors:
+            dim = len(self._embeddings[0]) if self._embeddings else len(vectors[0])
+            mismatched = [id_ for id_, vector in zip(ids, vectors) if len(vector) != dim]
+            if mismatched:
+                raise ValueError(
+                    f"Embedding dimension mismatch (expected {dim}) for ids: {mismatched}"
+                )
+
+        existing = set(self._ids)
+        for id_, vector, document, metadata in zip(ids, vectors, documents, metadatas):
+            # Like ChromaDB, adding an existing id leaves the stored entry alone
+            if id_ in existing:
+                continue
+            existing.add(id_)
+            self._ids.append(id_)
+            self._embeddings.append(vector)
+            self._documents.append(document)
+            self._metadatas.append(metadata)
+        self._matrix = None
+
+    def _matching(self, ids=None, where=None) -> List[int]:
+        wanted = set(ids) if ids is not None else None
+        return [
+            i
+            for i, (id_, metadata) in enumerate(zip(self._ids, self._metadatas))
+            if (wanted is None or id_ in wanted)
+            and (not where or all(metadata.get(k) == v for k, v in where.items()))
+        ]
+
+    def query(self, query_embeddings, n_results: int, where=None) -> Dict:
+        if self._matrix is None:
+            matrix = np.vstack(self._embeddings)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._matrix = matrix / np.where(norms == 0, 1, norms)
+
+        candidates = np.asarray(self._matching(where=where), dtype=np.intp)
+        result = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        for query in query_embeddings:
+            query = np.asarray(query, dtype=np.float32)
+            norm = np.linalg.norm(query)
+            similarities = self._matrix[candidates] @ (query / norm if norm else query)
+            top = np.argsort(-similarities, kind="stable")[:n_results]
+            rows = candidates[top]
+            result["ids"].append([self._ids[i] for i in rows])
+            result["documents"].append([self._documents[i] for i in rows])
+            result["metadatas"].append([self._metadatas[i] for i in rows])
+            result["distances"].append((1.0 - similarities[top]).tolist())
+        return result
+
+    def get(self, ids=None, where=None, limit=None, include=None) -> Dict:
+        rows = self._matching(ids, where)[:limit]
+        result = {
+            "ids": [self._ids[i] for i in rows],
+            "documents": [self._documents[i] for i in rows],
+            "metadatas": [self._metadatas[i] for i in rows],
+        }
+        if include is not None and "embeddings" in include:
+            result["embeddings"] = [self._embeddings[i] for i in rows]
+        return result
+
+    def delete(self, ids=None, where=None) -> None:
+        drop = set(self._matching(ids, where))
+        for attr in ("_ids", "_embeddings", "_documents", "_metadatas"):
+            values = getattr(self, attr)
+            setattr(self, attr, [v for i, v in enumerate(values) if i not in drop])
+        self._matrix = None
+
+
+class _MemoryClient:
+    """Holds the _MemoryCollection instances of one in-memory VectorStore."""
+
+    def __init__(self):
+        self._collections: Dict[str, _MemoryCollection] = {}
+
+    def get_or_create_collection(self, name: str, metadata=None) -> _MemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = _MemoryCollection(name)
+        return self._collections[name]
+
+    def create_collection(self, name: str, metadata=None) -> _MemoryCollection:
+        if name in self._collections:
+            raise ValueError(f"Collection {name} already exists")
+        return self.get_or_create_collection(name)
+
+    def delete_collection(self, name: str) -> None:
+        if self._collections.pop(name, None) is None:
+            raise ValueError(f"Collection {name} does not exist")
+
+
 class VectorStore:
     """Manages vector storage and retrieval using ChromaDB."""
 
@@ -21,6 +134,7 @@ class VectorStore:
         self,
         collection_name: str = "documents",
         persist_directory: Optional[Path] = None,
+        backend: Optional[str] = None,
     ):
         """
         Initialize the vector store.
@@ -28,21 +142,33 @@ class VectorStore:
         Args:
             collection_name: Name of the ChromaDB collection
             persist_directory: Directory for ChromaDB persistence (default: from settings)
+            backend: "chroma" (persistent) or "memory" (in-process, nothing written
+                to disk; for tests). Defaults to settings.vector_store_backend.
+
+        Raises:
+            ValueError: If the backend is unknown
         """
         self.collection_name = collection_name
         self.persist_directory = persist_directory or settings.vector_db_dir
-
-        logger.info(f"Initializing vector store at {self.persist_directory}")
-
-        self.persist_directory.mkdir(parents=True, exist_ok=True)
-
-        self.client = chromadb.PersistentClient(
-            path=str(self.persist_directory),
-            settings=ChromaSettings(
-                anonymized_telemetry=False,
-                allow_reset=True,
-            ),
-        )
+        self.backend = backend or settings.vector_store_backend
+
+        if self.backend == "memory":
+            logger.info("Initializing in-memory vector store")
+            self.client = _MemoryClient()
+        elif self.backend == "chroma":
+            logger.info(f"Initializing vector store at {self.persist_directory}")
+
+            self.persist_directory.mkdir(parents=True, exist_ok=True)
+
+            self.client = chromadb.PersistentClient(
+                path=str(self.persist_directory),
+                settings=ChromaSettings(
+                    anonymized_telemetry=False,
+                    allow_reset=True,
+                ),
+            )
+        else:
+            raise ValueError(f"Unknown vector store backend: {self.backend}")
 
         self.collection = self.client.get_or_create_collection(
             name=collection_name,
@@ -69,7 +195,7 @@ class VectorStore:
 
         self.collection.add(
             ids=[str(chunk.id)],
-            embeddings=[chunk.embedding],
+            embeddings=[chunk.embedding_array.tolist()],
             documents=[chunk.text],
             metadatas=[
                 {
@@ -93,7 +219,7 @@ class VectorStore:
             chunks: List of Chunk objects with embeddings
 
         Raises:
-            ValueError: If any chunk has no embedding
+            ValueError: If any chunk has no embedding, or embeddings differ in dimension
         """
         if not chunks:
             logger.warning("No chunks provided to add")
@@ -103,10 +229,25 @@ class VectorStore:
         if missing_embeddings:
             raise ValueError(f"Chunks missing embeddings: {missing_embeddings}")
 
+        # The buffers are joined and re-split into equal rows below, so mixed
+        # dimensions would silently shift values between chunks
+        size = len(chunks[0].embedding)
+        mismatched = [c.id for c in chunks if len(c.embedding) != size]
+        if mismatched:
+            raise ValueError(
+                f"Chunks with embedding dimension different from {size // 4}: {mismatched}"
+            )
+
         logger.info(f"Adding {len(chunks)} chunks to vector store")
 
         ids = [str(chunk.id) for chunk in chunks]
-        embeddings = [chunk.embedding for chunk in chunks]
+        # Join the packed float32 buffers into one matrix and convert it in a
+        # single tolist() call instead of one array view and conversion per chunk
+        embeddings = (
+            np.frombuffer(b"".join(chunk.embedding for chunk in chunks), dtype=np.float32)
+            .reshape(len(chunks), -1)
+            .tolist()
+        )
         documents = [chunk.text for chunk in chunks]
         metadatas = [
             {
@@ -8,15 +8,6 @@ from typing import List, Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from docprocessor.core.document_processor import DocumentProcessor
-from docprocessor.core.embedder import Embedder
-from docprocessor.core.output_formatter import OutputFormatter
-from docprocessor.core.rag_pipeline import RAGPipeline
-from docprocessor.core.synthesis_engine import SynthesisEngine
-from docprocessor.core.theme_analyzer import ThemeAnalyzer
-from docprocessor.core.vector_store import VectorStore
-from docprocessor.llm.ollama_client import OllamaClient
-from docprocessor.llm.prompt_manager import PromptManager
 from docprocessor.models.project import SynthesisCache
 from docprocessor.utils.language_manager import get_language_manager
 from docprocessor.utils.logger import get_logger
@@ -60,6 +51,11 @@ class DocumentProcessingWorker(QThread):
     def run(self):
         """Process documents in background."""
         try:
+            # Heavy dependencies (models, ChromaDB) are imported on first run, not with the GUI
+            from docprocessor.core.document_processor import DocumentProcessor
+            from docprocessor.core.embedder import Embedder
+            from docprocessor.core.vector_store import VectorStore
+
             lang_mgr = get_language_manager()
             self.progress.emit(0, lang_mgr.get("worker_initializing"))
 
@@ -93,12 +89,8 @@ class DocumentProcessingWorker(QThread):
                         percent, lang_mgr.get("worker_embedding_chunk", i + 1, len(all_chunks))
                     )
 
-                # Generate embedding and attach to chunk
-                embedding = embedder.embed_text(chunk.text)
-                # Convert numpy array to list
-                chunk.embedding = (
-                    embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
-                )
+                # Generate embedding and attach to chunk (packed to float32 by the model)
+                chunk.embedding = embedder.embed_text(chunk.text)
                 # Add chunk to vector store
                 vector_store.add_chunk(chunk)
 
@@ -126,6 +118,12 @@ class ThemeDiscoveryWorker(QThread):
     def run(self):
         """Discover themes in background."""
         try:
+            from docprocessor.core.embedder import Embedder
+            from docprocessor.core.theme_analyzer import ThemeAnalyzer
+            from docprocessor.core.vector_store import VectorStore
+            from docprocessor.llm.ollama_client import OllamaClient
+            from docprocessor.llm.prompt_manager import PromptManager
+
             lang_mgr = get_language_manager()
             self.progress.emit(0, lang_mgr.get("worker_initializing"))
 
@@ -191,6 +189,15 @@ class SynthesisWorker(QThread):
     def run(self):
         """Synthesize book in background."""
         try:
+            from docprocessor.core.embedder import Embedder
+            from docprocessor.core.output_formatter import OutputFormatter
+            from docprocessor.core.rag_pipeline import RAGPipeline
+            from docprocessor.core.synthesis_engine import SynthesisEngine
+            from docprocessor.core.theme_analyzer import ThemeAnalyzer
+            from docprocessor.core.vector_store import VectorStore
+            from docprocessor.llm.ollama_client import OllamaClient
+            from docprocessor.llm.prompt_manager import PromptManager
+
             lang_mgr = get_language_manager()
             self.progress.emit(0, lang_mgr.get("worker_initializing"))
 
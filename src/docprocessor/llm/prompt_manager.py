@@ -1,8 +1,10 @@
 """Prompt template management system."""
 
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Optional
 
 import yaml
 
@@ -11,6 +13,7 @@ from docprocessor.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=32)
 def get_resource_path(relative_path: str) -> Path:
     """Get absolute path to resource, works for dev and PyInstaller."""
     try:
@@ -37,27 +40,46 @@ class PromptManager:
             prompts_file = get_resource_path("config/prompts.yaml")
 
         self.prompts_file = prompts_file
-        self.prompts: Dict = {}
-
-        if self.prompts_file.exists():
-            self.load_prompts()
-            logger.info(f"Loaded {len(self.prompts)} prompt templates from {self.prompts_file}")
-        else:
-            logger.warning(f"Prompts file not found: {self.prompts_file}")
-            self._create_default_prompts()
+        self._prompts: Optional[dict] = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def prompts(self) -> dict:
+        """Prompt templates, loaded from the prompts file on first access."""
+        if self._prompts is None:
+            self._ensure_loaded()
+        return self._prompts
+
+    @prompts.setter
+    def prompts(self, value: dict) -> None:
+        self._prompts = value
+
+    def _ensure_loaded(self) -> None:
+        """Load prompts once; callers that never request a prompt skip the YAML parse."""
+        with self._load_lock:
+            if self._prompts is not None:
+                return
+            if self.prompts_file.exists():
+                self.load_prompts()
+                logger.info(
+                    f"Loaded {len(self._prompts)} prompt templates from {self.prompts_file}"
+                )
+            else:
+                logger.warning(f"Prompts file not found: {self.prompts_file}")
+                self._create_default_prompts()
 
     def load_prompts(self) -> None:
         """Load prompts from YAML file."""
         try:
             with open(self.prompts_file, "r", encoding="utf-8") as f:
-                self.prompts = yaml.safe_load(f) or {}
+                self._prompts = yaml.safe_load(f) or {}
         except Exception as e:
             logger.error(f"Error loading prompts file: {e}")
-            self.prompts = {}
+            self._prompts = {}
 
     def _create_default_prompts(self) -> None:
         """Create default prompts as fallback."""
-        self.prompts = {
+        self._prompts = {
             "rag_query": {
                 "system": "You are a helpful assistant that answers questions based on provided context. Always cite the sources when possible.",
                 "user": "Context:\n{context}\n\nQuestion: {question}\n\nProvide a detailed answer based on the context above.",
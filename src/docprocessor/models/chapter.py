@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Chapter(BaseModel):
@@ -25,14 +25,39 @@ class Chapter(BaseModel):
     word_count: int = Field(0, description="Word count of generated content")
     generated: bool = Field(False, description="Whether content has been generated")
 
+    # (document_id, page) keys of self.citations, for O(1) duplicate checks. The
+    # list object and length it was built from are kept so that edits made to
+    # ``citations`` directly (clear, reassignment, model_copy) trigger a rebuild
+    _citation_keys: set[tuple[str, Optional[str]]] = PrivateAttr(default_factory=set)
+    _indexed_citations: Optional[list[dict[str, str]]] = PrivateAttr(default=None)
+    _indexed_count: int = PrivateAttr(default=0)
+
+    def _get_citation_keys(self) -> set[tuple[str, Optional[str]]]:
+        """Return the citation key index, rebuilding it if citations changed underneath it."""
+        citations = self.citations
+        if citations is not self._indexed_citations or len(citations) != self._indexed_count:
+            self._citation_keys = {
+                (citation.get("document_id"), citation.get("page")) for citation in citations
+            }
+            self._indexed_citations = citations
+            self._indexed_count = len(citations)
+        return self._citation_keys
+
     def add_citation(self, document_id: str, page: Optional[int] = None) -> None:
         """Add a citation to a source document."""
+        page_str = str(page) if page is not None else None
+        key = (document_id, page_str)
+        keys = self._get_citation_keys()
+        if key in keys:
+            return
+
         citation = {"document_id": document_id}
-        if page is not None:
-            citation["page"] = str(page)
+        if page_str is not None:
+            citation["page"] = page_str
 
-        if citation not in self.citations:
-            self.citations.append(citation)
+        keys.add(key)
+        self.citations.append(citation)
+        self._indexed_count += 1
 
     def __str__(self) -> str:
         """String representation."""
@@ -1,14 +1,18 @@
 """Chunk model representing a text chunk from a document."""
 
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
 
 class Chunk(BaseModel):
     """Represents a chunk of text from a document."""
 
+    # Validate on assignment so embeddings set after construction are packed too
+    model_config = ConfigDict(validate_assignment=True)
+
     id: UUID = Field(default_factory=uuid4, description="Unique chunk identifier")
     document_id: UUID = Field(..., description="ID of the source document")
     text: str = Field(..., description="Chunk text content")
@@ -18,9 +22,31 @@ class Chunk(BaseModel):
     start_char: int = Field(..., description="Starting character position in document")
     end_char: int = Field(..., description="Ending character position in document")
     token_count: int = Field(0, description="Number of tokens in this chunk")
-    embedding: Optional[list[float]] = Field(None, description="Vector embedding")
+    embedding: Optional[bytes] = Field(None, description="Vector embedding (packed float32)")
     theme_id: Optional[UUID] = Field(None, description="Assigned theme ID")
 
+    @field_validator("embedding", mode="before")
+    @classmethod
+    def pack_embedding(cls, v: Any) -> Optional[bytes]:
+        """Pack list/array embeddings into a contiguous float32 buffer."""
+        if v is None or isinstance(v, bytes):
+            return v
+        return np.asarray(v, dtype=np.float32).tobytes()
+
+    @field_serializer("embedding", when_used="json")
+    def serialize_embedding(self, v: Optional[bytes]) -> Optional[list[float]]:
+        """Write embeddings to JSON as a list of floats, as before they were packed."""
+        if v is None:
+            return None
+        return np.frombuffer(v, dtype=np.float32).tolist()
+
+    @property
+    def embedding_array(self) -> Optional[np.ndarray]:
+        """Embedding as a read-only float32 array view (no copy)."""
+        if self.embedding is None:
+            return None
+        return np.frombuffer(self.embedding, dtype=np.float32)
+
     def __str__(self) -> str:
         """String representation showing truncated text."""
         preview = self.text[:100] + "..." if len(self.text) > 100 else self.text
@@ -1,15 +1,23 @@
 """Document model representing a document (PDF, TXT, DOCX)."""
 
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import ClassVar, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class Document(BaseModel):
-    """Represents a document with metadata."""
+    """Represents a document with metadata.
+
+    Construction validates ``file_path`` against the filesystem. Code that rebuilds
+    documents from already-validated data can use ``Document.model_construct(...)``
+    to skip validation entirely.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     # Supported file extensions
     SUPPORTED_EXTENSIONS: ClassVar[set[str]] = {".pdf", ".txt", ".docx"}
@@ -31,14 +39,16 @@ class Document(BaseModel):
     @classmethod
     def validate_file_path(cls, v: Path) -> Path:
         """Validate that the file path exists and is a supported document type."""
-        if not v.exists():
-            raise ValueError(f"File does not exist: {v}")
-        if v.suffix.lower() not in cls.SUPPORTED_EXTENSIONS:
+        # Check the extension first: it is pure string work, so unsupported
+        # files are rejected without touching the filesystem.
+        suffix = v.suffix
+        if suffix.lower() not in cls.SUPPORTED_EXTENSIONS:
             raise ValueError(
-                f"Unsupported file type: {v.suffix}. "
+                f"Unsupported file type: {suffix}. "
                 f"Supported types: {', '.join(cls.SUPPORTED_EXTENSIONS)}"
             )
+        try:
+            os.stat(v)
+        except (OSError, ValueError):
+            raise ValueError(f"File does not exist: {v}")
         return v
-
-    class Config:
-        arbitrary_types_allowed = True
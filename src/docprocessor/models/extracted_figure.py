@@ -1,13 +1,21 @@
 """Data models for extracted figures and statistics."""
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from docprocessor.utils import fast_json
 
-class FigureType(Enum):
-    """Type of extracted figure."""
+
+class FigureType(str, Enum):
+    """Type of extracted figure.
+
+    Members are ``str`` instances equal to their value (the behaviour of
+    ``enum.StrEnum``, which needs Python 3.11), so they serialize to JSON and
+    match plain-string dict keys without going through ``.value``.
+    """
 
     NUMBER = "number"
     PERCENTAGE = "percentage"
@@ -16,6 +24,13 @@ class FigureType(Enum):
     QUANTITY = "quantity"  # Number with units (e.g., "1000 fonctionnaires")
     RANGE = "range"  # e.g., "2020-2025"
 
+    def __str__(self) -> str:
+        return str.__str__(self)
+
+
+# Value -> member map so deserialization avoids Enum.__call__ per figure
+_FIGURE_TYPE_BY_VALUE = {member.value: member for member in FigureType}
+
 
 @dataclass
 class ExtractedFigure:
@@ -58,6 +73,17 @@ class ExtractedFigure:
     # Metadata
     extracted_at: datetime = field(default_factory=datetime.now)
 
+    def __post_init__(self):
+        """Intern low-cardinality strings so figures share one copy of each."""
+        if self.unit:
+            self.unit = sys.intern(self.unit)
+        if self.currency_code:
+            self.currency_code = sys.intern(self.currency_code)
+        if self.table_row_header:
+            self.table_row_header = sys.intern(self.table_row_header)
+        if self.table_column_header:
+            self.table_column_header = sys.intern(self.table_column_header)
+
     def __str__(self) -> str:
         """String representation."""
         location = f"Page {self.page_number}" if self.page_number else "Unknown location"
@@ -65,13 +91,13 @@ class ExtractedFigure:
             location += (
                 f" (Table {self.table_index}, Row {self.table_row}, Col {self.table_column})"
             )
-        return f"ExtractedFigure({self.value}, {self.figure_type.value}, {location})"
+        return f"ExtractedFigure({self.value}, {self.figure_type}, {location})"
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
             "value": self.value,
-            "figure_type": self.figure_type.value,
+            "figure_type": self.figure_type,
             "page_number": self.page_number,
             "paragraph_number": self.paragraph_number,
             "sentence_index": self.sentence_index,
@@ -95,18 +121,20 @@ class ExtractedFigure:
             "extracted_at": self.extracted_at.isoformat(),
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON, with the same keys and values as to_dict()."""
+        return _dumps(self)
+
     @classmethod
     def from_dict(cls, data: dict) -> "ExtractedFigure":
         """Create from dictionary."""
         # Convert figure_type string back to enum
-        figure_type = FigureType(data["figure_type"])
+        raw_type = data["figure_type"]
+        figure_type = _FIGURE_TYPE_BY_VALUE.get(raw_type) or FigureType(raw_type)
 
         # Convert extracted_at back to datetime
-        extracted_at = (
-            datetime.fromisoformat(data["extracted_at"])
-            if data.get("extracted_at")
-            else datetime.now()
-        )
+        extracted_at = data.get("extracted_at")
+        extracted_at = datetime.fromisoformat(extracted_at) if extracted_at else datetime.now()
 
         return cls(
             value=data["value"],
@@ -135,6 +163,10 @@ class ExtractedFigure:
         )
 
 
+# Constructor arguments of ExtractedFigure; other keys in a record are ignored
+_FIGURE_FIELDS = frozenset(f.name for f in fields(ExtractedFigure) if f.init)
+
+
 @dataclass
 class FigureExtractionResult:
     """Results from figure extraction operation."""
@@ -147,21 +179,78 @@ class FigureExtractionResult:
     extraction_time_seconds: float = 0.0
     errors: List[str] = field(default_factory=list)
 
+    # Lookup indexes, rebuilt by update_statistics() and excluded from to_dict()
+    _by_type: Dict[FigureType, List[ExtractedFigure]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_year: Dict[int, List[ExtractedFigure]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Calculate statistics after initialization."""
+        self.update_statistics()
+
+    def update_statistics(self):
+        """Recompute counts and lookup indexes from the current figures list.
+
+        Call this after replacing or mutating ``figures``.
+        """
         self.total_figures = len(self.figures)
         self.figures_by_type = {}
+        self._by_type = {}
+        self._by_year = {}
         for figure in self.figures:
-            fig_type = figure.figure_type.value
+            fig_type = figure.figure_type
             self.figures_by_type[fig_type] = self.figures_by_type.get(fig_type, 0) + 1
+            self._by_type.setdefault(fig_type, []).append(figure)
+            if figure.year is not None:
+                self._by_year.setdefault(figure.year, []).append(figure)
 
     def get_figures_by_type(self, figure_type: FigureType) -> List[ExtractedFigure]:
         """Get all figures of a specific type."""
-        return [f for f in self.figures if f.figure_type == figure_type]
+        return list(self._by_type.get(figure_type, ()))
 
     def get_figures_with_year(self, year: int) -> List[ExtractedFigure]:
         """Get all figures associated with a specific year."""
-        return [f for f in self.figures if f.year == year]
+        return list(self._by_year.get(year, ()))
+
+    @staticmethod
+    def figures_from_records(records: List[dict]) -> List[ExtractedFigure]:
+        """Deserialize many figure dicts (as produced by ExtractedFigure.to_dict).
+
+        Equivalent to ``[ExtractedFigure.from_dict(r) for r in records]``,
+        including ignoring unknown keys, but binds the hot lookups once and
+        passes each record's known fields as keyword arguments instead of
+        re-reading every field with ``.get``.
+        """
+        make = ExtractedFigure
+        known = _FIGURE_FIELDS
+        types = _FIGURE_TYPE_BY_VALUE
+        parse_dt = datetime.fromisoformat
+        now = datetime.now
+
+        figures = []
+        append = figures.append
+        for record in records:
+            kwargs = {key: value for key, value in record.items() if key in known}
+            raw_type = kwargs["figure_type"]
+            kwargs["figure_type"] = types.get(raw_type) or FigureType(raw_type)
+            extracted_at = kwargs.get("extracted_at")
+            kwargs["extracted_at"] = parse_dt(extracted_at) if extracted_at else now()
+            append(make(**kwargs))
+        return figures
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FigureExtractionResult":
+        """Create from dictionary (inverse of to_dict)."""
+        return cls(
+            document_path=data["document_path"],
+            figures=cls.figures_from_records(data.get("figures", [])),
+            tables_parsed=data.get("tables_parsed", 0),
+            extraction_time_seconds=data.get("extraction_time_seconds", 0.0),
+            errors=list(data.get("errors", [])),
+        )
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -174,3 +263,33 @@ class FigureExtractionResult:
             "extraction_time_seconds": self.extraction_time_seconds,
             "errors": self.errors,
         }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON, with the same structure as to_dict()."""
+        return _dumps(
+            {
+                "document_path": self.document_path,
+                "figures": self.figures,
+                "total_figures": self.total_figures,
+                "figures_by_type": self.figures_by_type,
+                "tables_parsed": self.tables_parsed,
+                "extraction_time_seconds": self.extraction_time_seconds,
+                "errors": self.errors,
+            }
+        )
+
+
+def _json_default(obj):
+    """Fallback encoder for the stdlib json path."""
+    if isinstance(obj, ExtractedFigure):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj) -> bytes:
+    """Dump to JSON bytes, using orjson when installed.
+
+    orjson serializes dataclasses, enums and datetimes natively, so figures
+    are written without building an intermediate dict per figure.
+    """
+    return fast_json.dumps(obj, default=_json_default)
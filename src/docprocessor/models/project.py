@@ -8,28 +8,360 @@ A Project contains:
 - Metadata (title, description, tags, etc.)
 """
 
-import json
+import atexit
+import copy
+import heapq
+import mmap
+import os
+import threading
 import uuid
-from dataclasses import dataclass, field
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from docprocessor.utils import fast_json
+from docprocessor.utils.logger import get_logger
 
-def convert_uuids_to_strings(obj: Any) -> Any:
-    """Recursively convert UUID objects to strings in nested structures."""
+logger = get_logger(__name__)
+
+# Bound once so the Project.id factory skips the module attribute lookup
+_uuid4 = uuid.uuid4
+
+# C-implemented ISO parser, bound once for the generated from_dict methods
+_from_iso = datetime.fromisoformat
+
+
+def _new_project_id() -> str:
+    """Default factory for Project.id."""
+    return str(_uuid4())
+
+
+# Project files with this suffix are stored as MessagePack instead of JSON
+MSGPACK_SUFFIX = ".msgpack"
+
+
+def _import_msgpack():
+    """Import msgpack, which is only needed for ``.msgpack`` project files."""
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "msgpack is required for .msgpack project files. Install with: pip install msgpack"
+        )
+    return msgpack
+
+
+def _write_project_file(file_path: str, data: Dict[str, Any]):
+    """Encode a ``Project.to_dict()`` snapshot and atomically write it to disk."""
+    if file_path.endswith(MSGPACK_SUFFIX):
+        payload = _import_msgpack().packb(data, use_bin_type=True)
+    else:
+        payload = fast_json.dumps(data, indent=True)
+
+    tmp_path = file_path + ".tmp"
+    try:
+        with open(tmp_path, "wb", buffering=0) as f:
+            # Raw writes may be partial; loop until the buffer is drained
+            view = memoryview(payload)
+            while view:
+                view = view[f.write(view) :]
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Background saves: one writer thread, and at most one queued snapshot per path
+_save_executor: Optional[ThreadPoolExecutor] = None
+_save_lock = threading.Lock()
+_pending_saves: Dict[str, Tuple[Dict[str, Any], "Future[None]"]] = {}
+# Latest queued or running background write per path, for synchronous saves to wait on
+_save_futures: Dict[str, "Future[None]"] = {}
+
+
+def _queue_background_save(file_path: str, data: Dict[str, Any]) -> "Future[None]":
+    """Queue ``data`` for writing on the save thread, coalescing with a queued save."""
+    global _save_executor
+    with _save_lock:
+        pending = _pending_saves.get(file_path)
+        if pending is not None:
+            # Not started yet: the queued job will write this newer snapshot
+            _pending_saves[file_path] = (data, pending[1])
+            return pending[1]
+
+        if _save_executor is None:
+            _save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="project-save")
+        future = _save_executor.submit(_flush_pending_save, file_path)
+        _pending_saves[file_path] = (data, future)
+        _save_futures[file_path] = future
+    future.add_done_callback(lambda done: _forget_save(file_path, done))
+    return future
+
+
+def _flush_pending_save(file_path: str):
+    """Write the latest snapshot queued for ``file_path`` (runs on the save thread)."""
+    with _save_lock:
+        data, _ = _pending_saves.pop(file_path)
+    try:
+        _write_project_file(file_path, data)
+    except Exception as e:
+        # Callers rarely wait on the future, so make the failure visible here too
+        logger.error(f"Background save of {file_path} failed: {e}")
+        raise
+
+
+def _forget_save(file_path: str, future: "Future[None]"):
+    """Drop a finished write from _save_futures unless a newer one replaced it."""
+    with _save_lock:
+        if _save_futures.get(file_path) is future:
+            del _save_futures[file_path]
+
+
+def _wait_for_background_save(file_path: str):
+    """Block until any background write queued for ``file_path`` has finished."""
+    with _save_lock:
+        future = _save_futures.get(file_path)
+    if future is not None:
+        wait_futures([future])
+
+
+@atexit.register
+def _shutdown_save_executor():
+    """Finish queued background saves and stop the save thread."""
+    global _save_executor
+    with _save_lock:
+        executor, _save_executor = _save_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+# Cache entry for a datetime field that is None
+_NO_ISO: Tuple[Optional[datetime], Optional[str]] = (None, None)
+
+
+def _iso_entry(
+    value: Optional[datetime], entry: Tuple[Optional[datetime], Optional[str]]
+) -> Tuple[Optional[datetime], Optional[str]]:
+    """Return a (datetime, isoformat) pair, reusing ``entry`` if the value is unchanged.
+
+    Datetimes are immutable, so an identity check is enough to notice that the
+    field was reassigned since the string was cached.
+    """
+    if entry[0] is value:
+        return entry
+    if value is None:
+        return _NO_ISO
+    return (value, value.isoformat())
+
+
+def _cache_slots(**defaults: Any) -> type:
+    """Build a base class holding private cache attributes as plain slots.
+
+    ``dataclass(slots=True)`` only creates slots for fields, and fields show up
+    in ``asdict()``, ``replace()`` and ``fields()``. Inheriting the cache slots
+    from this base keeps them out of all three. Slots that were never assigned
+    read as the given defaults, which must be immutable as they are shared.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when normal lookup fails, i.e. for unset cache slots
+        try:
+            return defaults[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+    return type("_CacheSlots", (), {"__slots__": tuple(defaults), "__getattr__": __getattr__})
+
+
+# Node kinds for convert_uuids_to_strings, dispatched on the exact type;
+# subclasses fall back to _node_kind's isinstance checks
+_LEAF, _UUID, _DICT, _SEQ, _TUPLE = range(5)
+_NODE_KINDS: Dict[type, int] = {
+    str: _LEAF,
+    int: _LEAF,
+    float: _LEAF,
+    bool: _LEAF,
+    type(None): _LEAF,
+    uuid.UUID: _UUID,
+    dict: _DICT,
+    list: _SEQ,
+    tuple: _TUPLE,
+}
+
+
+def _node_kind(obj: Any) -> int:
+    """Slow-path kind lookup for types missing from _NODE_KINDS."""
     if isinstance(obj, uuid.UUID):
+        return _UUID
+    if isinstance(obj, dict):
+        return _DICT
+    if isinstance(obj, tuple):
+        return _TUPLE
+    if isinstance(obj, list):
+        return _SEQ
+    return _LEAF
+
+
+def _contains_uuid(obj: Any) -> bool:
+    """Return True if a UUID appears anywhere in a nested dict/list/tuple."""
+    kind_of = _NODE_KINDS.get
+    stack = [obj]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        node = pop()
+        kind = kind_of(type(node))
+        if kind is None:
+            kind = _node_kind(node)
+        if kind == _DICT:
+            extend(node.values())
+        elif kind == _SEQ or kind == _TUPLE:
+            extend(node)
+        elif kind == _UUID:
+            return True
+    return False
+
+
+def convert_uuids_to_strings(obj: Any) -> Any:
+    """Convert UUID objects to strings in nested structures.
+
+    Structures without any UUID are returned as-is, without copying. Otherwise
+    the dicts/lists/tuples are rebuilt iteratively (no recursion limit) with
+    each UUID replaced by its string form.
+    """
+    kind_of = _NODE_KINDS.get
+    kind = kind_of(type(obj))
+    if kind is None:
+        kind = _node_kind(obj)
+    if kind == _UUID:
         return str(obj)
-    elif isinstance(obj, dict):
-        return {k: convert_uuids_to_strings(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_uuids_to_strings(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return tuple(convert_uuids_to_strings(item) for item in obj)
-    else:
+    if kind == _LEAF or not _contains_uuid(obj):
         return obj
 
-
+    # Each frame is (source container, its kind, destination holder, key in
+    # holder). Tuples are built as lists and frozen at the end, innermost first.
+    root = [None]
+    stack = [(obj, kind, root, 0)]
+    push = stack.append
+    tuple_frames = []
+    while stack:
+        src, src_kind, holder, key = stack.pop()
+        if src_kind == _DICT:
+            dst = dict.fromkeys(src)  # Keeps key order while children fill in
+            items = src.items()
+        else:
+            dst = [None] * len(src)
+            items = enumerate(src)
+            if src_kind == _TUPLE:
+                tuple_frames.append((holder, key))
+        holder[key] = dst
+
+        for k, value in items:
+            kind = kind_of(type(value))
+            if kind is None:
+                kind = _node_kind(value)
+            if kind == _LEAF:
+                dst[k] = value
+            elif kind == _UUID:
+                dst[k] = str(value)
+            else:
+                push((value, kind, dst, k))
+
+    for holder, key in reversed(tuple_frames):
+        holder[key] = tuple(holder[key])
+    return root[0]
+
+
+def _build_from_dict(
+    cls: type,
+    *,
+    required: Tuple[str, ...] = (),
+    datetime_fields: Tuple[str, ...] = (),
+    optional_datetime_fields: Tuple[str, ...] = (),
+    defaults: Optional[Dict[str, Any]] = None,
+    nested: Optional[Dict[str, Tuple[str, type]]] = None,
+) -> None:
+    """Generate a specialized ``from_dict`` classmethod for a dataclass.
+
+    Like the ``__init__`` that ``dataclasses`` generates, the body is emitted as
+    source with one explicit keyword argument per init field and compiled once,
+    so loading a record costs a single call with no per-field dispatch.
+
+    Per field, the generated argument is:
+    - ``datetime_fields``: ``fromisoformat(d[name])``
+    - ``optional_datetime_fields``: parsed if present and truthy, else ``None``
+      (looked up once via an assignment expression)
+    - ``nested``: ``{name: (kind, model)}`` where kind is ``"list"`` (list of
+      records), ``"optional"`` (record or ``None``) or ``"object"`` (record,
+      ``{}`` if absent), each loaded with ``model.from_dict``
+    - ``required`` or fields without a default: ``d[name]``
+    - otherwise ``d.get(name, default)``; ``defaults`` overrides the dataclass
+      default, and callables (like dataclass default factories) are called
+      for a fresh value
+    """
+    defaults = defaults or {}
+    nested = nested or {}
+    namespace: Dict[str, Any] = {"_from_iso": _from_iso}
+    args = []
+
+    for f in fields(cls):
+        if not f.init:
+            continue
+        name = f.name
+        key = repr(name)
+        if name in datetime_fields:
+            expr = f"_from_iso(d[{key}])"
+        elif name in optional_datetime_fields:
+            expr = f"(_from_iso(_v) if (_v := d.get({key})) else None)"
+        elif name in nested:
+            kind, model = nested[name]
+            namespace[f"_model_{name}"] = model
+            if kind == "list":
+                expr = f"[_model_{name}.from_dict(x) for x in d.get({key}, ())]"
+            elif kind == "optional":
+                expr = f"_model_{name}.from_dict(d[{key}]) if d.get({key}) else None"
+            else:
+                expr = f"_model_{name}.from_dict(d.get({key}, {{}}))"
+        else:
+            if name in defaults:
+                default = defaults[name]
+            elif f.default is not MISSING:
+                default = f.default
+            elif f.default_factory is not MISSING:
+                default = f.default_factory
+            else:
+                default = MISSING
+
+            if default is MISSING or name in required:
+                expr = f"d[{key}]"
+            elif callable(default):
+                namespace[f"_factory_{name}"] = default
+                expr = f"d[{key}] if {key} in d else _factory_{name}()"
+            else:
+                namespace[f"_default_{name}"] = default
+                expr = f"d.get({key}, _default_{name})"
+        args.append(f"        {name}={expr},")
+
+    source = "\n".join(["def from_dict(cls, d):", "    return cls(", *args, "    )"])
+    exec(source, namespace)
+    from_dict = namespace["from_dict"]
+    from_dict.__qualname__ = f"{cls.__qualname__}.from_dict"
+    from_dict.__doc__ = "Create from dictionary."
+    cls.from_dict = classmethod(from_dict)
+
+
+# Unlike the record classes below this one is not slotted: there is a single
+# instance per project and callers may attach ad-hoc settings attributes
 @dataclass
 class ProjectSettings:
     """Project-specific settings."""
@@ -71,26 +403,13 @@ class ProjectSettings:
             "citation_style": self.citation_style,
         }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ProjectSettings":
-        """Create settings from dictionary."""
-        return cls(
-            language=data.get("language", "fr"),
-            llm_model=data.get("llm_model", "llama3.1:latest"),
-            embedding_model=data.get("embedding_model", "all-MiniLM-L6-v2"),
-            temperature=data.get("temperature", 0.7),
-            max_tokens=data.get("max_tokens"),
-            vector_db_collection=data.get("vector_db_collection"),
-            chunk_size=data.get("chunk_size", 1000),
-            chunk_overlap=data.get("chunk_overlap", 100),
-            default_output_format=data.get("default_output_format", "docx"),
-            include_citations=data.get("include_citations", True),
-            citation_style=data.get("citation_style", "APA"),
-        )
 
+# Defaults come from the field declarations above, so they live in one place
+_build_from_dict(ProjectSettings)
 
-@dataclass
-class DocumentInfo:
+
+@dataclass(slots=True)
+class DocumentInfo(_cache_slots(_processing_date_iso=_NO_ISO, _added_at_iso=_NO_ISO)):
     """Information about a document in the project."""
 
     id: str  # Unique document ID
@@ -115,8 +434,12 @@ class DocumentInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
+        self._processing_date_iso = processing_date = _iso_entry(
+            self.processing_date, self._processing_date_iso
+        )
+        self._added_at_iso = added_at = _iso_entry(self.added_at, self._added_at_iso)
         return {
-            "id": str(self.id),  # Ensure UUID objects are converted to strings
+            "id": self.id,
             "file_path": self.file_path,
             "title": self.title,
             "file_size": self.file_size,
@@ -126,37 +449,21 @@ class DocumentInfo:
             "tags": self.tags,
             "custom_metadata": self.custom_metadata,
             "processed": self.processed,
-            "processing_date": self.processing_date.isoformat() if self.processing_date else None,
+            "processing_date": processing_date[1],
             "num_chunks": self.num_chunks,
-            "added_at": self.added_at.isoformat(),
+            "added_at": added_at[1],
         }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "DocumentInfo":
-        """Create from dictionary."""
-        return cls(
-            id=data["id"],
-            file_path=data["file_path"],
-            title=data["title"],
-            file_size=data["file_size"],
-            author=data.get("author"),
-            publication_date=data.get("publication_date"),
-            source_url=data.get("source_url"),
-            tags=data.get("tags", []),
-            custom_metadata=data.get("custom_metadata", {}),
-            processed=data.get("processed", False),
-            processing_date=(
-                datetime.fromisoformat(data["processing_date"])
-                if data.get("processing_date")
-                else None
-            ),
-            num_chunks=data.get("num_chunks", 0),
-            added_at=datetime.fromisoformat(data["added_at"]),
-        )
 
+_build_from_dict(
+    DocumentInfo,
+    datetime_fields=("added_at",),
+    optional_datetime_fields=("processing_date",),
+)
 
-@dataclass
-class SearchResult:
+
+@dataclass(slots=True)
+class SearchResult(_cache_slots(_publication_date_iso=_NO_ISO, _found_at_iso=_NO_ISO)):
     """Result from a search query (for search & import feature)."""
 
     title: str  # Document/page title
@@ -176,44 +483,33 @@ class SearchResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
+        self._publication_date_iso = publication_date = _iso_entry(
+            self.publication_date, self._publication_date_iso
+        )
+        self._found_at_iso = found_at = _iso_entry(self.found_at, self._found_at_iso)
         return {
             "title": self.title,
             "url": self.url,
             "snippet": self.snippet,
             "source_name": self.source_name,
             "file_type": self.file_type,
-            "publication_date": (
-                self.publication_date.isoformat() if self.publication_date else None
-            ),
+            "publication_date": publication_date[1],
             "relevance_score": self.relevance_score,
             "metadata": self.metadata,
             "search_query": self.search_query,
-            "found_at": self.found_at.isoformat(),
+            "found_at": found_at[1],
         }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SearchResult":
-        """Create from dictionary."""
-        return cls(
-            title=data["title"],
-            url=data["url"],
-            snippet=data["snippet"],
-            source_name=data["source_name"],
-            file_type=data["file_type"],
-            publication_date=(
-                datetime.fromisoformat(data["publication_date"])
-                if data.get("publication_date")
-                else None
-            ),
-            relevance_score=data.get("relevance_score", 0.0),
-            metadata=data.get("metadata", {}),
-            search_query=data.get("search_query"),
-            found_at=datetime.fromisoformat(data["found_at"]),
-        )
 
+_build_from_dict(
+    SearchResult,
+    datetime_fields=("found_at",),
+    optional_datetime_fields=("publication_date",),
+)
 
-@dataclass
-class TaskExecutionRecord:
+
+@dataclass(slots=True)
+class TaskExecutionRecord(_cache_slots(_executed_at_iso=_NO_ISO)):
     """Record of a task execution in this project."""
 
     task_name: str  # Name of the task
@@ -233,10 +529,11 @@ class TaskExecutionRecord:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
+        self._executed_at_iso = executed_at = _iso_entry(self.executed_at, self._executed_at_iso)
         return {
             "task_name": self.task_name,
             "task_display_name": self.task_display_name,
-            "executed_at": self.executed_at.isoformat(),
+            "executed_at": executed_at[1],
             "status": self.status,
             "duration_seconds": self.duration_seconds,
             "input_document_ids": self.input_document_ids,
@@ -246,24 +543,11 @@ class TaskExecutionRecord:
             "error_message": self.error_message,
         }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "TaskExecutionRecord":
-        """Create from dictionary."""
-        return cls(
-            task_name=data["task_name"],
-            task_display_name=data["task_display_name"],
-            executed_at=datetime.fromisoformat(data["executed_at"]),
-            status=data["status"],
-            duration_seconds=data["duration_seconds"],
-            input_document_ids=data["input_document_ids"],
-            output_files=data["output_files"],
-            output_data=data["output_data"],
-            config_used=data["config_used"],
-            error_message=data.get("error_message"),
-        )
 
+_build_from_dict(TaskExecutionRecord, datetime_fields=("executed_at",))
 
-@dataclass
+
+@dataclass(slots=True)
 class SynthesisCache:
     """Cached synthesis results to avoid regeneration."""
 
@@ -292,22 +576,33 @@ class SynthesisCache:
             "config_used": self.config_used,
         }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SynthesisCache":
-        """Create from dictionary."""
-        return cls(
-            chapters=data["chapters"],
-            generated_at=datetime.fromisoformat(data["generated_at"]),
-            synthesis_level=data["synthesis_level"],
-            theme_ids=data.get("theme_ids", []),
-            total_words=data.get("total_words", 0),
-            total_citations=data.get("total_citations", 0),
-            config_used=data.get("config_used", {}),
-        )
-
 
-@dataclass
-class Project:
+_build_from_dict(
+    SynthesisCache,
+    datetime_fields=("generated_at",),
+    defaults={"theme_ids": list, "total_words": 0, "total_citations": 0, "config_used": dict},
+)
+
+
+@dataclass(slots=True)
+class Project(
+    _cache_slots(
+        _created_at_iso=_NO_ISO,
+        _updated_at_iso=_NO_ISO,
+        _last_opened_at_iso=_NO_ISO,
+        # Document lookup indexes, rebuilt lazily whenever ``documents`` is
+        # reassigned or resized outside add_document/remove_document
+        _docs_by_id=None,
+        _docs_by_path=None,
+        _indexed_documents=None,
+        _indexed_count=0,
+        # Whether two documents share an id or path (removal must then rescan)
+        _has_duplicate_keys=False,
+        # Memoized get_statistics() counters and the state they were computed from
+        _stats_cache=None,
+        _stats_key=None,
+    )
+):
     """A document processing project.
 
     A project encapsulates:
@@ -319,7 +614,7 @@ class Project:
     """
 
     # Identification
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_project_id)
     name: str = "Untitled Project"
     description: str = ""
 
@@ -357,38 +652,73 @@ class Project:
     def update_timestamp(self):
         """Update the last modified timestamp."""
         self.updated_at = datetime.now()
+        self._stats_cache = None
 
     def mark_opened(self):
         """Mark project as opened (for recent projects)."""
         self.last_opened_at = datetime.now()
 
+    def _reindex_documents(self):
+        """Rebuild the id/path lookup indexes from ``documents``."""
+        by_id: Dict[str, DocumentInfo] = {}
+        by_path: Dict[str, DocumentInfo] = {}
+        for doc in self.documents:
+            # setdefault keeps the first match, like the original linear scans
+            by_id.setdefault(doc.id, doc)
+            by_path.setdefault(doc.file_path, doc)
+        self._docs_by_id = by_id
+        self._docs_by_path = by_path
+        self._indexed_documents = self.documents
+        self._indexed_count = count = len(self.documents)
+        self._has_duplicate_keys = len(by_id) != count or len(by_path) != count
+
+    def _document_indexes(self) -> Tuple[Dict[str, DocumentInfo], Dict[str, DocumentInfo]]:
+        """Return the lookup indexes, rebuilding them if ``documents`` changed."""
+        documents = self.documents
+        if self._indexed_documents is not documents or self._indexed_count != len(documents):
+            self._reindex_documents()
+        return self._docs_by_id, self._docs_by_path
+
     def add_document(self, doc_info: DocumentInfo):
         """Add a document to the project."""
+        by_id, by_path = self._document_indexes()
         self.documents.append(doc_info)
+        if (
+            by_id.setdefault(doc_info.id, doc_info) is not doc_info
+            or by_path.setdefault(doc_info.file_path, doc_info) is not doc_info
+        ):
+            self._has_duplicate_keys = True
+        self._indexed_count += 1
         self.update_timestamp()
 
     def remove_document(self, doc_id: str) -> bool:
         """Remove a document by ID. Returns True if found and removed."""
-        for i, doc in enumerate(self.documents):
-            if doc.id == doc_id:
-                self.documents.pop(i)
-                self.update_timestamp()
-                return True
-        return False
+        by_id, by_path = self._document_indexes()
+        doc = by_id.get(doc_id)
+        if doc is None:
+            return False
+        # Locate by identity; list.remove would call the dataclass __eq__ on every miss
+        for i, candidate in enumerate(self.documents):
+            if candidate is doc:
+                del self.documents[i]
+                break
+        if self._has_duplicate_keys:
+            # Another document may share the removed id or path, so rescan
+            self._reindex_documents()
+        else:
+            del by_id[doc.id]
+            del by_path[doc.file_path]
+            self._indexed_count -= 1
+        self.update_timestamp()
+        return True
 
     def get_document(self, doc_id: str) -> Optional[DocumentInfo]:
         """Get document by ID."""
-        for doc in self.documents:
-            if doc.id == doc_id:
-                return doc
-        return None
+        return self._document_indexes()[0].get(doc_id)
 
     def get_document_by_path(self, file_path: str) -> Optional[DocumentInfo]:
         """Get document by file path."""
-        for doc in self.documents:
-            if doc.file_path == file_path:
-                return doc
-        return None
+        return self._document_indexes()[1].get(file_path)
 
     def get_processed_documents(self) -> List[DocumentInfo]:
         """Get list of processed documents."""
@@ -410,9 +740,8 @@ class Project:
         return self.task_history
 
     def get_recent_tasks(self, limit: int = 10) -> List[TaskExecutionRecord]:
-        """Get recent task executions."""
-        sorted_tasks = sorted(self.task_history, key=lambda r: r.executed_at, reverse=True)
-        return sorted_tasks[:limit]
+        """Get recent task executions, newest first."""
+        return heapq.nlargest(limit, self.task_history, key=attrgetter("executed_at"))
 
     def set_themes(self, themes: List[Dict[str, Any]]):
         """Set themes for this project."""
@@ -424,24 +753,53 @@ class Project:
         self.themes = []
         self.update_timestamp()
 
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get project statistics."""
-        total_docs = len(self.documents)
-        processed_docs = len(self.get_processed_documents())
-        total_size = sum(doc.file_size for doc in self.documents)
+    def _statistics_key(self) -> Tuple:
+        """Return a cheap fingerprint of the state get_statistics depends on."""
+        documents, tasks, themes = self.documents, self.task_history, self.themes
+        return (
+            self.updated_at,
+            id(documents),
+            len(documents),
+            id(tasks),
+            len(tasks),
+            id(themes),
+            len(themes),
+        )
 
-        task_counts = {}
-        for record in self.task_history:
-            task_counts[record.task_name] = task_counts.get(record.task_name, 0) + 1
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get project statistics.
+
+        The counters are computed in a single pass and memoized until the next
+        ``update_timestamp`` (or a direct change to the document, task or theme
+        lists); ``age_days`` is always computed fresh.
+        """
+        key = self._statistics_key()
+        stats = self._stats_cache
+        if stats is None or self._stats_key != key:
+            total_docs = 0
+            processed_docs = 0
+            total_size = 0
+            for doc in self.documents:
+                total_docs += 1
+                total_size += doc.file_size
+                if doc.processed:
+                    processed_docs += 1
+
+            stats = {
+                "total_documents": total_docs,
+                "processed_documents": processed_docs,
+                "unprocessed_documents": total_docs - processed_docs,
+                "total_size_bytes": total_size,
+                "total_themes": len(self.themes),
+                "total_tasks_executed": len(self.task_history),
+                "task_counts": dict(Counter(record.task_name for record in self.task_history)),
+            }
+            self._stats_cache = stats
+            self._stats_key = key
 
         return {
-            "total_documents": total_docs,
-            "processed_documents": processed_docs,
-            "unprocessed_documents": total_docs - processed_docs,
-            "total_size_bytes": total_size,
-            "total_themes": len(self.themes),
-            "total_tasks_executed": len(self.task_history),
-            "task_counts": task_counts,
+            **stats,
+            "task_counts": dict(stats["task_counts"]),
             "age_days": (datetime.now() - self.created_at).days,
         }
 
@@ -449,13 +807,18 @@ class Project:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert project to dictionary for JSON serialization."""
+        self._created_at_iso = created_at = _iso_entry(self.created_at, self._created_at_iso)
+        self._updated_at_iso = updated_at = _iso_entry(self.updated_at, self._updated_at_iso)
+        self._last_opened_at_iso = last_opened_at = _iso_entry(
+            self.last_opened_at, self._last_opened_at_iso
+        )
         return {
-            "id": str(self.id),  # Ensure UUID objects are converted to strings
+            "id": self.id,
             "name": self.name,
             "description": self.description,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "last_opened_at": self.last_opened_at.isoformat() if self.last_opened_at else None,
+            "created_at": created_at[1],
+            "updated_at": updated_at[1],
+            "last_opened_at": last_opened_at[1],
             "documents": [doc.to_dict() for doc in self.documents],
             "task_history": [record.to_dict() for record in self.task_history],
             "themes": convert_uuids_to_strings(self.themes),  # Convert any UUID objects in themes
@@ -470,49 +833,64 @@ class Project:
             "custom_fields": self.custom_fields,
         }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Project":
-        """Create project from dictionary."""
-        project = cls(
-            id=data["id"],
-            name=data["name"],
-            description=data.get("description", ""),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-            last_opened_at=(
-                datetime.fromisoformat(data["last_opened_at"])
-                if data.get("last_opened_at")
-                else None
-            ),
-            documents=[DocumentInfo.from_dict(d) for d in data.get("documents", [])],
-            task_history=[TaskExecutionRecord.from_dict(r) for r in data.get("task_history", [])],
-            themes=data.get("themes", []),
-            synthesis_cache=(
-                SynthesisCache.from_dict(data["synthesis_cache"])
-                if data.get("synthesis_cache")
-                else None
-            ),
-            settings=ProjectSettings.from_dict(data.get("settings", {})),
-            tags=data.get("tags", []),
-            is_archived=data.get("is_archived", False),
-            is_favorite=data.get("is_favorite", False),
-            color=data.get("color"),
-            author=data.get("author", ""),
-            notes=data.get("notes", ""),
-            custom_fields=data.get("custom_fields", {}),
-        )
-        return project
-
-    def save_to_file(self, file_path: Path):
-        """Save project to JSON file."""
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+    def save_to_file(self, file_path: Path, background: bool = False) -> Optional["Future[None]"]:
+        """Save project to a JSON or MessagePack file.
+
+        Files ending in ``.msgpack`` are written as MessagePack (requires the
+        ``msgpack`` package), which is smaller and faster to load; anything else
+        is indented UTF-8 JSON, encoded with orjson when installed (the stdlib
+        encoder is the bottleneck for large themes and synthesis caches).
+
+        The encoded bytes are written unbuffered to a temporary file next to
+        the target, which then replaces it, so a crash mid-save never leaves a
+        truncated project file.
+
+        With ``background=True`` a deep copy of ``to_dict()`` is taken on the
+        calling thread, so the project can keep being edited while the encode
+        and write run on a single save thread. Saves to a path that is still
+        queued are coalesced, so only the latest snapshot is written. A
+        synchronous save waits for any background save to the same path, so
+        writes land in call order. Failed background writes are logged and
+        re-raised from the future; queued writes are finished at exit.
+
+        Returns:
+            None for a synchronous save, otherwise a Future for the write
+
+        Raises:
+            ImportError: If a ``.msgpack`` path is given and msgpack is not installed
+        """
+        data = self.to_dict()
+        file_path = os.fspath(file_path)
+        if background:
+            # Nested containers (themes, tags, custom fields) are shared with
+            # the project, so copy them before handing off to the save thread
+            return _queue_background_save(file_path, copy.deepcopy(data))
+        _wait_for_background_save(file_path)
+        _write_project_file(file_path, data)
+        return None
 
     @classmethod
     def load_from_file(cls, file_path: Path) -> "Project":
-        """Load project from JSON file."""
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        """Load project from a JSON or MessagePack file.
+
+        The format is chosen by suffix, as in ``save_to_file``. With orjson
+        installed, JSON files are memory-mapped and parsed in place, so the raw
+        bytes are never copied into a separate buffer.
+        """
+        with open(file_path, "rb") as f:
+            if os.fspath(file_path).endswith(MSGPACK_SUFFIX):
+                data = _import_msgpack().unpackb(f.read(), raw=False, strict_map_key=False)
+                return cls.from_dict(data)
+
+            if not fast_json.has_orjson():
+                data = fast_json.loads(f.read())
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        data = fast_json.loads(view)
+                    finally:
+                        view.release()
         return cls.from_dict(data)
 
     def __str__(self) -> str:
@@ -524,3 +902,17 @@ class Project:
             f"{stats['total_themes']} themes, "
             f"{stats['total_tasks_executed']} tasks executed)"
         )
+
+
+_build_from_dict(
+    Project,
+    required=("id", "name"),
+    datetime_fields=("created_at", "updated_at"),
+    optional_datetime_fields=("last_opened_at",),
+    nested={
+        "documents": ("list", DocumentInfo),
+        "task_history": ("list", TaskExecutionRecord),
+        "synthesis_cache": ("optional", SynthesisCache),
+        "settings": ("object", ProjectSettings),
+    },
+)
@@ -7,7 +7,12 @@ from pydantic import BaseModel, Field
 
 
 class Theme(BaseModel):
-    """Represents a discovered theme from document analysis."""
+    """Represents a discovered theme from document analysis.
+
+    Callers building themes from already-validated data (e.g. chunk UUIDs
+    parsed by the analyzer) can use ``Theme.model_construct(...)`` to skip
+    validation.
+    """
 
     id: UUID = Field(default_factory=uuid4, description="Unique theme identifier")
     label: str = Field(..., description="Human-readable theme label")
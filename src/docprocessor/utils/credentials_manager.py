@@ -6,6 +6,7 @@ This module provides a singleton CredentialsManager class that uses the system k
 and retrieve API credentials.
 """
 
+import time
 from typing import Optional
 import keyring
 from keyring.errors import KeyringError
@@ -29,6 +30,8 @@ class CredentialsManager:
     SERVICE_NAME = "DocProcessor-SearchImport"
     KEY_GOOGLE_API = "google_api_key"
     KEY_GOOGLE_ENGINE = "google_search_engine_id"
+    # Seconds a successful keyring lookup is reused before asking the backend again
+    CACHE_TTL_SECONDS = 60.0
 
     def __new__(cls):
         """Singleton pattern - only one instance throughout app lifetime."""
@@ -42,6 +45,15 @@ class CredentialsManager:
         if self._initialized:
             return
         self._initialized = True
+        self._cache: Optional[tuple[str, str]] = None
+        self._cache_ts = 0.0
+
+        # Resolve the backend once; keyring.get_keyring() does backend discovery
+        try:
+            self._keyring = keyring.get_keyring()
+        except Exception as e:
+            logger.warning(f"Keyring unavailable: {e}")
+            self._keyring = None
         logger.debug("CredentialsManager initialized")
 
     def is_keyring_available(self) -> bool:
@@ -51,13 +63,7 @@ class CredentialsManager:
         Returns:
             bool: True if keyring is available, False otherwise
         """
-        try:
-            # Test keyring by trying to access it
-            keyring.get_keyring()
-            return True
-        except Exception as e:
-            logger.warning(f"Keyring unavailable: {e}")
-            return False
+        return self._keyring is not None
 
     def save_google_credentials(self, api_key: str, engine_id: str) -> bool:
         """
@@ -70,9 +76,14 @@ class CredentialsManager:
         Returns:
             bool: True if saved successfully, False if keyring unavailable
         """
+        self._cache = None
+        if self._keyring is None:
+            logger.error("Failed to save credentials: keyring unavailable")
+            return False
         try:
-            keyring.set_password(self.SERVICE_NAME, self.KEY_GOOGLE_API, api_key)
-            keyring.set_password(self.SERVICE_NAME, self.KEY_GOOGLE_ENGINE, engine_id)
+            set_password = self._keyring.set_password
+            set_password(self.SERVICE_NAME, self.KEY_GOOGLE_API, api_key)
+            set_password(self.SERVICE_NAME, self.KEY_GOOGLE_ENGINE, engine_id)
             logger.info("Saved Google API credentials to keyring")
             return True
         except KeyringError as e:
@@ -86,16 +97,28 @@ class CredentialsManager:
         """
         Load Google Custom Search credentials from OS keyring.
 
+        Found credentials are cached in-process for ``CACHE_TTL_SECONDS`` so
+        repeat lookups skip the keyring round trip.
+
         Returns:
             Optional[tuple[str, str]]: (api_key, engine_id) if found, None otherwise
         """
+        cached = self._cache
+        if cached is not None and time.monotonic() - self._cache_ts < self.CACHE_TTL_SECONDS:
+            return cached
+        if self._keyring is None:
+            return None
+
         try:
-            api_key = keyring.get_password(self.SERVICE_NAME, self.KEY_GOOGLE_API)
-            engine_id = keyring.get_password(self.SERVICE_NAME, self.KEY_GOOGLE_ENGINE)
+            get_password = self._keyring.get_password
+            api_key = get_password(self.SERVICE_NAME, self.KEY_GOOGLE_API)
+            engine_id = get_password(self.SERVICE_NAME, self.KEY_GOOGLE_ENGINE)
 
             if api_key and engine_id:
                 logger.debug("Loaded Google API credentials from keyring")
-                return (api_key, engine_id)
+                self._cache = (api_key, engine_id)
+                self._cache_ts = time.monotonic()
+                return self._cache
             else:
                 logger.debug("No saved credentials found in keyring")
                 return None
@@ -113,15 +136,20 @@ class CredentialsManager:
         Returns:
             bool: True if cleared successfully, False if keyring unavailable
         """
+        self._cache = None
+        if self._keyring is None:
+            logger.error("Failed to clear credentials: keyring unavailable")
+            return False
         try:
+            delete_password = self._keyring.delete_password
             try:
-                keyring.delete_password(self.SERVICE_NAME, self.KEY_GOOGLE_API)
+                delete_password(self.SERVICE_NAME, self.KEY_GOOGLE_API)
             except keyring.errors.PasswordDeleteError:
                 # Key doesn't exist, that's fine
                 pass
 
             try:
-                keyring.delete_password(self.SERVICE_NAME, self.KEY_GOOGLE_ENGINE)
+                delete_password(self.SERVICE_NAME, self.KEY_GOOGLE_ENGINE)
             except keyring.errors.PasswordDeleteError:
                 # Key doesn't exist, that's fine
                 pass
@@ -0,0 +1,47 @@
+"""JSON encoding helpers that use orjson when it is installed.
+
+orjson is an optional dependency; the import is resolved once here so callers
+do not retry it on every dump. Without it the stdlib ``json`` module is used,
+producing equivalent UTF-8 output.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def has_orjson() -> bool:
+    """Whether orjson is available (it can parse ``bytes`` and ``memoryview`` directly)."""
+    return orjson is not None
+
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable] = None) -> bytes:
+    """Dump ``obj`` to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize. Non-string dict keys (e.g. str enums) are allowed.
+        indent: Indent nested structures by two spaces
+        default: Fallback for objects neither encoder handles natively; orjson
+            also serializes dataclasses, enums and datetimes itself
+
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is None:
+        text = json.dumps(obj, indent=2 if indent else None, default=default, ensure_ascii=False)
+        return text.encode("utf-8")
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=default, option=option)
+
+
+def loads(raw) -> Any:
+    """Parse JSON from ``bytes`` or ``str`` (or a ``memoryview`` when orjson is available)."""
+    if orjson is None:
+        return json.loads(raw)
+    return orjson.loads(raw)
@@ -1,5 +1,20 @@
 """Language detection utility."""
 
+import heapq
+from collections import Counter
+from functools import lru_cache
+
+# Minimum number of words needed to attempt detection
+MIN_WORDS = 10
+
+# Only this many leading characters are analysed; a few hundred words are
+# plenty for marker counting and keeps detection cost independent of input size
+SAMPLE_CHARS = 2048
+
+# detect_from_chunks stops reading chunks once the leading language is this
+# many marker hits ahead of the runner-up
+EARLY_EXIT_MARGIN = 10
+
 
 class LanguageDetector:
     """Detect language from text samples."""
@@ -61,34 +76,39 @@ class LanguageDetector:
         },
     }
 
+    # Marker words per language as frozensets, built once from LANGUAGE_MARKERS
+    MARKER_WORDS = {lang: frozenset(m["words"]) for lang, m in LANGUAGE_MARKERS.items()}
+
     @classmethod
     def detect_language(cls, text: str) -> str:
         """
         Detect language from text sample.
 
+        Only the first SAMPLE_CHARS characters of the text are analysed.
+
         Args:
             text: Text to analyze
 
         Returns:
             Language code ('french', 'english', etc.)
         """
-        if not text:
+        # Fewer characters than MIN_WORDS one-letter words can't pass the word check
+        if not text or len(text) < 2 * MIN_WORDS - 1:
             return "english"  # Default fallback
 
-        # Normalize text
-        text_lower = text.lower()
-        words = text_lower.split()
-
-        if len(words) < 10:
-            return "english"  # Too short, use default
-
-        # Count language markers
-        scores = {}
-        for lang, markers in cls.LANGUAGE_MARKERS.items():
-            score = sum(1 for word in words if word in markers["words"])
-            scores[lang] = score
+        return _detect_sample(text[:SAMPLE_CHARS])
 
-        # Return language with highest score
+    @classmethod
+    def _score_words(cls, words: list, scores: dict) -> None:
+        """Add each language's marker-word hits in ``words`` to ``scores``."""
+        # Count every word once (C-level), then look up only the marker words
+        get_count = Counter(words).get
+        for lang, marker_words in cls.MARKER_WORDS.items():
+            scores[lang] += sum(get_count(word, 0) for word in marker_words)
+
+    @staticmethod
+    def _pick_language(scores: dict) -> str:
+        """Return the top-scoring language, or English below 3 marker hits."""
         if scores:
             detected = max(scores, key=scores.get)
             # Only return if we have reasonable confidence (at least 3 matches)
@@ -115,6 +135,9 @@ class LanguageDetector:
         """
         Detect language from chunk samples.
 
+        Chunks are scored one at a time; once a language leads the runner-up by
+        EARLY_EXIT_MARGIN marker hits, the remaining chunks are not read.
+
         Args:
             chunks: List of chunks with 'text' field
             sample_size: Number of chunks to sample
@@ -125,8 +148,44 @@ class LanguageDetector:
         if not chunks:
             return "english"
 
-        # Sample first few chunks
-        sample_chunks = chunks[: min(sample_size, len(chunks))]
-        combined_text = " ".join(chunk.get("text", "") for chunk in sample_chunks)
+        # Score chunk by chunk over the same leading SAMPLE_CHARS that joining
+        # the sampled chunks would give, stopping early once one language
+        # leads clearly
+        scores = dict.fromkeys(cls.MARKER_WORDS, 0)
+        total_words = 0
+        remaining = SAMPLE_CHARS
+        for chunk in chunks[:sample_size]:
+            text = chunk.get("text", "")
+            words = text[:remaining].lower().split()
+            total_words += len(words)
+            cls._score_words(words, scores)
+
+            if total_words >= MIN_WORDS:
+                top, runner_up = heapq.nlargest(2, scores.values())
+                if top - runner_up >= EARLY_EXIT_MARGIN:
+                    break
+
+            remaining -= len(text) + 1  # +1 for the joining space
+            if remaining <= 0:
+                break
+
+        if total_words < MIN_WORDS:
+            return "english"  # Too short, use default
+        return cls._pick_language(scores)
+
+
+@lru_cache(maxsize=256)
+def _detect_sample(sample: str) -> str:
+    """Detect the language of a leading text sample, cached per sample.
+
+    Keyed on the at most SAMPLE_CHARS long sample rather than the full text, so
+    cached entries stay small while repeated texts skip the word scan.
+    """
+    words = sample.lower().split()
+
+    if len(words) < MIN_WORDS:
+        return "english"  # Too short, use default
 
-        return cls.detect_language(combined_text)
+    scores = dict.fromkeys(LanguageDetector.MARKER_WORDS, 0)
+    LanguageDetector._score_words(words, scores)
+    return LanguageDetector._pick_language(scores)
@@ -2,15 +2,126 @@
 
 import logging
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes instead of flushing every record.
+
+    Records below WARNING are collected in a large write buffer that is flushed
+    at most FLUSH_INTERVAL seconds later; WARNING and above are flushed
+    immediately. Remaining output is flushed when the handler is closed, which
+    ``logging.shutdown`` does at interpreter exit.
+    """
+
+    BUFFER_SIZE = 64 * 1024
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, filename, mode: str = "a", encoding: Optional[str] = "utf-8"):
+        self._flush_timer: Optional[threading.Timer] = None
+        super().__init__(filename, mode=mode, encoding=encoding)
+
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord):
+        """Write a record, deferring the flush for records below WARNING."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            elif self._flush_timer is None:
+                timer = threading.Timer(self.FLUSH_INTERVAL, self._timed_flush)
+                timer.daemon = True
+                self._flush_timer = timer
+                timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _timed_flush(self):
+        """Flush buffered records once the flush interval has elapsed."""
+        self.acquire()
+        try:
+            self._flush_timer = None
+            self.flush()
+        finally:
+            self.release()
+
+    def close(self):
+        """Cancel any pending timed flush, then flush and close the file."""
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        finally:
+            self.release()
+        super().close()
+
+
+# Formatters are stateless, so every configured logger shares these
+_CONSOLE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+# Same as _FILE_FORMATTER without the caller fields, for setup_logger(fast=True)
+_FAST_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+_rich_handler_cls = None
+_rich_probed = False
+
+
+def _get_rich_handler_cls():
+    """Return rich's RichHandler class, or None if rich is not installed.
+
+    The import (which pulls in pygments) is attempted only once per process.
+    """
+    global _rich_handler_cls, _rich_probed
+    if not _rich_probed:
+        try:
+            from rich.logging import RichHandler
+        except ImportError:
+            RichHandler = None
+        _rich_handler_cls = RichHandler
+        _rich_probed = True
+    return _rich_handler_cls
+
+
+def _disable_expensive_record_fields():
+    """Stop logging from collecting caller, thread and process info per record."""
+    # With _srcfile unset, Logger.findCaller (a sys._getframe walk) is skipped
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+
 def setup_logger(
     name: str = "docprocessor",
     level: int = logging.INFO,
     log_file: Optional[Path] = None,
     rich_formatting: bool = True,
+    fast: bool = False,
 ) -> logging.Logger:
     """
     Configure and return a logger instance.
@@ -20,63 +131,74 @@ def setup_logger(
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path for logging output
         rich_formatting: Use Rich for colorful console output
+        fast: Skip caller lookup (a stack walk per record) and thread/process
+            info. Log lines lose their function name, line number and source
+            path. This switches off those record fields process-wide.
 
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
+
+    is_frozen = getattr(sys, 'frozen', False)
+
+    # Repeat calls with the same configuration keep the existing handlers
+    # instead of reopening log files and rebuilding the Rich console
+    fingerprint = (
+        name,
+        level,
+        str(log_file) if log_file else None,
+        rich_formatting,
+        fast,
+        is_frozen,
+    )
+    if logger.handlers and getattr(logger, "_dp_fingerprint", None) == fingerprint:
+        return logger
+
+    if fast:
+        _disable_expensive_record_fields()
     logger.setLevel(level)
 
     logger.handlers.clear()
 
     # Disable Rich formatting in PyInstaller builds (causes issues)
-    is_frozen = getattr(sys, 'frozen', False)
     if is_frozen:
         rich_formatting = False
 
-    if rich_formatting:
-        try:
-            from rich.logging import RichHandler
-        except ImportError:
-            rich_formatting = False
-
-    if rich_formatting:
+    rich_handler_cls = _get_rich_handler_cls() if rich_formatting else None
+    if rich_handler_cls is not None:
         try:
-            console_handler = RichHandler(
+            console_handler = rich_handler_cls(
                 rich_tracebacks=True,
                 markup=True,
                 show_time=True,
                 show_level=True,
-                show_path=True,
+                show_path=not fast,
             )
             console_handler.setLevel(level)
-            logger.addHandler(console_handler)
         except Exception:
             # Fall back to basic logging if Rich fails
             rich_formatting = False
+        else:
+            logger.addHandler(console_handler)
+    else:
+        rich_formatting = False
 
     if not rich_formatting:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
-        console_format = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        console_handler.setFormatter(console_format)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
         logger.addHandler(console_handler)
 
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = BufferedFileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(level)
-        file_format = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        file_handler.setFormatter(file_format)
+        file_handler.setFormatter(_FAST_FILE_FORMATTER if fast else _FILE_FORMATTER)
         logger.addHandler(file_handler)
 
     logger.propagate = False
+    logger._dp_fingerprint = fingerprint
 
     return logger
 
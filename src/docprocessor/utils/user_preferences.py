@@ -4,7 +4,13 @@ This module handles loading, saving, and managing user preferences including
 theme, size profile, and other application-wide settings.
 """
 
-import json
+import atexit
+import functools
+import hashlib
+import os
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -12,12 +18,59 @@ from typing import List, Optional
 
 from docprocessor.gui.size_profile import SizeProfileType
 from docprocessor.gui.theme_manager import ThemeType
+from docprocessor.utils import fast_json
 from docprocessor.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Number of search history entries kept (newest first)
+MAX_SEARCH_HISTORY = 20
 
-@dataclass
+
+# ISO timestamps are reused for up to this many seconds; history entries and
+# last_modified only need to be roughly right
+_NOW_ISO_TTL = 1.0
+_now_iso_cache = ("", float("-inf"))
+
+
+def _now_iso(refresh: bool = False) -> str:
+    """Return ``datetime.now().isoformat()``, cached for _NOW_ISO_TTL seconds."""
+    global _now_iso_cache
+    stamp, taken_at = _now_iso_cache
+    now = time.monotonic()
+    if refresh or now - taken_at >= _NOW_ISO_TTL:
+        stamp = datetime.now().isoformat()
+        _now_iso_cache = (stamp, now)
+    return stamp
+
+
+def _content_hash(data: dict) -> bytes:
+    """Digest of a preferences dict, ignoring the last_modified timestamp."""
+    content = {k: v for k, v in data.items() if k != "last_modified"}
+    return hashlib.blake2b(fast_json.dumps(content, indent=True), digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=8)
+def _to_theme(value: str) -> ThemeType:
+    """Map a stored theme string to ThemeType, falling back to DARK (cached per value)."""
+    try:
+        return ThemeType(value)
+    except ValueError:
+        logger.warning(f"Invalid theme value: {value}. Using DARK.")
+        return ThemeType.DARK
+
+
+@functools.lru_cache(maxsize=8)
+def _to_size_profile(value: str) -> SizeProfileType:
+    """Map a stored size profile string to SizeProfileType, falling back to SMALL (cached)."""
+    try:
+        return SizeProfileType(value)
+    except ValueError:
+        logger.warning(f"Invalid size profile value: {value}. Using SMALL.")
+        return SizeProfileType.SMALL
+
+
+@dataclass(slots=True)
 class SearchHistoryEntry:
     """Single entry in search history."""
 
@@ -55,6 +108,16 @@ class SearchHistoryEntry:
 class UserPreferences:
     """User preferences data model."""
 
+    __slots__ = (
+        "theme",
+        "size_profile",
+        "language",
+        "last_project_id",
+        "window_geometry",
+        "search_history",
+        "last_modified",
+    )
+
     def __init__(
         self,
         theme: str = "dark",
@@ -69,8 +132,11 @@ class UserPreferences:
         self.language = language
         self.last_project_id = last_project_id
         self.window_geometry = window_geometry or {}
-        self.search_history = search_history or []
-        self.last_modified = datetime.now().isoformat()
+        # Newest first; appendleft evicts the oldest entry once full
+        self.search_history = deque(
+            (search_history or [])[:MAX_SEARCH_HISTORY], maxlen=MAX_SEARCH_HISTORY
+        )
+        self.last_modified = _now_iso()
 
     def to_dict(self) -> dict:
         """Convert preferences to dictionary."""
@@ -80,7 +146,7 @@ class UserPreferences:
             "language": self.language,
             "last_project_id": self.last_project_id,
             "window_geometry": self.window_geometry,
-            "search_history": self.search_history,
+            "search_history": list(self.search_history),
             "last_modified": self.last_modified,
         }
 
@@ -101,7 +167,13 @@ class UserPreferencesManager:
     """Manages loading and saving user preferences."""
 
     _instance: Optional["UserPreferencesManager"] = None
-    _preferences_file: Path = Path.home() / ".docprocessor" / "preferences.json"
+    # Resolved on first use (see _get_pref_file) so importing this module
+    # touches neither the environment nor the filesystem
+    _preferences_file: Optional[Path] = None
+
+    # Seconds to wait after the last change before writing, so bursts of
+    # setter calls (e.g. window resizes) collapse into a single write
+    SAVE_DELAY_SECONDS = 0.5
 
     def __new__(cls):
         """Singleton pattern."""
@@ -113,13 +185,19 @@ class UserPreferencesManager:
         """Initialize preferences manager."""
         if not hasattr(self, "_initialized"):
             self._preferences: Optional[UserPreferences] = None
+            # Parsed search history, rebuilt after any history change
+            self._history_cache: Optional[List[SearchHistoryEntry]] = None
+            self._dirty = False
+            self._flush_timer: Optional[threading.Timer] = None
+            self._save_lock = threading.Lock()
+            # Digest of the preferences last read from or written to disk
+            self._last_payload_hash: Optional[bytes] = None
             self._initialized = True
 
-            # Ensure preferences directory exists
-            self._preferences_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write any pending changes before the interpreter exits
+            atexit.register(self.flush)
 
-            # Load preferences
-            self.load()
+            # Preferences are read on first access (see get_preferences)
 
     @classmethod
     def get_instance(cls) -> "UserPreferencesManager":
@@ -130,36 +208,97 @@ class UserPreferencesManager:
 
     def load(self) -> UserPreferences:
         """Load preferences from file."""
-        if self._preferences_file.exists():
-            try:
-                with open(self._preferences_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._preferences = UserPreferences.from_dict(data)
-                    logger.info(f"Loaded user preferences from {self._preferences_file}")
-            except Exception as e:
-                logger.warning(f"Failed to load preferences: {e}. Using defaults.")
-                self._preferences = UserPreferences()
-        else:
+        self._history_cache = None
+        pref_file = self._get_pref_file()
+        try:
+            # Parse the raw bytes in one go; a missing file surfaces as
+            # FileNotFoundError rather than needing a separate exists() check
+            data = fast_json.loads(pref_file.read_bytes())
+            self._preferences = UserPreferences.from_dict(data)
+            self._last_payload_hash = _content_hash(self._preferences.to_dict())
+            logger.info(f"Loaded user preferences from {pref_file}")
+        except FileNotFoundError:
             logger.info("No preferences file found. Using defaults.")
             self._preferences = UserPreferences()
+        except Exception as e:
+            logger.warning(f"Failed to load preferences: {e}. Using defaults.")
+            self._preferences = UserPreferences()
 
         return self._preferences
 
     def save(self) -> bool:
-        """Save preferences to file."""
+        """Schedule a write of the preferences to file.
+
+        The write happens SAVE_DELAY_SECONDS after the last call (or on
+        ``flush()`` / interpreter exit), so rapid successive changes are
+        written once.
+
+        Returns:
+            bool: True if a write was scheduled, False if there is nothing to save.
+            The write itself may still fail; call ``flush()`` when the result
+            must be on disk.
+        """
         if self._preferences is None:
             logger.warning("No preferences to save")
             return False
 
-        try:
-            # Update last modified timestamp
-            self._preferences.last_modified = datetime.now().isoformat()
+        with self._save_lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            timer = threading.Timer(self.SAVE_DELAY_SECONDS, self.flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+        return True
+
+    def flush(self) -> bool:
+        """Write pending preference changes to file immediately.
 
-            # Write to file
-            with open(self._preferences_file, "w", encoding="utf-8") as f:
-                json.dump(self._preferences.to_dict(), f, indent=2, ensure_ascii=False)
+        Returns:
+            bool: True if there was nothing pending or the write succeeded
+        """
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return True
+            written = self._write_to_disk()
+            # Keep the change pending on failure so the next flush (or exit) retries it
+            self._dirty = not written
+            return written
+
+    def _write_to_disk(self) -> bool:
+        """Write preferences to file. Callers must hold _save_lock."""
+        if self._preferences is None:
+            logger.warning("No preferences to save")
+            return False
 
-            logger.info(f"Saved user preferences to {self._preferences_file}")
+        try:
+            # Nothing to do if the content matches what is already on disk
+            data = self._preferences.to_dict()
+            content_hash = _content_hash(data)
+            if content_hash == self._last_payload_hash:
+                return True
+
+            # Update last modified timestamp, once per (debounced) write
+            self._preferences.last_modified = data["last_modified"] = _now_iso(refresh=True)
+
+            # Serialize up front, then write and fsync a temp file in one go and
+            # swap it in, so a crash never leaves a half-written preferences file
+            payload = fast_json.dumps(data, indent=True)
+            pref_file = self._get_pref_file()
+            pref_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = pref_file.with_suffix(".json.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, pref_file)
+            self._last_payload_hash = content_hash
+
+            logger.info(f"Saved user preferences to {pref_file}")
             return True
         except Exception as e:
             logger.error(f"Failed to save preferences: {e}")
@@ -173,30 +312,20 @@ class UserPreferencesManager:
 
     def get_theme(self) -> ThemeType:
         """Get theme preference."""
-        prefs = self.get_preferences()
-        try:
-            return ThemeType(prefs.theme)
-        except ValueError:
-            logger.warning(f"Invalid theme value: {prefs.theme}. Using DARK.")
-            return ThemeType.DARK
+        return _to_theme(self.get_preferences().theme)
 
     def set_theme(self, theme: ThemeType) -> bool:
-        """Set theme preference and save."""
+        """Set theme preference and schedule a save (see save())."""
         prefs = self.get_preferences()
         prefs.theme = theme.value
         return self.save()
 
     def get_size_profile(self) -> SizeProfileType:
         """Get size profile preference."""
-        prefs = self.get_preferences()
-        try:
-            return SizeProfileType(prefs.size_profile)
-        except ValueError:
-            logger.warning(f"Invalid size profile value: {prefs.size_profile}. Using SMALL.")
-            return SizeProfileType.SMALL
+        return _to_size_profile(self.get_preferences().size_profile)
 
     def set_size_profile(self, size_profile: SizeProfileType) -> bool:
-        """Set size profile preference and save."""
+        """Set size profile preference and schedule a save (see save())."""
         prefs = self.get_preferences()
         prefs.size_profile = size_profile.value
         return self.save()
@@ -206,7 +335,7 @@ class UserPreferencesManager:
         return self.get_preferences().language
 
     def set_language(self, language: str) -> bool:
-        """Set language preference and save."""
+        """Set language preference and schedule a save (see save())."""
         prefs = self.get_preferences()
         prefs.language = language
         return self.save()
@@ -216,7 +345,7 @@ class UserPreferencesManager:
         return self.get_preferences().last_project_id
 
     def set_last_project_id(self, project_id: Optional[str]) -> bool:
-        """Set last opened project ID and save."""
+        """Set last opened project ID and schedule a save (see save())."""
         prefs = self.get_preferences()
         prefs.last_project_id = project_id
         return self.save()
@@ -226,7 +355,7 @@ class UserPreferencesManager:
         return self.get_preferences().window_geometry
 
     def set_window_geometry(self, geometry: dict) -> bool:
-        """Set window geometry and save."""
+        """Set window geometry and schedule a save (see save())."""
         prefs = self.get_preferences()
         prefs.window_geometry = geometry
         return self.save()
@@ -240,6 +369,7 @@ class UserPreferencesManager:
         strategy: str,
         result_count: int,
         handler_used: str,
+        timestamp: Optional[str] = None,
     ) -> bool:
         """
         Add entry to search history (max 20, FIFO).
@@ -250,24 +380,27 @@ class UserPreferencesManager:
             strategy: Search strategy used ("auto", "google", "native")
             result_count: Number of results found
             handler_used: Handler that was used ("google", "ckan", "mixed")
+            timestamp: ISO timestamp of the search (defaults to now)
 
         Returns:
-            bool: True if saved successfully
+            bool: True if the save was scheduled (see save())
         """
         prefs = self.get_preferences()
 
         entry = SearchHistoryEntry(
             query=query,
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp or _now_iso(),
             sources=sources,
             strategy=strategy,
             result_count=result_count,
             handler_used=handler_used,
         )
 
-        # Add to front, limit to 20
-        prefs.search_history.insert(0, entry.to_dict())
-        prefs.search_history = prefs.search_history[:20]
+        # Add to front; the deque drops the oldest entry past MAX_SEARCH_HISTORY.
+        # History is mutated under _save_lock so a flush never iterates it mid-change
+        with self._save_lock:
+            prefs.search_history.appendleft(entry.to_dict())
+        self._history_cache = None
 
         return self.save()
 
@@ -278,13 +411,18 @@ class UserPreferencesManager:
         Returns:
             List[SearchHistoryEntry]: List of history entries (most recent first)
         """
+        if self._history_cache is not None:
+            return list(self._history_cache)
+
         prefs = self.get_preferences()
         try:
-            return [SearchHistoryEntry.from_dict(e) for e in prefs.search_history]
+            self._history_cache = [SearchHistoryEntry.from_dict(e) for e in prefs.search_history]
+            return list(self._history_cache)
         except Exception as e:
             logger.error(f"Failed to load search history: {e}")
             # Clear corrupted history
-            prefs.search_history = []
+            with self._save_lock:
+                prefs.search_history.clear()
             self.save()
             return []
 
@@ -293,10 +431,12 @@ class UserPreferencesManager:
         Clear all search history.
 
         Returns:
-            bool: True if cleared successfully
+            bool: True if the save was scheduled (see save())
         """
         prefs = self.get_preferences()
-        prefs.search_history = []
+        with self._save_lock:
+            prefs.search_history.clear()
+        self._history_cache = None
         return self.save()
 
     def remove_search_history_entry(self, index: int) -> bool:
@@ -307,21 +447,30 @@ class UserPreferencesManager:
             index: Index of entry to remove (0 = most recent)
 
         Returns:
-            bool: True if removed successfully
+            bool: True if the entry was removed and the save scheduled (see save())
         """
         prefs = self.get_preferences()
-        if 0 <= index < len(prefs.search_history):
-            prefs.search_history.pop(index)
-            return self.save()
-        return False
+        with self._save_lock:
+            if not 0 <= index < len(prefs.search_history):
+                return False
+            del prefs.search_history[index]
+        self._history_cache = None
+        return self.save()
 
     def reset_to_defaults(self) -> bool:
         """Reset all preferences to defaults."""
         self._preferences = UserPreferences()
+        self._history_cache = None
         return self.save()
 
     def get_preferences_file_path(self) -> Path:
         """Get path to preferences file."""
+        return self._get_pref_file()
+
+    def _get_pref_file(self) -> Path:
+        """Return the preferences file path, computing the default once."""
+        if self._preferences_file is None:
+            self._preferences_file = Path.home() / ".docprocessor" / "preferences.json"
         return self._preferences_file
 
 
@@ -12,7 +12,9 @@ Examples:
     python test_figure_extraction.py data/test_document.txt
 """
 
+import io
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 from docprocessor.core.figure_extractor import FigureExtractor
 from docprocessor.models.extracted_figure import FigureType
@@ -23,36 +25,8 @@ def print_separator():
     print("=" * 80)
 
 
-def main():
-    """Run figure extraction test."""
-    if len(sys.argv) < 2:
-        print("Usage: python test_figure_extraction.py <path_to_document>")
-        print("\nExamples:")
-        print("  python test_figure_extraction.py data/test_document.pdf")
-        print("  python test_figure_extraction.py data/test_document.docx")
-        sys.exit(1)
-
-    document_path = Path(sys.argv[1])
-
-    if not document_path.exists():
-        print(f"Error: File not found: {document_path}")
-        sys.exit(1)
-
-    print(f"📄 Testing Figure Extraction")
-    print_separator()
-    print(f"Document: {document_path}")
-    print(f"File size: {document_path.stat().st_size / 1024:.2f} KB")
-    print_separator()
-
-    # Create extractor
-    print("\n🔍 Initializing figure extractor...")
-    extractor = FigureExtractor()
-
-    # Extract figures
-    print(f"📊 Extracting figures from {document_path.name}...")
-    result = extractor.extract_from_document(document_path)
-
-    # Print results
+def print_report(result):
+    """Print the extraction results, figure details and per-type summary."""
     print_separator()
     print("✅ EXTRACTION RESULTS")
     print_separator()
@@ -139,5 +113,42 @@ def main():
     print("\n✨ Done!")
 
 
+def main():
+    """Run figure extraction test."""
+    if len(sys.argv) < 2:
+        print("Usage: python test_figure_extraction.py <path_to_document>")
+        print("\nExamples:")
+        print("  python test_figure_extraction.py data/test_document.pdf")
+        print("  python test_figure_extraction.py data/test_document.docx")
+        sys.exit(1)
+
+    document_path = Path(sys.argv[1])
+
+    if not document_path.exists():
+        print(f"Error: File not found: {document_path}")
+        sys.exit(1)
+
+    print(f"📄 Testing Figure Extraction")
+    print_separator()
+    print(f"Document: {document_path}")
+    print(f"File size: {document_path.stat().st_size / 1024:.2f} KB")
+    print_separator()
+
+    # Create extractor
+    print("\n🔍 Initializing figure extractor...")
+    extractor = FigureExtractor()
+
+    # Extract figures
+    print(f"📊 Extracting figures from {document_path.name}...")
+    result = extractor.extract_from_document(document_path)
+
+    # Build the report in memory and write it to stdout in one go
+    report = io.StringIO()
+    with redirect_stdout(report):
+        print_report(result)
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
+
+
 if __name__ == "__main__":
     main()
@@ -1,14 +1,35 @@
 """Shared pytest fixtures and configuration."""
 
+import hashlib
+import importlib.util
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
-# Add src to path for imports
+# Add src to path for imports, unless the packages already resolve to this
+# working tree (e.g. an editable install); extra sys.path entries slow every
+# import. A regular install elsewhere must not shadow the code under test.
 root_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(root_dir / "src"))
-sys.path.insert(0, str(root_dir))
+
+
+def _imports_from(name: str, directory: Path) -> bool:
+    """Whether ``import name`` already resolves to a package under ``directory``."""
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return False
+    locations = spec.submodule_search_locations or [spec.origin]
+    return any(
+        location and Path(location).resolve().is_relative_to(directory.resolve())
+        for location in locations
+    )
+
+
+if not _imports_from("docprocessor", root_dir / "src"):
+    sys.path.insert(0, str(root_dir / "src"))
+if not _imports_from("src", root_dir):
+    sys.path.insert(0, str(root_dir))
 
 
 @pytest.fixture(scope="session")
@@ -37,6 +58,98 @@ def mock_ollama_client(monkeypatch):
     return mock_client
 
 
+@pytest.fixture(scope="session")
+def embedder():
+    """Embedder shared by the whole session, so the model is loaded once."""
+    from docprocessor.core.embedder import Embedder
+
+    embedder = Embedder()
+    embedder.model.eval()
+    return embedder
+
+
+@pytest.fixture(scope="session")
+def embedding_batch_size():
+    """Embedding batch size suited to the host's accelerator.
+
+    Wider batches amortize per-batch overhead, but only a GPU has the
+    parallelism to keep them fed; on CPU, 32 is sentence-transformers' default.
+    """
+    try:
+        import torch
+    except ImportError:
+        return 32
+
+    if torch.cuda.is_available():
+        return 128
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return 64
+    return 32
+
+
+@pytest.fixture(scope="session")
+def cached_embedder(request, tmp_path_factory, embedder):
+    """Embedder whose embed_batch only runs the model on texts it has not seen.
+
+    Embeddings are keyed by (model name, SHA-256 of the text, normalize) and kept
+    in memory for the session and as .npy files in pytest's cache directory across
+    runs, so a model swap never reuses stale vectors.
+    """
+    import copy
+
+    import numpy as np
+
+    # Shallow copy: shares the loaded model but not the patched embed_batch
+    embedder = copy.copy(embedder)
+    model_key = hashlib.sha256(embedder.model_name.encode("utf-8")).hexdigest()[:16]
+    cache = getattr(request.config, "cache", None)  # None under -p no:cacheprovider
+    cache_dir = (
+        cache.mkdir(f"embeddings-{model_key}")
+        if cache is not None
+        else tmp_path_factory.mktemp("embeddings")
+    )
+    memory = {}
+    encode_batch = embedder.embed_batch
+
+    def embed_batch(texts, batch_size=32, show_progress=True, normalize=False):
+        if not texts:
+            return encode_batch(
+                texts, batch_size=batch_size, show_progress=show_progress, normalize=normalize
+            )
+
+        suffix = "-unit" if normalize else ""
+        keys = [hashlib.sha256(text.encode("utf-8")).hexdigest() + suffix for text in texts]
+        misses = {}
+        for key, text in zip(keys, texts):
+            if key in memory or key in misses:
+                continue
+            path = cache_dir / f"{key}.npy"
+            if path.exists():
+                memory[key] = np.load(path)
+            else:
+                misses[key] = text
+
+        if misses:
+            fresh = encode_batch(
+                list(misses.values()),
+                batch_size=batch_size,
+                show_progress=show_progress,
+                normalize=normalize,
+            )
+            for key, embedding in zip(misses, fresh):
+                memory[key] = embedding
+                # Write then rename, so parallel xdist workers never load a partial file
+                tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp.npy"
+                np.save(tmp_path, embedding)
+                os.replace(tmp_path, cache_dir / f"{key}.npy")
+
+        return np.stack([memory[key] for key in keys])
+
+    embedder.embed_batch = embed_batch
+    return embedder
+
+
 @pytest.fixture
 def disable_logging(caplog):
     """Disable logging during tests to reduce noise."""
@@ -54,3 +167,47 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
     config.addinivalue_line("markers", "requires_ollama: marks tests that require Ollama running")
     config.addinivalue_line("markers", "requires_gpu: marks tests that require GPU")
+    _pin_xdist_worker()
+
+
+def _pin_xdist_worker():
+    """Pin an xdist worker to its own slice of the CPUs.
+
+    Every worker loads its own embedding model, and each model would otherwise
+    spread its threads over all cores and contend with the other workers.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    count = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "0"))
+    if not worker.startswith("gw") or count < 2 or not hasattr(os, "sched_setaffinity"):
+        return
+
+    cpus = sorted(os.sched_getaffinity(0))
+    index = int(worker[2:])
+    own = cpus[index::count]
+    if own:
+        os.sched_setaffinity(0, own)
+
+
+def pytest_addoption(parser):
+    """Add command line options."""
+    parser.addoption("--runslow", action="store_true", default=False, help="run slow tests")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --runslow is given, and group serial tests.
+
+    Tests that share a single GPU or Ollama server go to one xdist worker; this is
+    only honoured with ``--dist loadgroup``, other distribution modes ignore groups.
+    """
+    if not config.getoption("--runslow"):
+        skip_slow = pytest.mark.skip(reason="slow; pass --runslow to run")
+        for item in items:
+            if "slow" in item.keywords:
+                item.add_marker(skip_slow)
+
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+
+    for item in items:
+        if any(item.get_closest_marker(m) for m in ("serial", "requires_gpu", "requires_ollama")):
+            item.add_marker(pytest.mark.xdist_group("serial"))
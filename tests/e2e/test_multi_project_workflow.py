@@ -2,53 +2,87 @@
 
 These tests validate complete user workflows from start to finish,
 ensuring that the multi-project system works correctly in realistic scenarios.
+
+Every test gets its own projects directory and manager, so the module can run
+under pytest-xdist (``pytest -n auto -m e2e``); each worker process has its own
+global project manager to restore.
 """
 
-import shutil
-import tempfile
-from pathlib import Path
+import dataclasses
 
 import pytest
 
-from docprocessor.core.project_manager import (
-    ProjectManager,
-    get_project_manager,
-    set_project_manager,
-)
+from docprocessor.core import project_manager as project_manager_module
+from docprocessor.core.project_manager import ProjectManager, set_project_manager
 from docprocessor.models.project import DocumentInfo
 
+_SAMPLE_BYTES = b"This is a sample document for testing.\n" * 100
 
-@pytest.fixture
-def temp_projects_dir():
-    """Create a temporary directory for projects."""
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-    # Cleanup
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
+# Documents d1..d5 (path /pN, title DN, N * 100 bytes) shared by the tests
+_DOC_TEMPLATES = tuple(
+    DocumentInfo(id=f"d{i}", file_path=f"/p{i}", title=f"D{i}", file_size=100 * i)
+    for i in range(1, 6)
+)
+
+
+def _doc(n: int, **changes) -> DocumentInfo:
+    """Return a copy of document template dN, so tests never share instances."""
+    return dataclasses.replace(_DOC_TEMPLATES[n - 1], **changes)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preserve_global_pm():
+    """Restore the global project manager once, after all tests have run."""
+    # Read the module global directly so no default manager gets created
+    original_manager = project_manager_module._global_manager
+    yield
+    set_project_manager(original_manager)
 
 
 @pytest.fixture
-def isolated_project_manager(temp_projects_dir):
-    """Create an isolated project manager for testing."""
-    manager = ProjectManager(projects_dir=temp_projects_dir)
-    # Save current global manager
-    original_manager = get_project_manager()
-    # Set our test manager as global
+def isolated_project_manager(tmp_path):
+    """Create an isolated project manager and install it globally."""
+    manager = ProjectManager(projects_dir=tmp_path)
     set_project_manager(manager)
-    yield manager
-    # Restore original manager
-    set_project_manager(original_manager)
+    return manager
 
 
 @pytest.fixture
-def sample_document_path(temp_projects_dir):
+def sample_document_path(tmp_path):
     """Create a sample document file."""
-    doc_path = temp_projects_dir / "sample_document.txt"
-    doc_path.write_text("This is a sample document for testing.\n" * 100)
+    doc_path = tmp_path / "sample_document.txt"
+    doc_path.write_bytes(_SAMPLE_BYTES)
     return doc_path
 
 
+@pytest.fixture(scope="class")
+def seeded_manager(tmp_path_factory):
+    """Manager with three varied projects, shared read-only by a test class."""
+    manager = ProjectManager(projects_dir=tmp_path_factory.mktemp("projects"))
+
+    p1 = manager.create_project(
+        name="Machine Learning Research", description="Deep learning for NLP", tags=["ML", "AI"]
+    )
+    p1.add_document(_doc(1))
+    manager.save_project(p1)
+
+    p2 = manager.create_project(
+        name="Legal Case Analysis",
+        description="Analyzing precedent cases",
+        tags=["legal", "research"],
+    )
+    p2.set_themes([{"id": "t1", "label": "Theme"}])
+    manager.save_project(p2)
+
+    p3 = manager.create_project(
+        name="Medical AI Research",
+        description="Machine learning in healthcare",
+        tags=["ML", "medical"],
+    )
+
+    return manager, p1, p2, p3
+
+
 @pytest.mark.e2e
 class TestProjectCreationWorkflow:
     """Test complete project creation workflow."""
@@ -82,7 +116,7 @@ class TestProjectCreationWorkflow:
 
         # Step 4: Verify project appears in list
         all_projects = manager.list_projects()
-        assert any(p.id == project.id for p in all_projects)
+        assert project.id in {p.id for p in all_projects}
 
     def test_create_project_from_template(self, isolated_project_manager):
         """Test creating project from a template."""
@@ -117,22 +151,22 @@ class TestProjectSwitchingWorkflow:
         project3 = manager.create_project(name="Project Gamma")
 
         # Add data to each project
-        doc1 = DocumentInfo(id="doc1", file_path="/path1", title="Doc1", file_size=1000)
+        doc1 = _doc(1)
         project1.add_document(doc1)
         manager.save_project(project1)
 
-        doc2 = DocumentInfo(id="doc2", file_path="/path2", title="Doc2", file_size=2000)
+        doc2 = _doc(2)
         project2.add_document(doc2)
         manager.save_project(project2)
 
         # Load each project and verify state isolation
         p1_loaded = manager.load_project(project1.id)
         assert len(p1_loaded.documents) == 1
-        assert p1_loaded.documents[0].id == "doc1"
+        assert p1_loaded.documents[0].id == "d1"
 
         p2_loaded = manager.load_project(project2.id)
         assert len(p2_loaded.documents) == 1
-        assert p2_loaded.documents[0].id == "doc2"
+        assert p2_loaded.documents[0].id == "d2"
 
         p3_loaded = manager.load_project(project3.id)
         assert len(p3_loaded.documents) == 0
@@ -148,8 +182,8 @@ class TestProjectSwitchingWorkflow:
         project = manager.create_project(name="Persistent Project")
 
         # Add documents
-        doc1 = DocumentInfo(id="d1", file_path="/p1", title="D1", file_size=100)
-        doc2 = DocumentInfo(id="d2", file_path="/p2", title="D2", file_size=200)
+        doc1 = _doc(1)
+        doc2 = _doc(2)
         project.add_document(doc1)
         project.add_document(doc2)
 
@@ -168,9 +202,8 @@ class TestProjectSwitchingWorkflow:
         manager.save_project(project)
         project_id = project.id
 
-        # Clear cache and reload
-        manager.clear_cache()
-        loaded = manager.load_project(project_id)
+        # Reload through a fresh manager, which reads straight from disk
+        loaded = ProjectManager(projects_dir=manager.projects_dir).load_project(project_id)
 
         # Verify all state persisted
         assert loaded.name == "Persistent Project"
@@ -225,9 +258,9 @@ class TestDocumentProcessingWorkflow:
         project = manager.create_project(name="Document Removal Test")
 
         # Add multiple documents
-        doc1 = DocumentInfo(id="d1", file_path="/p1", title="D1", file_size=100)
-        doc2 = DocumentInfo(id="d2", file_path="/p2", title="D2", file_size=200)
-        doc3 = DocumentInfo(id="d3", file_path="/p3", title="D3", file_size=300)
+        doc1 = _doc(1)
+        doc2 = _doc(2)
+        doc3 = _doc(3)
 
         project.add_document(doc1)
         project.add_document(doc2)
@@ -261,20 +294,18 @@ class TestProjectLifecycleWorkflow:
         project = manager.create_project(name="Lifecycle Test")
         project_id = project.id
 
-        # Step 2: Use project (add data)
-        doc = DocumentInfo(id="d1", file_path="/p", title="D", file_size=100)
+        # Step 2: Use project (add data) and mark as favorite, saved together
+        doc = _doc(1)
         project.add_document(doc)
-        manager.save_project(project)
-
-        # Step 3: Mark as favorite
         project.is_favorite = True
         manager.save_project(project)
 
-        # Verify favorite
+        # Verify data and favorite
         loaded = manager.load_project(project_id)
         assert loaded.is_favorite is True
+        assert [d.id for d in loaded.documents] == ["d1"]
 
-        # Step 4: Archive project (soft delete)
+        # Step 3: Archive project (soft delete)
         result = manager.delete_project(project_id, permanent=False)
         assert result is True
 
@@ -283,20 +314,20 @@ class TestProjectLifecycleWorkflow:
 
         # Verify not in active list
         active = manager.list_projects(include_archived=False)
-        assert not any(p.id == project_id for p in active)
+        assert project_id not in {p.id for p in active}
 
         # But is in archived list
         all_projects = manager.list_projects(include_archived=True)
-        assert any(p.id == project_id for p in all_projects)
+        assert project_id in {p.id for p in all_projects}
 
-        # Step 5: Restore project
+        # Step 4: Restore project
         result = manager.restore_project(project_id)
         assert result is True
 
         restored = manager.load_project(project_id)
         assert restored.is_archived is False
 
-        # Step 6: Delete permanently
+        # Step 5: Delete permanently
         result = manager.delete_project(project_id, permanent=True)
         assert result is True
 
@@ -312,64 +343,33 @@ class TestProjectLifecycleWorkflow:
 class TestProjectSearchAndFilter:
     """Test searching and filtering projects."""
 
-    def test_search_projects_workflow(self, isolated_project_manager):
+    def test_search_projects_workflow(self, seeded_manager):
         """Test searching projects by various criteria."""
-        manager = isolated_project_manager
-
-        # Create diverse set of projects
-        p1 = manager.create_project(
-            name="Machine Learning Research", description="Deep learning for NLP", tags=["ML", "AI"]
-        )
-
-        p2 = manager.create_project(
-            name="Legal Case Analysis",
-            description="Analyzing precedent cases",
-            tags=["legal", "research"],
-        )
-
-        p3 = manager.create_project(
-            name="Medical AI Research",
-            description="Machine learning in healthcare",
-            tags=["ML", "medical"],
-        )
+        manager, p1, p2, p3 = seeded_manager
 
         # Search by name - matches both p1 (name) and p3 (description)
         results = manager.search_projects("Machine Learning")
         assert (
             len(results) == 2
         )  # p1 name has "Machine Learning", p3 description has "machine learning"
-        assert any(p.id == p1.id for p in results)
-        assert any(p.id == p3.id for p in results)
+        assert {p.id for p in results} == {p1.id, p3.id}
 
         # Search by description keyword
         results = manager.search_projects("machine learning")
         assert len(results) == 2  # p1 and p3
-        assert any(p.id == p1.id for p in results)
-        assert any(p.id == p3.id for p in results)
+        assert {p.id for p in results} == {p1.id, p3.id}
 
         # Search case-insensitive
         results = manager.search_projects("LEGAL")
         assert len(results) == 1
         assert results[0].id == p2.id
 
-    def test_filter_projects_workflow(self, isolated_project_manager):
+    def test_filter_projects_workflow(self, seeded_manager):
         """Test filtering projects by various attributes."""
-        manager = isolated_project_manager
-
-        # Create projects with different attributes
-        p1 = manager.create_project(name="P1", tags=["tag1", "tag2"])
-        doc1 = DocumentInfo(id="d1", file_path="/p", title="D", file_size=100)
-        p1.add_document(doc1)
-        manager.save_project(p1)
-
-        p2 = manager.create_project(name="P2", tags=["tag2", "tag3"])
-        p2.set_themes([{"id": "t1", "label": "Theme"}])
-        manager.save_project(p2)
-
-        p3 = manager.create_project(name="P3")
+        manager, p1, p2, p3 = seeded_manager
 
         # Filter by tag
-        results = manager.filter_projects(tags=["tag1"])
+        results = manager.filter_projects(tags=["AI"])
         assert len(results) == 1
         assert results[0].id == p1.id
 
@@ -388,7 +388,7 @@ class TestProjectSearchAndFilter:
 class TestProjectImportExport:
     """Test importing and exporting projects."""
 
-    def test_export_import_workflow(self, isolated_project_manager, temp_projects_dir):
+    def test_export_import_workflow(self, isolated_project_manager, tmp_path):
         """Test exporting a project and importing it back."""
         manager = isolated_project_manager
 
@@ -398,8 +398,8 @@ class TestProjectImportExport:
         )
 
         # Add documents
-        doc1 = DocumentInfo(id="d1", file_path="/p1", title="Doc1", file_size=100)
-        doc2 = DocumentInfo(id="d2", file_path="/p2", title="Doc2", file_size=200)
+        doc1 = _doc(1)
+        doc2 = _doc(2)
         project.add_document(doc1)
         project.add_document(doc2)
 
@@ -411,7 +411,7 @@ class TestProjectImportExport:
         original_id = project.id
 
         # Export project
-        export_path = temp_projects_dir / "exported_project.json"
+        export_path = tmp_path / "exported_project.json"
         result = manager.export_project(project.id, export_path)
         assert result is True
         assert export_path.exists()
@@ -442,12 +442,12 @@ class TestProjectStatistics:
 
         # Create projects with various states
         p1 = manager.create_project(name="P1", is_favorite=True)
-        doc1 = DocumentInfo(id="d1", file_path="/p", title="D", file_size=100)
+        doc1 = _doc(1)
         p1.add_document(doc1)
         manager.save_project(p1)
 
         p2 = manager.create_project(name="P2", is_archived=True)
-        doc2 = DocumentInfo(id="d2", file_path="/p", title="D", file_size=100)
+        doc2 = _doc(2)
         p2.add_document(doc2)
         manager.save_project(p2)
 
@@ -0,0 +1,62 @@
+"""Shared fixtures for integration tests."""
+
+import copy
+from typing import Dict, List, Optional
+
+import pytest
+
+from docprocessor.core.project_manager import ProjectManager
+from docprocessor.models.project import Project, ProjectSettings
+
+
+class InMemoryProjectManager(ProjectManager):
+    """ProjectManager that keeps projects in a dict instead of JSON files.
+
+    Projects are deep-copied on save and load, so callers get the same isolation
+    as from a round trip through disk, without the (de)serialization.
+    """
+
+    def __init__(self):
+        self._projects: Dict[str, Project] = {}
+        self._project_cache: Dict[str, Project] = {}
+
+    def create_project(
+        self, name: str, description: str = "", settings: Optional[ProjectSettings] = None, **kwargs
+    ) -> Project:
+        if not name or not name.strip():
+            raise ValueError("Project name cannot be empty")
+
+        project = Project(
+            name=name.strip(),
+            description=description,
+            settings=settings or ProjectSettings(),
+            **kwargs,
+        )
+        self.save_project(project)
+        return project
+
+    def load_project(self, project_id: str, use_cache: bool = True) -> Optional[Project]:
+        project = self._projects.get(project_id)
+        return copy.deepcopy(project) if project else None
+
+    def load_all_projects(self, include_archived: bool = False) -> List[Project]:
+        projects = [self.load_project(project_id) for project_id in self._projects]
+        return [p for p in projects if include_archived or not p.is_archived]
+
+    def save_project(self, project: Project):
+        project.update_timestamp()
+        self._projects[project.id] = copy.deepcopy(project)
+
+    def delete_project(self, project_id: str, permanent: bool = False) -> bool:
+        if permanent:
+            return self._projects.pop(project_id, None) is not None
+        return super().delete_project(project_id, permanent=False)
+
+    def exists(self, project_id: str) -> bool:
+        return project_id in self._projects
+
+
+@pytest.fixture(scope="module")
+def in_memory_project_manager():
+    """InMemoryProjectManager shared by a test module."""
+    return InMemoryProjectManager()
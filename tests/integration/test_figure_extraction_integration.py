@@ -1,26 +1,45 @@
 """Integration tests for figure extraction feature."""
 
+import os
+
 import pytest
 
 from docprocessor.core.figure_extractor import FigureExtractor
 from docprocessor.models.extracted_figure import FigureType
 
+# Optional document generators, checked once; fixtures skip when missing
+# (a module-level importorskip would also skip the TXT-only tests)
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+except ImportError:
+    canvas = None
+
+# 200 paragraphs full of figures, encoded once for the performance test
+_LARGE_CONTENT = "\n".join(
+    f"En {2020 + i % 6}, le budget est de €{40 + i % 10}.{i % 10} milliards, "
+    f"soit une croissance de {15 + i % 10}.{i % 10}%."
+    for i in range(200)
+).encode("utf-8")
+
 
 class TestFigureExtractionIntegration:
     """Integration tests for complete extraction workflow."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def extractor(self):
-        """Create extractor instance."""
+        """Create extractor instance (holds no per-document state)."""
         return FigureExtractor()
 
-    @pytest.fixture
-    def sample_docx_path(self, tmp_path):
-        """Create a sample DOCX file for testing."""
-        # Note: This requires python-docx installed
-        try:
-            from docx import Document
-        except ImportError:
+    @pytest.fixture(scope="module")
+    def sample_docx_path(self, tmp_path_factory):
+        """Create a sample DOCX file, shared read-only by the module's tests."""
+        if Document is None:
             pytest.skip("python-docx not installed")
 
         doc = Document()
@@ -39,22 +58,18 @@ class TestFigureExtractionIntegration:
         table.cell(2, 1).text = "45.3"
         table.cell(2, 2).text = "23.4"
 
-        docx_path = tmp_path / "test.docx"
+        docx_path = tmp_path_factory.mktemp("docx") / "test.docx"
         doc.save(str(docx_path))
 
         return docx_path
 
-    @pytest.fixture
-    def sample_pdf_path(self, tmp_path):
-        """Create a sample PDF file for testing."""
-        # Note: This test creates a simple text PDF using reportlab if available
-        try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.pdfgen import canvas
-        except ImportError:
+    @pytest.fixture(scope="module")
+    def sample_pdf_path(self, tmp_path_factory):
+        """Create a sample PDF file, shared read-only by the module's tests."""
+        if canvas is None:
             pytest.skip("reportlab not installed")
 
-        pdf_path = tmp_path / "test.pdf"
+        pdf_path = tmp_path_factory.mktemp("pdf") / "test.pdf"
 
         c = canvas.Canvas(str(pdf_path), pagesize=letter)
         c.drawString(100, 750, "Le budget de l'État en 2025 s'élève à €45.3 milliards.")
@@ -129,7 +144,7 @@ Les recettes fiscales ont atteint €42.8 milliards en 2024.
         for fig in page_figures:
             assert fig.page_number == 1
 
-    def test_multiformat_consistency(self, extractor, tmp_path, sample_docx_path):
+    def test_multiformat_consistency(self, extractor, tmp_path):
         """Test that same content gives similar results across formats."""
         content = """
 Le budget de l'État en 2025 s'élève à €45.3 milliards.
@@ -194,25 +209,20 @@ Aucune statistique présente ici.
         # May find very few or zero figures (acceptable)
         assert result.total_figures >= 0
 
+    @pytest.mark.benchmark
+    @pytest.mark.skipif(not os.environ.get("RUN_BENCH"), reason="benchmark; set RUN_BENCH=1")
     def test_large_document_performance(self, extractor, tmp_path):
         """Test extraction performance with large document."""
         import time
 
         # Create large file with many figures
         large_file = tmp_path / "large.txt"
-        content_lines = []
-        for i in range(200):  # 200 paragraphs
-            content_lines.append(
-                f"En {2020 + i % 6}, le budget est de €{40 + i % 10}.{i % 10} milliards, "
-                f"soit une croissance de {15 + i % 10}.{i % 10}%."
-            )
-
-        large_file.write_text("\n".join(content_lines))
+        large_file.write_bytes(_LARGE_CONTENT)
 
         # Extract and measure time
-        start = time.time()
+        start = time.perf_counter()
         result = extractor.extract_from_document(large_file)
-        duration = time.time() - start
+        duration = time.perf_counter() - start
 
         # Verify results
         assert result.total_figures > 100  # Should find many figures
@@ -227,25 +237,22 @@ Aucune statistique présente ici.
 
     def test_extraction_result_serialization(self, extractor, tmp_path):
         """Test that extraction results can be serialized."""
-        from dataclasses import asdict
+        from dataclasses import asdict, fields
 
         txt_file = tmp_path / "test.txt"
         txt_file.write_text("Le budget 2025 est de €45.3 milliards.")
 
         result = extractor.extract_from_document(txt_file)
 
-        # Test dataclass serialization
-        result_dict = asdict(result)
-
-        assert isinstance(result_dict, dict)
-        assert "figures" in result_dict
-        assert "total_figures" in result_dict
-        assert "extraction_time_seconds" in result_dict
+        # Check the result structure without deep-copying every figure
+        names = {f.name for f in fields(result)}
+        assert {"figures", "total_figures", "extraction_time_seconds"} <= names
 
-        # Verify figures are serializable
-        for fig_dict in result_dict["figures"]:
-            assert "value" in fig_dict
-            assert "figure_type" in fig_dict
+        # Verify a figure serializes
+        assert result.figures
+        first = asdict(result.figures[0])
+        assert "value" in first
+        assert "figure_type" in first
 
     def test_figure_deduplication(self, extractor, tmp_path):
         """Test that duplicate figures are handled correctly."""
@@ -1,22 +1,57 @@
 """Integration tests for full document processing workflow."""
 
-from pathlib import Path
-from tempfile import NamedTemporaryFile, TemporaryDirectory
+import copy
+import os
+from collections import Counter
 from unittest.mock import patch
+from uuid import uuid4
 
 import pytest
 
 from docprocessor.core.document_processor import DocumentProcessor
-from docprocessor.core.embedder import Embedder
 from docprocessor.core.theme_analyzer import ThemeAnalyzer
 from docprocessor.core.vector_store import VectorStore
+from docprocessor.models.chunk import Chunk
 from docprocessor.models.document import Document
 
+# Ceiling on the chunks the store/theme workflow tests push through; per-chunk
+# behaviour is already covered by test_chunks_to_embeddings_workflow
+MAX_CHUNKS = int(os.environ.get("E2E_MAX_CHUNKS", 30))
+
+
+@pytest.fixture(scope="session")
+def processor():
+    """Document processor shared by the session; it keeps no per-document state."""
+    return DocumentProcessor(chunk_size=500, chunk_overlap=50)
+
+
+@pytest.fixture(scope="session")
+def shared_vector_db(tmp_path_factory):
+    """One ChromaDB directory for the session; tests differ by collection name."""
+    return tmp_path_factory.mktemp("vecdb")
+
 
 @pytest.fixture
-def sample_documents():
-    """Create sample documents for integration testing."""
+def vector_store(request, shared_vector_db):
+    """Vector store with a collection named after the test.
+
+    Uses the in-memory backend unless DOCPROCESSOR_VECTOR_STORE_BACKEND says
+    otherwise (e.g. ``chroma`` to run against the shared ChromaDB directory).
+    """
+    store = VectorStore(
+        collection_name=request.node.name,
+        persist_directory=shared_vector_db,
+        backend=os.environ.get("DOCPROCESSOR_VECTOR_STORE_BACKEND", "memory"),
+    )
+    yield store
+    store.client.delete_collection(store.collection_name)
+
+
+@pytest.fixture(scope="session")
+def session_documents(tmp_path_factory):
+    """Create the sample documents and their files once per session."""
     documents = []
+    corpus_dir = tmp_path_factory.mktemp("corpus")
 
     # Document 1: Contract Law
     doc1_text = (
@@ -70,14 +105,13 @@ def sample_documents():
         * 3
     )  # Repeat for more content
 
-    # Create temporary files
+    # Create document files
     for i, text in enumerate([doc1_text, doc2_text], 1):
-        with NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(text)
-            temp_path = Path(f.name)
+        doc_path = corpus_dir / f"doc{i}.txt"
+        doc_path.write_text(text)
 
         doc = Document(
-            file_path=temp_path,
+            file_path=doc_path,
             title=f"Test Document {i}",
             author="Test Author",
             page_count=5,
@@ -87,11 +121,58 @@ def sample_documents():
         )
         documents.append(doc)
 
-    yield documents
+    return documents
+
+
+@pytest.fixture
+def sample_documents(session_documents):
+    """Fresh copies of the sample documents (same ids and files) for each test."""
+    return [doc.model_copy(deep=True) for doc in session_documents]
+
+
+@pytest.fixture(scope="session")
+def chunker_cache():
+    """Chunks keyed by (document id, chunk size, chunk overlap), kept for the session."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def chunk_doc(chunker_cache):
+    """Chunk a document once per chunking configuration; callers get their own copy."""
+
+    def chunk_doc(processor, doc):
+        key = (doc.id, processor.chunk_size, processor.chunk_overlap)
+        if key not in chunker_cache:
+            chunker_cache[key] = processor.chunk_document(doc)
+        return copy.deepcopy(chunker_cache[key])
 
-    # Cleanup
-    for doc in documents:
-        doc.file_path.unlink(missing_ok=True)
+    return chunk_doc
+
+
+@pytest.fixture(scope="session")
+def processed_corpus(
+    session_documents, processor, chunk_doc, cached_embedder, embedding_batch_size
+):
+    """Chunks of all sample documents and their unit-length embeddings, computed once.
+
+    Treat as read-only; tests that modify chunks should use ``corpus``.
+    """
+    chunks = [chunk for doc in session_documents for chunk in chunk_doc(processor, doc)]
+    embeddings = cached_embedder.embed_batch(
+        [chunk.text for chunk in chunks],
+        batch_size=embedding_batch_size,
+        show_progress=False,
+        normalize=True,
+    )
+    embeddings.setflags(write=False)
+    return chunks, embeddings
+
+
+@pytest.fixture
+def corpus(processed_corpus):
+    """Per-test copy of the processed corpus chunks, safe to modify."""
+    chunks, embeddings = processed_corpus
+    return copy.deepcopy(chunks), embeddings
 
 
 @pytest.mark.integration
@@ -100,13 +181,12 @@ class TestFullWorkflow:
     """Test complete document processing workflow."""
 
     @pytest.mark.wip  # Skip in CI - assertion threshold issue
-    def test_document_to_chunks_workflow(self, sample_documents):
+    def test_document_to_chunks_workflow(self, sample_documents, processor, chunk_doc):
         """Test processing documents into chunks."""
-        processor = DocumentProcessor(chunk_size=500, chunk_overlap=50)
 
         all_chunks = []
         for doc in sample_documents:
-            chunks = processor.chunk_document(doc)
+            chunks = chunk_doc(processor, doc)
             all_chunks.extend(chunks)
 
         # Should have created multiple chunks
@@ -116,222 +196,177 @@ class TestFullWorkflow:
         assert all(chunk.text for chunk in all_chunks)
 
         # Chunks should have proper document IDs
+        chunks_per_document = Counter(chunk.document_id for chunk in all_chunks)
         for doc in sample_documents:
-            doc_chunks = [c for c in all_chunks if c.document_id == doc.id]
-            assert len(doc_chunks) > 0
+            assert chunks_per_document[doc.id] > 0
 
-    def test_chunks_to_embeddings_workflow(self, sample_documents):
+    def test_chunks_to_embeddings_workflow(self, corpus):
         """Test embedding generation workflow."""
-        processor = DocumentProcessor(chunk_size=500, chunk_overlap=50)
-        embedder = Embedder()
-
-        # Process documents
-        all_chunks = []
-        for doc in sample_documents:
-            chunks = processor.chunk_document(doc)
-            all_chunks.extend(chunks)
-
-        # Generate embeddings
-        texts = [chunk.text for chunk in all_chunks]
-        embeddings = embedder.embed_batch(texts, batch_size=16, show_progress=False)
+        # Documents are chunked and embedded once by the corpus fixture
+        all_chunks, embeddings = corpus
 
         # Assign embeddings to chunks
         for chunk, embedding in zip(all_chunks, embeddings):
-            chunk.embedding = embedding.tolist()
+            chunk.embedding = embedding
 
         # Verify embeddings
         assert len(embeddings) == len(all_chunks)
         assert all(chunk.embedding is not None for chunk in all_chunks)
 
-    def test_embeddings_to_vector_store_workflow(self, sample_documents):
+    def test_embeddings_to_vector_store_workflow(self, corpus, vector_store):
         """Test storing embeddings in vector store."""
-        processor = DocumentProcessor(chunk_size=500, chunk_overlap=50)
-        embedder = Embedder()
+        all_chunks, embeddings = corpus
 
-        with TemporaryDirectory() as tmpdir:
-            vector_store = VectorStore(
-                collection_name="test_workflow", persist_directory=Path(tmpdir)
-            )
-
-            # Process and embed documents
-            all_chunks = []
-            for doc in sample_documents:
-                chunks = processor.chunk_document(doc)
-                all_chunks.extend(chunks)
-
-            texts = [chunk.text for chunk in all_chunks]
-            embeddings = embedder.embed_batch(texts, batch_size=16, show_progress=False)
-
-            for chunk, embedding in zip(all_chunks, embeddings):
-                chunk.embedding = embedding.tolist()
+        for chunk, embedding in zip(all_chunks, embeddings):
+            chunk.embedding = embedding
 
-            # Store in vector store
-            vector_store.add_chunks(all_chunks)
+        # Store in vector store
+        vector_store.add_chunks(all_chunks)
 
-            # Verify storage
-            assert vector_store.count() == len(all_chunks)
+        # Verify storage
+        assert vector_store.count() == len(all_chunks)
 
-            # Test retrieval
-            query_embedding = embeddings[0]
-            results = vector_store.search(query_embedding, n_results=5)
+        # Test retrieval
+        query_embedding = embeddings[0]
+        results = vector_store.search(query_embedding, n_results=5)
 
-            assert len(results) > 0
-            assert results[0]["text"] is not None
+        assert len(results) > 0
+        assert results[0]["text"] is not None
 
     @pytest.mark.wip  # Skip in CI - path handling issue
-    def test_vector_store_to_themes_workflow(self, sample_documents):
+    def test_vector_store_to_themes_workflow(self, processed_corpus, vector_store):
         """Test theme discovery from vector store."""
-        processor = DocumentProcessor(chunk_size=500, chunk_overlap=50)
-        embedder = Embedder()
-
-        # Process documents
-        all_chunks = []
-        for doc in sample_documents:
-            chunks = processor.chunk_document(doc)
-            all_chunks.extend(chunks[:20])  # Limit for speed
-
-        # Embed
-        texts = [chunk.text for chunk in all_chunks]
-        embeddings = embedder.embed_batch(texts, batch_size=16, show_progress=False)
-
-        # Store in vector store for theme analyzer
-        import tempfile
-
-        from docprocessor.core.vector_store import VectorStore
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            vector_store = VectorStore(persist_directory=tmpdir)
-
-            # Discover themes
-            theme_analyzer = ThemeAnalyzer(vector_store=vector_store, max_themes=2)
-
-            with patch.object(theme_analyzer, "_generate_theme_label") as mock_label:
-                mock_label.side_effect = ["Contract Law", "Tort Law"]
-
-                themes = theme_analyzer.discover_themes(n_themes=2)
-
-                # Should discover themes
-                assert len(themes) > 0
-                assert all(theme.label for theme in themes)
-                assert all(theme.chunk_count > 0 for theme in themes)
+        all_chunks, embeddings = processed_corpus
+
+        # Limit for speed: first 20 chunks of each document
+        per_document = Counter()
+        keep = []
+        for i, chunk in enumerate(all_chunks):
+            per_document[chunk.document_id] += 1
+            if per_document[chunk.document_id] <= 20:
+                keep.append(i)
+        keep = keep[:MAX_CHUNKS]
+
+        # Store copies with embeddings; processed_corpus chunks are shared read-only
+        chunks = []
+        for i in keep:
+            chunk = all_chunks[i].model_copy()
+            chunk.embedding = embeddings[i]
+            chunks.append(chunk)
+        vector_store.add_chunks(chunks)
+        assert vector_store.count() == len(chunks)
+
+        # Discover themes from the vector store
+        theme_analyzer = ThemeAnalyzer(vector_store=vector_store, max_themes=2)
+
+        with patch.object(theme_analyzer.ollama_client, "generate") as mock_generate:
+            mock_generate.side_effect = ["Theme: Contract Law", "Theme: Tort Law"]
+
+            themes = theme_analyzer.discover_themes(n_themes=2)
+
+            # Should discover themes
+            assert len(themes) > 0
+            assert all(theme.label for theme in themes)
+            assert all(theme.chunk_count > 0 for theme in themes)
 
     @pytest.mark.requires_ollama
-    def test_end_to_end_without_synthesis(self, sample_documents):
+    def test_end_to_end_without_synthesis(self, sample_documents, corpus, vector_store):
         """Test end-to-end workflow without final synthesis (no Ollama required)."""
         # Initialize components
-        processor = DocumentProcessor(chunk_size=500, chunk_overlap=50)
-        embedder = Embedder()
         theme_analyzer = ThemeAnalyzer(n_themes=2)
 
-        with TemporaryDirectory() as tmpdir:
-            vector_store = VectorStore(collection_name="e2e_test", persist_directory=Path(tmpdir))
-
-            # Step 1: Process documents into chunks
-            all_chunks = []
-            for doc in sample_documents:
-                chunks = processor.chunk_document(doc)
-                all_chunks.extend(chunks)
-
-            assert len(all_chunks) > 0
+        # Steps 1-2: Documents processed into chunks and embedded (corpus fixture),
+        # capped at MAX_CHUNKS
+        all_chunks, embeddings = corpus
+        all_chunks, embeddings = all_chunks[:MAX_CHUNKS], embeddings[:MAX_CHUNKS]
+        texts = [chunk.text for chunk in all_chunks]
 
-            # Step 2: Generate embeddings
-            texts = [chunk.text for chunk in all_chunks]
-            embeddings = embedder.embed_batch(texts, batch_size=16, show_progress=False)
+        assert len(all_chunks) > 0
 
-            for chunk, embedding in zip(all_chunks, embeddings):
-                chunk.embedding = embedding.tolist()
+        for chunk, embedding in zip(all_chunks, embeddings):
+            chunk.embedding = embedding
 
-            assert all(chunk.embedding is not None for chunk in all_chunks)
+        assert all(chunk.embedding is not None for chunk in all_chunks)
 
-            # Step 3: Store in vector database
-            vector_store.add_chunks(all_chunks)
-            assert vector_store.count() == len(all_chunks)
+        # Step 3: Store in vector database
+        vector_store.add_chunks(all_chunks)
+        assert vector_store.count() == len(all_chunks)
 
-            # Step 4: Discover themes
-            with patch.object(theme_analyzer, "_generate_theme_label") as mock_label:
-                mock_label.side_effect = ["Theme 1", "Theme 2"]
-                themes = theme_analyzer.discover_themes(embeddings, texts)
+        # Step 4: Discover themes
+        with patch.object(theme_analyzer, "_generate_theme_label") as mock_label:
+            mock_label.side_effect = ["Theme 1", "Theme 2"]
+            themes = theme_analyzer.discover_themes(embeddings, texts)
 
-            assert len(themes) > 0
+        assert len(themes) > 0
 
-            # Step 5: Test retrieval for synthesis (without actual LLM generation)
-            query_embedding = embeddings[0]
-            relevant_chunks = vector_store.search(query_embedding, n_results=10)
+        # Step 5: Test retrieval for synthesis (without actual LLM generation)
+        query_embedding = embeddings[0]
+        relevant_chunks = vector_store.search(query_embedding, n_results=10)
 
-            assert len(relevant_chunks) > 0
-            assert all("text" in chunk for chunk in relevant_chunks)
+        assert len(relevant_chunks) > 0
+        assert all("text" in chunk for chunk in relevant_chunks)
 
-            print(f"\n✓ Processed {len(sample_documents)} documents")
-            print(f"✓ Created {len(all_chunks)} chunks")
-            print(f"✓ Generated {len(embeddings)} embeddings")
-            print(f"✓ Discovered {len(themes)} themes")
-            print(f"✓ Retrieved {len(relevant_chunks)} relevant chunks")
+        print(f"\n✓ Processed {len(sample_documents)} documents")
+        print(f"✓ Created {len(all_chunks)} chunks")
+        print(f"✓ Generated {len(embeddings)} embeddings")
+        print(f"✓ Discovered {len(themes)} themes")
+        print(f"✓ Retrieved {len(relevant_chunks)} relevant chunks")
 
 
 @pytest.mark.integration
 class TestComponentIntegration:
     """Test integration between specific components."""
 
-    def test_processor_embedder_integration(self, sample_documents):
+    def test_processor_embedder_integration(self, sample_documents, processed_corpus):
         """Test document processor and embedder work together."""
-        processor = DocumentProcessor(chunk_size=500, chunk_overlap=50)
-        embedder = Embedder()
+        all_chunks, all_embeddings = processed_corpus
 
+        # First 5 chunks of the first document
         doc = sample_documents[0]
-        chunks = processor.chunk_document(doc)
-
-        # Embed first 5 chunks
-        texts = [chunk.text for chunk in chunks[:5]]
-        embeddings = embedder.embed_batch(texts, show_progress=False)
+        first = [i for i, chunk in enumerate(all_chunks) if chunk.document_id == doc.id][:5]
+        texts = [all_chunks[i].text for i in first]
+        embeddings = all_embeddings[first]
 
         assert len(embeddings) == len(texts)
 
         # Embeddings should capture semantic similarity
-        # First two chunks from same doc should be more similar than random
+        # First two chunks from same doc should be more similar than random;
+        # the embeddings are unit length, so the dot product is the cosine similarity
         emb1, emb2 = embeddings[0], embeddings[1]
-        similarity = (emb1 @ emb2) / ((emb1 @ emb1) ** 0.5 * (emb2 @ emb2) ** 0.5)
+        similarity = float(emb1 @ emb2)
 
         assert similarity > 0.3  # Should have some similarity
 
-    def test_embedder_vector_store_integration(self):
+    def test_embedder_vector_store_integration(self, embedder, vector_store, embedding_batch_size):
         """Test embedder and vector store work together."""
-        embedder = Embedder()
-
         texts = [
             "Contract law governs agreements",
             "Tort law addresses civil wrongs",
             "Criminal law defines offenses",
         ]
 
-        embeddings = embedder.embed_batch(texts, show_progress=False)
+        embeddings = embedder.embed_batch(
+            texts, batch_size=embedding_batch_size, show_progress=False
+        )
 
-        with TemporaryDirectory() as tmpdir:
-            from uuid import uuid4
+        # Create chunks with embeddings
+        chunks = []
+        for i, (text, embedding) in enumerate(zip(texts, embeddings)):
+            chunk = Chunk(
+                id=str(uuid4()),
+                document_id=str(uuid4()),
+                text=text,
+                chunk_index=i,
+                start_char=i * 100,
+                end_char=(i + 1) * 100,
+                embedding=embedding,
+            )
+            chunks.append(chunk)
 
-            from docprocessor.models.chunk import Chunk
+        vector_store.add_chunks(chunks)
 
-            vector_store = VectorStore(
-                collection_name="integration_test", persist_directory=Path(tmpdir)
-            )
+        # Search with first embedding - should find itself
+        results = vector_store.search(embeddings[0], n_results=1)
 
-            # Create chunks with embeddings
-            chunks = []
-            for i, (text, embedding) in enumerate(zip(texts, embeddings)):
-                chunk = Chunk(
-                    id=str(uuid4()),
-                    document_id=str(uuid4()),
-                    text=text,
-                    chunk_index=i,
-                    start_char=i * 100,
-                    end_char=(i + 1) * 100,
-                    embedding=embedding.tolist(),
-                )
-                chunks.append(chunk)
-
-            vector_store.add_chunks(chunks)
-
-            # Search with first embedding - should find itself
-            results = vector_store.search(embeddings[0], n_results=1)
-
-            assert len(results) == 1
-            assert results[0]["text"] == texts[0]
+        assert len(results) == 1
+        assert results[0]["text"] == texts[0]
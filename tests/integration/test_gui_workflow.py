@@ -1,21 +1,42 @@
 """Integration tests for GUI workflows."""
 
-from unittest.mock import patch
-
 import pytest
 
 
+@pytest.fixture(scope="class")
+def shared_window(qapp):
+    """Main window built once per test class; building one dominates these tests."""
+    from docprocessor.gui.main_window import DocumentProcessorWindow
+
+    window = DocumentProcessorWindow()
+    yield window
+    window.deleteLater()
+
+
+@pytest.fixture
+def readonly_window(shared_window):
+    """The class's shared main window with its transient UI state reset.
+
+    Resets the current tab, progress bar and status text. Only for tests that
+    leave no lasting changes (signal connections, documents, themes).
+    """
+    shared_window.tabs.setCurrentIndex(0)
+    shared_window.progress_bar.setValue(0)
+    shared_window.progress_bar.setVisible(False)
+    shared_window.status_label.setText("")
+    shared_window.status_label.setStyleSheet("padding: 5px;")
+    return shared_window
+
+
 @pytest.mark.integration
 @pytest.mark.gui
 class TestGUIWorkflow:
     """Test GUI workflow integration."""
 
     @pytest.mark.wip  # Skip in CI - button state assertion issue
-    def test_main_window_initial_state(self, qapp):
+    def test_main_window_initial_state(self, readonly_window):
         """Test main window initial state."""
-        from docprocessor.gui.main_window import DocumentProcessorWindow
-
-        window = DocumentProcessorWindow()
+        window = readonly_window
 
         # Check initial button states
         assert not window.discover_btn.isEnabled()  # No processed data
@@ -75,11 +96,9 @@ class TestGUIWorkflow:
         # Synthesis should now be enabled
         assert window.synthesis_config.synthesize_btn.isEnabled()
 
-    def test_synthesis_config_get_config(self, qapp):
+    def test_synthesis_config_get_config(self, readonly_window):
         """Test synthesis configuration retrieval."""
-        from docprocessor.gui.main_window import DocumentProcessorWindow
-
-        window = DocumentProcessorWindow()
+        window = readonly_window
         config = window.synthesis_config.get_config()
 
         assert "synthesis_level" in config
@@ -87,21 +106,14 @@ class TestGUIWorkflow:
         assert "output_format" in config
         assert "include_citations" in config
 
-    def test_progress_bar_visibility(self, qapp):
+    def test_progress_bar_visibility(self, readonly_window):
         """Test progress bar visibility state."""
-        from docprocessor.gui.main_window import DocumentProcessorWindow
-
-        window = DocumentProcessorWindow()
+        window = readonly_window
 
         # Initially hidden
         assert not window.progress_bar.isVisible()
 
-    @patch("docprocessor.gui.workers.DocumentProcessor")
-    @patch("docprocessor.gui.workers.VectorStore")
-    @patch("docprocessor.gui.workers.Embedder")
-    def test_processing_worker_creation(
-        self, mock_embedder, mock_vector_store, mock_processor, qapp
-    ):
+    def test_processing_worker_creation(self, qapp):
         """Test that processing worker can be created."""
         from docprocessor.gui.workers import DocumentProcessingWorker
 
@@ -110,8 +122,7 @@ class TestGUIWorkflow:
         assert worker is not None
         assert worker.document_paths == ["/path/to/doc.pdf"]
 
-    @patch("docprocessor.gui.workers.ThemeAnalyzer")
-    def test_theme_worker_creation(self, mock_analyzer, qapp):
+    def test_theme_worker_creation(self, qapp):
         """Test that theme discovery worker can be created."""
         from docprocessor.gui.workers import ThemeDiscoveryWorker
 
@@ -120,8 +131,7 @@ class TestGUIWorkflow:
         assert worker is not None
         assert worker.num_themes == 5
 
-    @patch("docprocessor.gui.workers.SynthesisEngine")
-    def test_synthesis_worker_creation(self, mock_engine, qapp):
+    def test_synthesis_worker_creation(self, qapp):
         """Test that synthesis worker can be created."""
         from docprocessor.gui.workers import SynthesisWorker
 
@@ -135,17 +145,39 @@ class TestGUIWorkflow:
         assert worker is not None
         assert worker.synthesis_level == "normal"
 
+    def test_workers_import_without_pipeline_stack(self):
+        """Test importing the workers loads no pipeline component.
+
+        This is what lets the worker-creation tests above run without patching.
+        """
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, docprocessor.gui.workers; "
+            "print(sorted(m for m in sys.modules if m.startswith('docprocessor.core.')))"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+
+        assert result.stdout.strip() == "[]"
+
 
 @pytest.mark.integration
 @pytest.mark.gui
 class TestGUIStateManagement:
     """Test GUI state management."""
 
-    def test_tab_navigation(self, qapp):
+    def test_tab_navigation(self, readonly_window):
         """Test switching between tabs."""
-        from docprocessor.gui.main_window import DocumentProcessorWindow
-
-        window = DocumentProcessorWindow()
+        window = readonly_window
 
         # Switch to themes tab
         window.tabs.setCurrentIndex(1)
@@ -171,11 +203,9 @@ class TestGUIStateManagement:
         window.files_widget.documents_changed.emit(window.files_widget.documents)
         assert not window.figure_extraction_widget.extract_btn.isEnabled()
 
-    def test_status_bar_updates(self, qapp):
+    def test_status_bar_updates(self, readonly_window):
         """Test status bar message updates."""
-        from docprocessor.gui.main_window import DocumentProcessorWindow
-
-        window = DocumentProcessorWindow()
+        window = readonly_window
 
         # Check initial message shows project stats
         initial_message = window.statusBar().currentMessage()
@@ -1,10 +1,16 @@
 """Integration tests for language detection throughout the pipeline."""
 
+import os
 from unittest.mock import Mock
 
 import pytest
 
-pytestmark = pytest.mark.wip  # Skip in CI - setup issues
+# Skip in CI - setup issues. Skipped before any fixture is set up; docprocessor
+# modules are only imported inside the tests, so collection stays cheap too.
+pytestmark = [
+    pytest.mark.wip,
+    pytest.mark.skipif(not os.environ.get("RUN_WIP"), reason="work in progress; set RUN_WIP=1"),
+]
 
 
 @pytest.mark.integration
@@ -1,9 +1,8 @@
 """Integration tests for multi-project workflow."""
 
-import shutil
-import tempfile
+import copy
+import dataclasses
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
@@ -11,23 +10,51 @@ from docprocessor.core.project_manager import ProjectManager
 from docprocessor.models.project import DocumentInfo, TaskExecutionRecord
 
 
-@pytest.fixture
-def temp_data_dir():
-    """Create a temporary data directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+@pytest.fixture(scope="module")
+def sample_docs():
+    """Documents doc0..doc4 (/test/docN.pdf, "Document N", 1000 * (N + 1) bytes).
+
+    Shared by the module's tests: add copies (copy.copy or dataclasses.replace)
+    to projects, never the shared instances.
+    """
+    return tuple(
+        DocumentInfo(
+            id=f"doc{i}",
+            file_path=f"/test/doc{i}.pdf",
+            title=f"Document {i}",
+            file_size=1000 * (i + 1),
+        )
+        for i in range(5)
+    )
+
+
+def _snapshot(manager):
+    """All projects of ``manager``, archived ones included, keyed by id."""
+    return {project.id: project for project in manager.list_projects(include_archived=True)}
+
+
+@pytest.fixture(scope="module")
+def disk_project_manager(tmp_path_factory):
+    """ProjectManager with temporary storage, shared by the module's tests.
+
+    Every project gets a fresh UUID, so tests stay isolated as long as they only
+    look at projects they created themselves.
+    """
+    return ProjectManager(projects_dir=tmp_path_factory.mktemp("projects"))
 
 
 @pytest.fixture
-def project_manager(temp_data_dir):
-    """Create a ProjectManager with temporary storage."""
-    return ProjectManager(projects_dir=temp_data_dir)
+def project_manager(request, in_memory_project_manager):
+    """Disk-backed manager for tests marked persistence, in-memory for the rest."""
+    if request.node.get_closest_marker("persistence"):
+        return request.getfixturevalue("disk_project_manager")
+    return in_memory_project_manager
 
 
 class TestMultiProjectWorkflow:
     """Integration tests for complete multi-project workflows."""
 
+    @pytest.mark.persistence
     def test_create_project_add_documents_workflow(self, project_manager):
         """Test creating a project and adding documents."""
         # Create project
@@ -59,6 +86,7 @@ class TestMultiProjectWorkflow:
         assert loaded.documents[0].title == "Paper 1"
         assert loaded.documents[1].title == "Paper 2"
 
+    @pytest.mark.persistence
     def test_project_switching_workflow(self, project_manager):
         """Test switching between multiple projects."""
         # Create multiple projects
@@ -90,20 +118,15 @@ class TestMultiProjectWorkflow:
         # Verify they're independent
         assert loaded1.id != loaded2.id
 
-    def test_document_modification_workflow(self, project_manager):
+    @pytest.mark.persistence
+    def test_document_modification_workflow(self, project_manager, sample_docs):
         """Test adding and removing documents from a project."""
         # Create project
         project = project_manager.create_project(name="Test Project")
 
         # Add multiple documents
-        for i in range(5):
-            doc = DocumentInfo(
-                id=f"doc{i}",
-                file_path=f"/path/doc{i}.pdf",
-                title=f"Document {i}",
-                file_size=1000 * (i + 1),
-            )
-            project.add_document(doc)
+        for doc in sample_docs:
+            project.add_document(copy.copy(doc))
 
         assert len(project.documents) == 5
         project_manager.save_project(project)
@@ -126,6 +149,7 @@ class TestMultiProjectWorkflow:
         assert "doc1" not in doc_ids
         assert "doc3" not in doc_ids
 
+    @pytest.mark.persistence
     def test_project_settings_modification_workflow(self, project_manager):
         """Test modifying project settings."""
         # Create project with default settings
@@ -155,6 +179,7 @@ class TestMultiProjectWorkflow:
         assert loaded.settings.include_citations is True
         assert loaded.settings.citation_style == "APA"
 
+    @pytest.mark.persistence
     def test_task_history_workflow(self, project_manager):
         """Test adding and retrieving task execution records."""
         # Create project
@@ -254,21 +279,15 @@ class TestMultiProjectWorkflow:
         assert loaded.notes == "Important research project"
         assert loaded.color == "#FF5733"
 
-    def test_project_statistics_workflow(self, project_manager):
+    def test_project_statistics_workflow(self, project_manager, sample_docs):
         """Test project statistics calculation."""
         # Create project
         project = project_manager.create_project(name="Stats Test")
 
         # Add documents
-        for i in range(3):
-            doc = DocumentInfo(
-                id=f"doc{i}",
-                file_path=f"/path/{i}.pdf",
-                title=f"Doc {i}",
-                file_size=1000,
-                processed=(i < 2),  # First 2 are processed
-            )
-            project.add_document(doc)
+        for i, doc in enumerate(sample_docs[:3]):
+            # First 2 are processed
+            project.add_document(dataclasses.replace(doc, processed=(i < 2)))
 
         # Add themes
         project.set_themes([{"label": f"Theme {i}"} for i in range(4)])
@@ -332,7 +351,9 @@ class TestMultiProjectWorkflow:
         not_found = loaded.get_document_by_path("/nonexistent/path.pdf")
         assert not_found is None
 
-    def test_complete_project_lifecycle(self, project_manager):
+    @pytest.mark.slow
+    @pytest.mark.persistence
+    def test_complete_project_lifecycle(self, project_manager, sample_docs):
         """Test complete project lifecycle from creation to archive."""
         # 1. Create project
         project = project_manager.create_project(
@@ -344,14 +365,8 @@ class TestMultiProjectWorkflow:
         project.settings.llm_model = "mistral:latest"
 
         # 3. Add documents
-        for i in range(3):
-            doc = DocumentInfo(
-                id=f"doc{i}",
-                file_path=f"/test/doc{i}.pdf",
-                title=f"Document {i}",
-                file_size=1000 * (i + 1),
-            )
-            project.add_document(doc)
+        for doc in sample_docs[:3]:
+            project.add_document(copy.copy(doc))
 
         # 4. Add themes
         project.set_themes([{"label": "Chapter 1"}, {"label": "Chapter 2"}])
@@ -399,7 +414,9 @@ class TestMultiProjectWorkflow:
         loaded = project_manager.load_project(project.id)
         assert loaded is None
 
-    def test_project_duplication_workflow(self, project_manager):
+    @pytest.mark.slow
+    @pytest.mark.persistence
+    def test_project_duplication_workflow(self, project_manager, sample_docs):
         """Test duplicating a project with all its data."""
         # Create original project with full setup
         original = project_manager.create_project(
@@ -411,15 +428,8 @@ class TestMultiProjectWorkflow:
         )
 
         # Add documents
-        for i in range(3):
-            doc = DocumentInfo(
-                id=f"doc{i}",
-                file_path=f"/test/doc{i}.pdf",
-                title=f"Paper {i}",
-                file_size=1000 * (i + 1),
-                processed=True,
-            )
-            original.add_document(doc)
+        for doc in sample_docs[:3]:
+            original.add_document(dataclasses.replace(doc, processed=True))
 
         # Add themes
         original.set_themes([{"label": "Theme 1", "id": "t1"}, {"label": "Theme 2", "id": "t2"}])
@@ -453,7 +463,7 @@ class TestMultiProjectWorkflow:
 
         # Documents should be copied
         assert len(duplicate.documents) == 3
-        assert duplicate.documents[0].title == "Paper 0"
+        assert duplicate.documents[0].title == "Document 0"
 
         # Themes should be copied
         assert len(duplicate.themes) == 2
@@ -471,6 +481,7 @@ class TestMultiProjectWorkflow:
         assert loaded is not None
         assert loaded.name == "Research Copy"
 
+    @pytest.mark.persistence
     def test_project_rename_workflow(self, project_manager):
         """Test renaming a project."""
         # Create project
@@ -493,6 +504,8 @@ class TestMultiProjectWorkflow:
         assert loaded.name == "New Project Name"  # Name changed
         assert len(loaded.documents) == 1  # Data intact
 
+    @pytest.mark.slow
+    @pytest.mark.persistence
     def test_bulk_archive_restore_workflow(self, project_manager):
         """Test archiving and restoring multiple projects."""
         # Create 5 projects
@@ -509,15 +522,10 @@ class TestMultiProjectWorkflow:
         for proj_id in ids_to_archive:
             assert results[proj_id] is True
 
-        # Verify archived
-        for i in range(3):
-            loaded = project_manager.load_project(projects[i].id)
-            assert loaded.is_archived is True
-
-        # Verify others not archived
-        for i in range(3, 5):
-            loaded = project_manager.load_project(projects[i].id)
-            assert loaded.is_archived is False
+        # Verify archived, others not archived
+        snapshot = _snapshot(project_manager)
+        for i in range(5):
+            assert snapshot[projects[i].id].is_archived is (i < 3)
 
         # Restore first 2 archived projects
         ids_to_restore = [projects[0].id, projects[1].id]
@@ -527,26 +535,22 @@ class TestMultiProjectWorkflow:
         for proj_id in ids_to_restore:
             assert results[proj_id] is True
 
-        # Verify restored
-        for i in range(2):
-            loaded = project_manager.load_project(projects[i].id)
-            assert loaded.is_archived is False
-
-        # Third one still archived
-        loaded = project_manager.load_project(projects[2].id)
-        assert loaded.is_archived is True
+        # Verify restored; third one still archived
+        snapshot = _snapshot(project_manager)
+        assert snapshot[projects[0].id].is_archived is False
+        assert snapshot[projects[1].id].is_archived is False
+        assert snapshot[projects[2].id].is_archived is True
 
-    def test_bulk_delete_workflow(self, project_manager):
+    @pytest.mark.slow
+    @pytest.mark.persistence
+    def test_bulk_delete_workflow(self, project_manager, sample_docs):
         """Test permanently deleting multiple projects."""
         # Create 4 projects
         projects = []
         for i in range(4):
             proj = project_manager.create_project(name=f"Delete Test {i}")
             # Add some data to make it realistic
-            doc = DocumentInfo(
-                id=f"doc{i}", file_path=f"/test{i}.pdf", title=f"Doc {i}", file_size=1000
-            )
-            proj.add_document(doc)
+            proj.add_document(copy.copy(sample_docs[i]))
             project_manager.save_project(proj)
             projects.append(proj)
 
@@ -558,17 +562,15 @@ class TestMultiProjectWorkflow:
         for proj_id in ids_to_delete:
             assert results[proj_id] is True
 
-        # Verify deleted
+        # Verify deleted, others still exist
+        snapshot = _snapshot(project_manager)
         for i in range(2):
-            loaded = project_manager.load_project(projects[i].id)
-            assert loaded is None
-
-        # Verify others still exist
+            assert projects[i].id not in snapshot
         for i in range(2, 4):
-            loaded = project_manager.load_project(projects[i].id)
-            assert loaded is not None
-            assert loaded.name == f"Delete Test {i}"
+            assert snapshot[projects[i].id].name == f"Delete Test {i}"
 
+    @pytest.mark.slow
+    @pytest.mark.persistence
     def test_mixed_bulk_operations_workflow(self, project_manager):
         """Test bulk operations with some failures."""
         # Create 3 real projects
@@ -585,12 +587,8 @@ class TestMultiProjectWorkflow:
         assert results["fake-id-1"] is False
         assert results["fake-id-2"] is False
 
-        # Verify real ones were archived
-        loaded_p1 = project_manager.load_project(p1.id)
-        loaded_p2 = project_manager.load_project(p2.id)
-        assert loaded_p1.is_archived is True
-        assert loaded_p2.is_archived is True
-
-        # p3 unaffected
-        loaded_p3 = project_manager.load_project(p3.id)
-        assert loaded_p3.is_archived is False
+        # Verify real ones were archived, p3 unaffected
+        snapshot = _snapshot(project_manager)
+        assert snapshot[p1.id].is_archived is True
+        assert snapshot[p2.id].is_archived is True
+        assert snapshot[p3.id].is_archived is False
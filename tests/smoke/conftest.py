@@ -0,0 +1,43 @@
+"""Shared fixtures for smoke tests.
+
+Backend components are built once per session; the smoke tests only check that
+construction works, so there is no need to pay for it per test. The embedder
+comes from the root conftest.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def ollama_client():
+    """OllamaClient built without contacting an Ollama server."""
+    from docprocessor.llm.ollama_client import OllamaClient
+
+    with patch("docprocessor.llm.ollama_client.ollama"):
+        return OllamaClient()
+
+
+@pytest.fixture(scope="session")
+def prompt_manager():
+    """PromptManager using the bundled prompts."""
+    from docprocessor.llm.prompt_manager import PromptManager
+
+    return PromptManager()
+
+
+@pytest.fixture(scope="session")
+def doc_processor():
+    """DocumentProcessor with default settings."""
+    from docprocessor.core.document_processor import DocumentProcessor
+
+    return DocumentProcessor()
+
+
+@pytest.fixture(scope="session")
+def output_formatter():
+    """OutputFormatter writing to the default output directory."""
+    from docprocessor.core.output_formatter import OutputFormatter
+
+    return OutputFormatter()
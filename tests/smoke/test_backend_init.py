@@ -9,11 +9,8 @@ import pytest
 class TestBackendInitialization:
     """Test that backend components can be initialized."""
 
-    def test_embedder_init(self):
+    def test_embedder_init(self, embedder):
         """Test Embedder initialization."""
-        from docprocessor.core.embedder import Embedder
-
-        embedder = Embedder()
         assert embedder is not None
         assert embedder.model is not None
 
@@ -26,37 +23,24 @@ class TestBackendInitialization:
         vector_store = VectorStore(collection_name="test", persist_directory=temp_dir)
         assert vector_store is not None
 
-    @patch("docprocessor.llm.ollama_client.ollama")
-    def test_ollama_client_init(self, mock_ollama):
+    def test_ollama_client_init(self, ollama_client):
         """Test OllamaClient initialization."""
-        from docprocessor.llm.ollama_client import OllamaClient
-
-        client = OllamaClient()
-        assert client is not None
-        assert client.model is not None
+        assert ollama_client is not None
+        assert ollama_client.model is not None
 
-    def test_prompt_manager_init(self):
+    def test_prompt_manager_init(self, prompt_manager):
         """Test PromptManager initialization."""
-        from docprocessor.llm.prompt_manager import PromptManager
-
-        manager = PromptManager()
-        assert manager is not None
-        assert manager.prompts is not None
+        assert prompt_manager is not None
+        assert prompt_manager.prompts is not None
 
-    def test_document_processor_init(self):
+    def test_document_processor_init(self, doc_processor):
         """Test DocumentProcessor initialization."""
-        from docprocessor.core.document_processor import DocumentProcessor
+        assert doc_processor is not None
 
-        processor = DocumentProcessor()
-        assert processor is not None
-
-    def test_output_formatter_init(self):
+    def test_output_formatter_init(self, output_formatter):
         """Test OutputFormatter initialization."""
-        from docprocessor.core.output_formatter import OutputFormatter
-
-        formatter = OutputFormatter()
-        assert formatter is not None
-        assert formatter.output_dir.exists()
+        assert output_formatter is not None
+        assert output_formatter.output_dir.exists()
 
 
 @pytest.mark.smoke
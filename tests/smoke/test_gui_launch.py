@@ -3,16 +3,24 @@
 import pytest
 
 
+@pytest.fixture(scope="module")
+def main_window(qapp):
+    """Main window shared by the module; the tests below only read from it."""
+    from docprocessor.gui.main_window import DocumentProcessorWindow
+
+    window = DocumentProcessorWindow()
+    yield window
+    window.deleteLater()
+
+
 @pytest.mark.smoke
 @pytest.mark.gui
 class TestGUILaunch:
     """Test that GUI components can be initialized."""
 
-    def test_main_window_init(self, qapp):
+    def test_main_window_init(self, main_window):
         """Test main window initialization."""
-        from docprocessor.gui.main_window import DocumentProcessorWindow
-
-        window = DocumentProcessorWindow()
+        window = main_window
         assert window is not None
         # Window title now includes current project name and app name
         assert "Hrisa Docs" in window.windowTitle()
@@ -55,11 +63,9 @@ class TestGUILaunch:
 class TestGUIComponents:
     """Test GUI component structure."""
 
-    def test_main_window_has_tabs(self, qapp):
+    def test_main_window_has_tabs(self, main_window):
         """Test main window has all tabs."""
-        from docprocessor.gui.main_window import DocumentProcessorWindow
-
-        window = DocumentProcessorWindow()
+        window = main_window
         assert window.tabs is not None
         assert window.tabs.count() == 5  # 5 tabs (added figure extraction)
 
@@ -68,33 +74,27 @@ class TestGUIComponents:
         # Just check that we have the expected number of tabs
         assert len(tab_titles) == 5
 
-    def test_main_window_has_widgets(self, qapp):
+    def test_main_window_has_widgets(self, main_window):
         """Test main window has required widgets."""
-        from docprocessor.gui.main_window import DocumentProcessorWindow
-
-        window = DocumentProcessorWindow()
+        window = main_window
         assert hasattr(window, "files_widget")
         assert hasattr(window, "theme_editor")
         assert hasattr(window, "synthesis_config")
         assert hasattr(window, "progress_bar")
         assert hasattr(window, "figure_extraction_widget")
 
-    def test_main_window_has_menubar(self, qapp):
+    def test_main_window_has_menubar(self, main_window):
         """Test main window has menubar."""
-        from docprocessor.gui.main_window import DocumentProcessorWindow
-
-        window = DocumentProcessorWindow()
+        window = main_window
         menubar = window.menuBar()
         assert menubar is not None
 
         actions = menubar.actions()
         assert len(actions) > 0
 
-    def test_main_window_has_statusbar(self, qapp):
+    def test_main_window_has_statusbar(self, main_window):
         """Test main window has statusbar."""
-        from docprocessor.gui.main_window import DocumentProcessorWindow
-
-        window = DocumentProcessorWindow()
+        window = main_window
         statusbar = window.statusBar()
         assert statusbar is not None
         # Status bar now shows project statistics
@@ -0,0 +1,59 @@
+"""Unit tests for the Chapter model."""
+
+from uuid import uuid4
+
+from docprocessor.models.chapter import Chapter
+
+
+class TestChapterCitations:
+    """Test citation de-duplication."""
+
+    def test_add_citation_skips_duplicates(self):
+        """Test the same document/page pair is only recorded once."""
+        chapter = Chapter(theme_id=uuid4(), title="Intro", chapter_number=1)
+
+        chapter.add_citation("doc-1", page=3)
+        chapter.add_citation("doc-1", page=3)
+        chapter.add_citation("doc-1")
+        chapter.add_citation("doc-1")
+        chapter.add_citation("doc-2", page=3)
+
+        assert chapter.citations == [
+            {"document_id": "doc-1", "page": "3"},
+            {"document_id": "doc-1"},
+            {"document_id": "doc-2", "page": "3"},
+        ]
+
+    def test_constructor_citations_are_indexed(self):
+        """Test citations passed at construction are seen as duplicates."""
+        chapter = Chapter(
+            theme_id=uuid4(),
+            title="Intro",
+            chapter_number=1,
+            citations=[{"document_id": "doc-1", "page": "7"}],
+        )
+
+        chapter.add_citation("doc-1", page=7)
+
+        assert len(chapter.citations) == 1
+
+    def test_citations_edited_directly_are_reindexed(self):
+        """Test clearing, reassigning or copying citations does not leave a stale index."""
+        chapter = Chapter(theme_id=uuid4(), title="Intro", chapter_number=1)
+        chapter.add_citation("doc-1", page=3)
+
+        chapter.citations.clear()
+        chapter.add_citation("doc-1", page=3)
+        assert chapter.citations == [{"document_id": "doc-1", "page": "3"}]
+
+        chapter.citations = [{"document_id": "doc-2"}]
+        chapter.add_citation("doc-1", page=3)
+        chapter.add_citation("doc-2")
+        assert chapter.citations == [
+            {"document_id": "doc-2"},
+            {"document_id": "doc-1", "page": "3"},
+        ]
+
+        copy = chapter.model_copy(update={"citations": []})
+        copy.add_citation("doc-2")
+        assert copy.citations == [{"document_id": "doc-2"}]
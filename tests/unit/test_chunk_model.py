@@ -0,0 +1,50 @@
+"""Unit tests for the Chunk model."""
+
+from uuid import uuid4
+
+import numpy as np
+
+from docprocessor.models.chunk import Chunk
+
+
+def make_chunk(**kwargs) -> Chunk:
+    """Create a chunk with required fields filled in."""
+    defaults = dict(document_id=uuid4(), text="text", chunk_index=0, start_char=0, end_char=4)
+    defaults.update(kwargs)
+    return Chunk(**defaults)
+
+
+class TestChunkEmbedding:
+    """Test packed float32 embedding storage."""
+
+    def test_embedding_defaults_to_none(self):
+        """Test chunks start without an embedding."""
+        chunk = make_chunk()
+        assert chunk.embedding is None
+        assert chunk.embedding_array is None
+
+    def test_list_embedding_is_packed(self):
+        """Test a list embedding is stored as float32 bytes."""
+        chunk = make_chunk(embedding=[0.5, -1.0, 2.0])
+
+        assert isinstance(chunk.embedding, bytes)
+        assert len(chunk.embedding) == 3 * 4
+        np.testing.assert_array_equal(chunk.embedding_array, [0.5, -1.0, 2.0])
+        assert chunk.embedding_array.dtype == np.float32
+
+    def test_assigned_array_embedding_is_packed(self):
+        """Test assigning a numpy array after construction packs it too."""
+        chunk = make_chunk()
+        chunk.embedding = np.arange(4, dtype=np.float64)
+
+        assert isinstance(chunk.embedding, bytes)
+        np.testing.assert_array_equal(chunk.embedding_array, [0.0, 1.0, 2.0, 3.0])
+
+    def test_json_round_trip(self):
+        """Test chunks with embeddings survive model_dump_json/model_validate_json."""
+        chunk = make_chunk(embedding=[0.1, 0.2, -1.5])
+
+        restored = Chunk.model_validate_json(chunk.model_dump_json())
+
+        assert restored == chunk
+        np.testing.assert_array_equal(restored.embedding_array, chunk.embedding_array)
@@ -0,0 +1,112 @@
+"""Unit tests for CredentialsManager."""
+
+import keyring
+import pytest
+from keyring.backend import KeyringBackend
+from keyring.errors import PasswordDeleteError
+
+from docprocessor.utils.credentials_manager import CredentialsManager
+
+
+class InMemoryKeyring(KeyringBackend):
+    """Keyring backend that keeps passwords in a dict and counts reads."""
+
+    priority = 1
+
+    def __init__(self):
+        super().__init__()
+        self.passwords = {}
+        self.reads = 0
+
+    def get_password(self, service, username):
+        self.reads += 1
+        return self.passwords.get((service, username))
+
+    def set_password(self, service, username, password):
+        self.passwords[(service, username)] = password
+
+    def delete_password(self, service, username):
+        if self.passwords.pop((service, username), None) is None:
+            raise PasswordDeleteError(username)
+
+
+@pytest.fixture
+def backend():
+    """Install an in-memory keyring for the duration of a test."""
+    previous = keyring.get_keyring()
+    memory = InMemoryKeyring()
+    keyring.set_keyring(memory)
+    yield memory
+    keyring.set_keyring(previous)
+
+
+@pytest.fixture
+def manager(backend):
+    """Fresh CredentialsManager instance, bypassing the singleton."""
+    CredentialsManager._instance = None
+    yield CredentialsManager()
+    CredentialsManager._instance = None
+
+
+class TestCredentialsManager:
+    """Test credential storage and caching."""
+
+    def test_save_and_load(self, manager):
+        """Test saved credentials can be loaded back."""
+        assert manager.load_google_credentials() is None
+        assert manager.save_google_credentials("key", "engine")
+        assert manager.load_google_credentials() == ("key", "engine")
+
+    def test_load_is_cached(self, manager, backend):
+        """Test repeat loads within the TTL skip the keyring."""
+        manager.save_google_credentials("key", "engine")
+        manager.load_google_credentials()
+        reads = backend.reads
+
+        assert manager.load_google_credentials() == ("key", "engine")
+        assert backend.reads == reads
+
+    def test_cache_expires(self, manager, backend):
+        """Test the keyring is queried again once the TTL has elapsed."""
+        manager.save_google_credentials("key", "engine")
+        manager.load_google_credentials()
+        reads = backend.reads
+
+        manager._cache_ts -= manager.CACHE_TTL_SECONDS
+        manager.load_google_credentials()
+        assert backend.reads > reads
+
+    def test_clear_invalidates_cache(self, manager):
+        """Test clearing credentials drops the cached copy."""
+        manager.save_google_credentials("key", "engine")
+        manager.load_google_credentials()
+
+        assert manager.clear_google_credentials()
+        assert manager.load_google_credentials() is None
+
+    def test_backend_resolved_once(self, manager, backend, monkeypatch):
+        """Test the keyring backend is resolved at construction, not per call."""
+
+        def fail():
+            raise AssertionError("get_keyring should not be called again")
+
+        monkeypatch.setattr(keyring, "get_keyring", fail)
+        assert manager.is_keyring_available()
+        assert manager.save_google_credentials("key", "engine")
+
+    def test_unavailable_keyring(self, backend, monkeypatch):
+        """Test operations fail gracefully when no backend can be resolved."""
+
+        def fail():
+            raise RuntimeError("no backend")
+
+        monkeypatch.setattr(keyring, "get_keyring", fail)
+        CredentialsManager._instance = None
+        try:
+            manager = CredentialsManager()
+            assert not manager.is_keyring_available()
+            assert manager.save_google_credentials("key", "engine") is False
+            assert manager.load_google_credentials() is None
+            assert manager.clear_google_credentials() is False
+        finally:
+            CredentialsManager._instance = None
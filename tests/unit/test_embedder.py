@@ -102,6 +102,14 @@ class TestEmbedder:
         norm = np.linalg.norm(embedding)
         assert np.isclose(norm, 1.0, rtol=0.1)
 
+    def test_embed_batch_normalize(self, embedder):
+        """Test normalize=True returns unit-length embeddings."""
+        texts = ["Contract law principles", "Statutory analysis"]
+
+        embeddings = embedder.embed_batch(texts, show_progress=False, normalize=True)
+
+        np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, rtol=1e-5)
+
     def test_large_batch(self, embedder):
         """Test embedding a large batch of texts."""
         texts = [f"Legal document number {i} about various topics" for i in range(100)]
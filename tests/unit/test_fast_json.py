@@ -0,0 +1,42 @@
+"""Unit tests for the optional-orjson JSON helpers."""
+
+import json
+
+import pytest
+
+from docprocessor.models.extracted_figure import FigureType
+from docprocessor.utils import fast_json
+
+DATA = {"name": "Projet é", "tags": ["a", "b"], "counts": {FigureType.NUMBER: 2}}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(fast_json, "orjson", None)
+    elif not fast_json.has_orjson():
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestFastJson:
+    """Test both encoders produce the same JSON."""
+
+    def test_round_trip(self, encoder):
+        """Test dumps/loads round-trip, with str-enum keys written by value."""
+        raw = fast_json.dumps(DATA)
+
+        assert isinstance(raw, bytes)
+        assert fast_json.loads(raw) == {**DATA, "counts": {"number": 2}}
+        assert "é" in raw.decode("utf-8")
+
+    def test_indent(self, encoder):
+        """Test indented output matches the stdlib's two-space layout."""
+        data = {"a": [1, 2], "b": {"c": None}}
+
+        assert fast_json.dumps(data, indent=True).decode() == json.dumps(data, indent=2)
+
+    def test_default(self, encoder):
+        """Test the default hook handles otherwise unsupported objects."""
+        assert fast_json.loads(fast_json.dumps({"x": {1, 2}}, default=sorted)) == {"x": [1, 2]}
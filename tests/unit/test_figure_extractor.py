@@ -236,5 +236,79 @@ class TestFigureModel:
         assert fig.currency_code == "EUR"
         assert fig.year == 2025
 
+    def test_result_lookup_indexes(self):
+        """Test type/year lookups on FigureExtractionResult."""
+        from docprocessor.models.extracted_figure import ExtractedFigure, FigureExtractionResult
+
+        figures = [
+            ExtractedFigure(value="€10", figure_type=FigureType.CURRENCY, year=2024),
+            ExtractedFigure(value="5%", figure_type=FigureType.PERCENTAGE, year=2024),
+            ExtractedFigure(value="€20", figure_type=FigureType.CURRENCY, year=2025),
+        ]
+        result = FigureExtractionResult(document_path="doc.txt", figures=figures)
+
+        assert result.figures_by_type == {"currency": 2, "percentage": 1}
+        assert result.get_figures_by_type(FigureType.CURRENCY) == [figures[0], figures[2]]
+        assert result.get_figures_by_type(FigureType.DATE) == []
+        assert result.get_figures_with_year(2024) == figures[:2]
+        assert result.get_figures_with_year(1999) == []
+        assert "_by_type" not in result.to_dict()
+
+        # Indexes follow the figures list after update_statistics()
+        result.figures = figures[:1]
+        result.update_statistics()
+        assert result.total_figures == 1
+        assert result.get_figures_with_year(2025) == []
+
+    def test_result_round_trip(self):
+        """Test FigureExtractionResult.to_dict/from_dict round trip."""
+        from docprocessor.models.extracted_figure import ExtractedFigure, FigureExtractionResult
+
+        figures = [
+            ExtractedFigure(value="€10", figure_type=FigureType.CURRENCY, currency_code="EUR"),
+            ExtractedFigure(value="5%", figure_type=FigureType.PERCENTAGE, unit="%", year=2024),
+        ]
+        result = FigureExtractionResult(document_path="doc.txt", figures=figures, tables_parsed=2)
+
+        restored = FigureExtractionResult.from_dict(result.to_dict())
+        assert restored == result
+        assert restored.figures_by_type == {"currency": 1, "percentage": 1}
+        assert restored.get_figures_with_year(2024) == [figures[1]]
+
+    def test_result_from_dict_ignores_unknown_keys(self):
+        """Test extra figure keys are ignored, as ExtractedFigure.from_dict does."""
+        from docprocessor.models.extracted_figure import ExtractedFigure, FigureExtractionResult
+
+        record = ExtractedFigure(value="5%", figure_type=FigureType.PERCENTAGE).to_dict()
+        record["extra_col"] = "ignored"
+
+        restored = FigureExtractionResult.from_dict(
+            {"document_path": "doc.txt", "figures": [record]}
+        )
+        assert restored.figures == [ExtractedFigure.from_dict(record)]
+
+    def test_result_to_json_bytes(self):
+        """Test JSON bytes serialization matches to_dict()."""
+        import json
+
+        from docprocessor.models.extracted_figure import ExtractedFigure, FigureExtractionResult
+
+        figures = [
+            ExtractedFigure(value="€10", figure_type=FigureType.CURRENCY, currency_code="EUR"),
+            ExtractedFigure(value="5%", figure_type=FigureType.PERCENTAGE, unit="%", year=2024),
+        ]
+        result = FigureExtractionResult(document_path="doc.txt", figures=figures)
+
+        assert json.loads(result.to_json_bytes()) == result.to_dict()
+        assert json.loads(figures[0].to_json_bytes()) == figures[0].to_dict()
+
+    def test_figure_type_is_string(self):
+        """Test FigureType members behave as their string values."""
+        assert isinstance(FigureType.CURRENCY, str)
+        assert FigureType.CURRENCY == "currency"
+        assert str(FigureType.CURRENCY) == "currency"
+        assert f"{FigureType.DATE}" == "date"
+        assert {FigureType.PERCENTAGE: 1}.get("percentage") == 1
+
 
 # Run tests with: pytest tests/unit/test_figure_extractor.py -v
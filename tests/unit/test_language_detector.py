@@ -0,0 +1,93 @@
+"""Unit tests for LanguageDetector."""
+
+from docprocessor.utils.language_detector import LanguageDetector
+
+FRENCH_TEXT = (
+    "Le budget de l'État est présenté dans le rapport annuel. Les dépenses de la "
+    "fonction publique sont en hausse pour une meilleure qualité des services."
+)
+ENGLISH_TEXT = (
+    "The annual report of the ministry is published in the spring. It describes the "
+    "budget and the spending that was approved for the year."
+)
+
+
+class TestDetectLanguage:
+    """Test marker-word based detection."""
+
+    def test_detect_french(self):
+        """Test French text is detected."""
+        assert LanguageDetector.detect_language(FRENCH_TEXT) == "french"
+
+    def test_detect_english(self):
+        """Test English text is detected."""
+        assert LanguageDetector.detect_language(ENGLISH_TEXT) == "english"
+
+    def test_short_text_defaults_to_english(self):
+        """Test texts under the word threshold fall back to English."""
+        assert LanguageDetector.detect_language("") == "english"
+        assert LanguageDetector.detect_language("le la les de") == "english"
+
+    def test_ten_short_words_are_enough(self):
+        """Test the length shortcut does not reject short-but-valid samples."""
+        assert LanguageDetector.detect_language("le la de et un une les des est dans") == "french"
+
+    def test_no_markers_defaults_to_english(self):
+        """Test text without marker words falls back to English."""
+        assert LanguageDetector.detect_language("1234567890 " * 20) == "english"
+
+    def test_only_leading_sample_is_analysed(self):
+        """Test text past SAMPLE_CHARS does not affect the result."""
+        from docprocessor.utils.language_detector import SAMPLE_CHARS
+
+        padding = "x" * SAMPLE_CHARS
+        assert LanguageDetector.detect_language(padding + " " + FRENCH_TEXT) == "english"
+
+    def test_detection_cached_per_sample(self):
+        """Test repeated texts reuse the cached result of their leading sample."""
+        from docprocessor.utils.language_detector import SAMPLE_CHARS, _detect_sample
+
+        LanguageDetector.detect_language(FRENCH_TEXT)
+        hits = _detect_sample.cache_info().hits
+
+        long_text = FRENCH_TEXT.ljust(SAMPLE_CHARS, " ")
+        assert LanguageDetector.detect_language(FRENCH_TEXT) == "french"
+        assert LanguageDetector.detect_language(long_text + ENGLISH_TEXT) == "french"
+        assert LanguageDetector.detect_language(long_text + FRENCH_TEXT) == "french"
+        assert _detect_sample.cache_info().hits == hits + 2
+
+    def test_marker_sets_match_language_markers(self):
+        """Test the precomputed marker frozensets mirror LANGUAGE_MARKERS."""
+        markers = LanguageDetector.LANGUAGE_MARKERS
+        assert LanguageDetector.MARKER_WORDS.keys() == markers.keys()
+        for lang, words in LanguageDetector.MARKER_WORDS.items():
+            assert isinstance(words, frozenset)
+            assert words == set(markers[lang]["words"])
+
+
+class TestDetectFromChunks:
+    """Test detection over chunk samples."""
+
+    def test_detect_from_chunks(self):
+        """Test language is detected from chunk dicts."""
+        chunks = [{"text": FRENCH_TEXT}, {"text": FRENCH_TEXT}, {}]
+        assert LanguageDetector.detect_from_chunks(chunks) == "french"
+
+    def test_empty_chunks_default_to_english(self):
+        """Test an empty chunk list falls back to English."""
+        assert LanguageDetector.detect_from_chunks([]) == "english"
+
+    def test_stops_after_decisive_chunk(self):
+        """Test later chunks are not read once one language clearly leads."""
+
+        class Unreadable(dict):
+            def get(self, key, default=None):
+                raise AssertionError("chunk should not be read")
+
+        chunks = [{"text": FRENCH_TEXT * 3}, Unreadable()]
+        assert LanguageDetector.detect_from_chunks(chunks) == "french"
+
+    def test_scores_accumulate_across_chunks(self):
+        """Test short chunks are pooled before the word threshold applies."""
+        chunks = [{"text": "le la de et un"}, {"text": "une les des est dans"}]
+        assert LanguageDetector.detect_from_chunks(chunks) == "french"
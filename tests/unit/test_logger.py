@@ -0,0 +1,167 @@
+"""Unit tests for logging setup."""
+
+import logging
+import time
+
+import pytest
+
+from docprocessor.utils.logger import BufferedFileHandler, setup_logger
+
+
+@pytest.fixture
+def buffered_logger(tmp_path):
+    """Logger writing only to a BufferedFileHandler in a temp dir."""
+    log_file = tmp_path / "app.log"
+    handler = BufferedFileHandler(log_file)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    logger = logging.getLogger("test_logger.buffered")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(handler)
+    yield logger, handler, log_file
+    logger.removeHandler(handler)
+    handler.close()
+
+
+class TestBufferedFileHandler:
+    """Test deferred flushing of file log records."""
+
+    def test_info_records_are_buffered(self, buffered_logger):
+        """Test records below WARNING wait for a flush."""
+        logger, handler, log_file = buffered_logger
+
+        logger.info("quiet")
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        handler.flush()
+        assert log_file.read_text(encoding="utf-8") == "INFO quiet\n"
+
+    def test_warning_flushes_immediately(self, buffered_logger):
+        """Test WARNING records push out everything buffered before them."""
+        logger, _, log_file = buffered_logger
+
+        logger.info("first")
+        logger.warning("second")
+
+        assert log_file.read_text(encoding="utf-8") == "INFO first\nWARNING second\n"
+
+    def test_timer_flushes_buffer(self, buffered_logger, monkeypatch):
+        """Test buffered records are written once the flush interval elapses."""
+        logger, handler, log_file = buffered_logger
+        monkeypatch.setattr(handler, "FLUSH_INTERVAL", 0.01)
+
+        logger.debug("later")
+        deadline = time.monotonic() + 5
+        while not log_file.read_text(encoding="utf-8") and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert log_file.read_text(encoding="utf-8") == "DEBUG later\n"
+
+    def test_close_flushes(self, buffered_logger):
+        """Test closing the handler writes pending records."""
+        logger, handler, log_file = buffered_logger
+
+        logger.info("bye")
+        handler.close()
+
+        assert log_file.read_text(encoding="utf-8") == "INFO bye\n"
+
+
+class TestSetupLogger:
+    """Test setup_logger configuration."""
+
+    def test_file_logging_uses_buffered_handler(self, tmp_path):
+        """Test log_file output goes through BufferedFileHandler."""
+        log_file = tmp_path / "logs" / "app.log"
+        logger = setup_logger("test_logger.setup", log_file=log_file, rich_formatting=False)
+        try:
+            file_handlers = [h for h in logger.handlers if isinstance(h, BufferedFileHandler)]
+            assert len(file_handlers) == 1
+
+            logger.error("boom")
+            assert "boom" in log_file.read_text(encoding="utf-8")
+        finally:
+            for handler in logger.handlers:
+                handler.close()
+            logger.handlers.clear()
+
+    def test_rich_handler_failure_falls_back(self, monkeypatch):
+        """Test a RichHandler that fails to build leaves only the stdout handler."""
+        from docprocessor.utils import logger as logger_module
+
+        class BrokenRichHandler(logging.Handler):
+            def __init__(self, **kwargs):
+                raise RuntimeError("no terminal")
+
+        monkeypatch.setattr(logger_module, "_get_rich_handler_cls", lambda: BrokenRichHandler)
+        logger = setup_logger("test_logger.fallback")
+        try:
+            assert len(logger.handlers) == 1
+            assert type(logger.handlers[0]) is logging.StreamHandler
+        finally:
+            logger.handlers.clear()
+
+    def test_rich_import_probed_once(self):
+        """Test the RichHandler class lookup is cached."""
+        from docprocessor.utils.logger import _get_rich_handler_cls
+
+        assert _get_rich_handler_cls() is _get_rich_handler_cls()
+
+    def test_formatters_shared_between_loggers(self, tmp_path):
+        """Test setup_logger reuses the module-level formatters."""
+        from docprocessor.utils.logger import _CONSOLE_FORMATTER, _FILE_FORMATTER
+
+        first = setup_logger("test_logger.shared_a", rich_formatting=False)
+        second = setup_logger(
+            "test_logger.shared_b", log_file=tmp_path / "b.log", rich_formatting=False
+        )
+        try:
+            assert first.handlers[0].formatter is _CONSOLE_FORMATTER
+            assert second.handlers[0].formatter is _CONSOLE_FORMATTER
+            assert second.handlers[1].formatter is _FILE_FORMATTER
+        finally:
+            for logger in (first, second):
+                for handler in logger.handlers:
+                    handler.close()
+                logger.handlers.clear()
+
+    def test_fast_mode_skips_caller_lookup(self, tmp_path, monkeypatch):
+        """Test fast mode drops caller fields from the file format."""
+        from docprocessor.utils.logger import _FAST_FILE_FORMATTER
+
+        # Restore the process-wide logging switches after the test
+        for attr in ("_srcfile", "logThreads", "logProcesses", "logMultiprocessing"):
+            monkeypatch.setattr(logging, attr, getattr(logging, attr))
+
+        log_file = tmp_path / "fast.log"
+        logger = setup_logger(
+            "test_logger.fast", log_file=log_file, rich_formatting=False, fast=True
+        )
+        try:
+            assert logging._srcfile is None
+            assert logger.handlers[1].formatter is _FAST_FILE_FORMATTER
+
+            logger.error("quick")
+            assert log_file.read_text(encoding="utf-8").rstrip().endswith("ERROR - quick")
+        finally:
+            for handler in logger.handlers:
+                handler.close()
+            logger.handlers.clear()
+
+    def test_same_config_keeps_handlers(self, tmp_path):
+        """Test repeat calls with identical arguments reuse the handlers."""
+        log_file = tmp_path / "same.log"
+        logger = setup_logger("test_logger.same", log_file=log_file, rich_formatting=False)
+        try:
+            handlers = list(logger.handlers)
+            again = setup_logger("test_logger.same", log_file=log_file, rich_formatting=False)
+            assert again is logger
+            assert logger.handlers == handlers
+
+            setup_logger("test_logger.same", level=logging.DEBUG, rich_formatting=False)
+            assert len(logger.handlers) == 1
+            assert logger.level == logging.DEBUG
+        finally:
+            for handler in handlers + logger.handlers:
+                handler.close()
+            logger.handlers.clear()
@@ -16,8 +16,7 @@ def temp_projects_dir():
     temp_dir = Path(tempfile.mkdtemp())
     yield temp_dir
     # Cleanup after tests
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 @pytest.fixture
@@ -80,6 +79,16 @@ class TestProjectManager:
         assert project.settings.include_citations is True
         assert project.settings.temperature == 0.5
 
+    def test_template_settings_not_shared(self, project_manager):
+        """Test projects from the same template get independent settings."""
+        first = project_manager.create_project_from_template(name="A", template_name="legal")
+        second = project_manager.create_project_from_template(name="B", template_name="legal")
+
+        first.settings.temperature = 0.9
+
+        assert second.settings is not first.settings
+        assert second.settings.temperature == 0.3
+
     def test_create_project_invalid_template(self, project_manager):
         """Test error on invalid template."""
         with pytest.raises(ValueError, match="Template.*not found"):
@@ -10,7 +10,10 @@ from src.docprocessor.models.project import (
     DocumentInfo,
     Project,
     ProjectSettings,
+    SearchResult,
+    SynthesisCache,
     TaskExecutionRecord,
+    convert_uuids_to_strings,
 )
 
 
@@ -155,6 +158,66 @@ class TestTaskExecutionRecord:
         assert restored.duration_seconds == record.duration_seconds
 
 
+class TestGeneratedFromDict:
+    """Tests for the generated from_dict methods."""
+
+    def test_search_result_round_trip(self):
+        """Test SearchResult to/from dict, including optional dates."""
+        result = SearchResult(
+            title="Budget 2025",
+            url="https://example.org/budget.pdf",
+            snippet="...",
+            source_name="example.org",
+            file_type="pdf",
+            publication_date=datetime(2025, 1, 15),
+        )
+
+        assert SearchResult.from_dict(result.to_dict()) == result
+
+    def test_project_settings_defaults_from_fields(self):
+        """Test ProjectSettings.from_dict falls back to the declared defaults."""
+        assert ProjectSettings.from_dict({}) == ProjectSettings()
+
+        settings = ProjectSettings.from_dict({"language": "en", "max_tokens": 512})
+        assert settings.language == "en"
+        assert settings.max_tokens == 512
+        assert settings.chunk_size == ProjectSettings().chunk_size
+
+    def test_synthesis_cache_lenient_defaults(self):
+        """Test SynthesisCache.from_dict fills in optional keys."""
+        cache = SynthesisCache.from_dict(
+            {
+                "chapters": [{"title": "Intro"}],
+                "generated_at": "2025-01-15T10:00:00",
+                "synthesis_level": "normal",
+            }
+        )
+
+        assert cache.theme_ids == []
+        assert cache.total_words == 0
+        assert cache.config_used == {}
+        assert cache.generated_at == datetime(2025, 1, 15, 10, 0)
+
+    def test_project_requires_id(self):
+        """Test Project.from_dict still requires an id."""
+        data = Project(name="Test").to_dict()
+        del data["id"]
+
+        with pytest.raises(KeyError):
+            Project.from_dict(data)
+
+    def test_from_dict_defaults_are_not_shared(self):
+        """Test missing list fields get a fresh list per record."""
+        data = {"id": "d1", "file_path": "/p", "title": "D", "file_size": 1}
+        data["added_at"] = datetime.now().isoformat()
+
+        first = DocumentInfo.from_dict(data)
+        second = DocumentInfo.from_dict(data)
+        first.tags.append("x")
+
+        assert second.tags == []
+
+
 class TestProject:
     """Tests for Project class."""
 
@@ -238,6 +301,65 @@ class TestProject:
         not_found = project.get_document_by_path("/nonexistent/path.pdf")
         assert not_found is None
 
+    def test_records_are_slotted(self):
+        """Test record dataclasses use __slots__ instead of a per-instance dict."""
+        doc = DocumentInfo(id="doc1", file_path="/p", title="Doc", file_size=1)
+        project = Project(name="Test Project")
+
+        assert not hasattr(doc, "__dict__")
+        assert not hasattr(project, "__dict__")
+        with pytest.raises(AttributeError):
+            doc.unknown_attribute = 1
+
+    def test_document_lookup_tracks_direct_list_changes(self):
+        """Test lookups stay correct when documents is mutated directly."""
+        project = Project(name="Test Project")
+        doc1 = DocumentInfo(id="doc1", file_path="/p1", title="Doc1", file_size=1)
+        doc2 = DocumentInfo(id="doc2", file_path="/p2", title="Doc2", file_size=2)
+        project.add_document(doc1)
+        assert project.get_document("doc1") is doc1
+
+        project.documents.append(doc2)
+        assert project.get_document_by_path("/p2") is doc2
+
+        project.documents = []
+        assert project.get_document("doc1") is None
+        assert project.remove_document("doc2") is False
+
+    def test_remove_document_updates_indexes_in_place(self, monkeypatch):
+        """Test removing a document with unique keys does not rescan the list."""
+        project = Project(name="Test Project")
+        for i in range(3):
+            project.add_document(
+                DocumentInfo(id=f"doc{i}", file_path=f"/p{i}", title="D", file_size=1)
+            )
+        project.get_document("doc0")
+
+        def fail(self):
+            raise AssertionError("indexes should be updated incrementally")
+
+        monkeypatch.setattr(Project, "_reindex_documents", fail)
+        assert project.remove_document("doc1") is True
+
+        assert [d.id for d in project.documents] == ["doc0", "doc2"]
+        assert project.get_document("doc1") is None
+        assert project.get_document_by_path("/p1") is None
+        assert project.get_document_by_path("/p2").id == "doc2"
+
+    def test_remove_document_with_duplicate_id(self):
+        """Test removing one of two documents sharing an ID exposes the other."""
+        project = Project(name="Test Project")
+        first = DocumentInfo(id="dup", file_path="/a", title="A", file_size=1)
+        second = DocumentInfo(id="dup", file_path="/b", title="B", file_size=1)
+        project.add_document(first)
+        project.add_document(second)
+
+        assert project.get_document("dup") is first
+        assert project.remove_document("dup") is True
+        assert project.documents == [second]
+        assert project.get_document("dup") is second
+        assert project.get_document_by_path("/a") is None
+
     def test_get_processed_documents(self):
         """Test filtering processed documents."""
         project = Project(name="Test Project")
@@ -343,6 +465,28 @@ class TestProject:
         project.clear_themes()
         assert len(project.themes) == 0
 
+    def test_get_recent_tasks(self):
+        """Test recent tasks are returned newest first and limited."""
+        project = Project(name="Test Project")
+        for day in (3, 1, 5, 2, 4):
+            project.add_task_record(
+                TaskExecutionRecord(
+                    task_name=f"task{day}",
+                    task_display_name=f"Task {day}",
+                    executed_at=datetime(2024, 1, day),
+                    status="completed",
+                    duration_seconds=1,
+                    input_document_ids=[],
+                    output_files=[],
+                    output_data={},
+                    config_used={},
+                )
+            )
+
+        recent = project.get_recent_tasks(limit=3)
+        assert [r.task_name for r in recent] == ["task5", "task4", "task3"]
+        assert len(project.get_recent_tasks()) == 5
+
     def test_get_statistics(self):
         """Test project statistics."""
         project = Project(name="Test Project")
@@ -380,6 +524,26 @@ class TestProject:
         assert stats["total_tasks_executed"] == 1
         assert "task_counts" in stats
 
+    def test_get_statistics_cache_invalidation(self):
+        """Test memoized statistics refresh after project changes."""
+        project = Project(name="Test Project")
+        project.add_document(DocumentInfo(id="d1", file_path="/p1", title="D1", file_size=10))
+
+        stats = project.get_statistics()
+        stats["task_counts"]["bogus"] = 1
+        assert project.get_statistics()["task_counts"] == {}
+        assert project.get_statistics()["total_documents"] == 1
+
+        project.add_document(DocumentInfo(id="d2", file_path="/p2", title="D2", file_size=5))
+        assert project.get_statistics()["total_size_bytes"] == 15
+
+        project.documents[0].processed = True
+        project.update_timestamp()
+        assert project.get_statistics()["processed_documents"] == 1
+
+        project.documents = []
+        assert project.get_statistics()["total_documents"] == 0
+
     def test_project_serialization(self):
         """Test project save/load to JSON."""
         project = Project(name="Serialization Test", description="Test project")
@@ -436,6 +600,121 @@ class TestProject:
             if temp_file.exists():
                 temp_file.unlink()
 
+    def test_save_replaces_file_atomically(self, tmp_path):
+        """Test saving overwrites via a temp file and leaves no temp behind."""
+        project_file = tmp_path / "project.json"
+        project_file.write_text("stale", encoding="utf-8")
+
+        Project(name="Atomic").save_to_file(project_file)
+
+        assert Project.load_from_file(project_file).name == "Atomic"
+        assert [p.name for p in tmp_path.iterdir()] == ["project.json"]
+
+    def test_failed_save_keeps_previous_file(self, tmp_path, monkeypatch):
+        """Test an error during the write leaves the existing file intact."""
+        import os
+
+        project_file = tmp_path / "project.json"
+        Project(name="Original").save_to_file(project_file)
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            Project(name="Broken").save_to_file(project_file)
+        monkeypatch.undo()
+
+        assert Project.load_from_file(project_file).name == "Original"
+        assert [p.name for p in tmp_path.iterdir()] == ["project.json"]
+
+    def test_msgpack_file_round_trip(self, tmp_path):
+        """Test .msgpack project files round-trip through MessagePack."""
+        pytest.importorskip("msgpack")
+        project_file = tmp_path / "project.msgpack"
+        project = Project(name="Binary")
+        project.add_document(DocumentInfo(id="doc1", file_path="/p", title="Doc", file_size=1))
+
+        project.save_to_file(project_file)
+
+        assert not project_file.read_bytes().startswith(b"{")
+        loaded = Project.load_from_file(project_file)
+        assert loaded.name == "Binary"
+        assert loaded.get_document("doc1").title == "Doc"
+
+    def test_msgpack_requires_package(self, tmp_path, monkeypatch):
+        """Test a clear ImportError is raised when msgpack is unavailable."""
+        import sys
+
+        monkeypatch.setitem(sys.modules, "msgpack", None)
+        with pytest.raises(ImportError, match="pip install msgpack"):
+            Project(name="Binary").save_to_file(tmp_path / "project.msgpack")
+
+    def test_background_save(self, tmp_path):
+        """Test background saves write the file and return a future."""
+        project_file = tmp_path / "project.json"
+
+        future = Project(name="Background").save_to_file(project_file, background=True)
+        future.result(timeout=5)
+
+        assert Project.load_from_file(project_file).name == "Background"
+
+    def test_background_saves_coalesce(self, tmp_path):
+        """Test queued saves to one path collapse into a single latest write."""
+        import threading
+
+        from src.docprocessor.models import project as project_module
+
+        project_file = tmp_path / "project.json"
+        Project(name="Warmup").save_to_file(tmp_path / "warmup.json", background=True).result()
+
+        # Hold the save thread so both saves below are queued together
+        release = threading.Event()
+        project_module._save_executor.submit(release.wait, 5)
+        first = Project(name="First").save_to_file(project_file, background=True)
+        second = Project(name="Second").save_to_file(project_file, background=True)
+        release.set()
+
+        assert first is second
+        second.result(timeout=5)
+        assert Project.load_from_file(project_file).name == "Second"
+
+        # A synchronous save after background ones lands last
+        Project(name="Sync").save_to_file(project_file)
+        assert Project.load_from_file(project_file).name == "Sync"
+
+    def test_background_save_snapshots_nested_data(self, tmp_path):
+        """Test in-place edits after a background save do not reach the queued write."""
+        import threading
+
+        from src.docprocessor.models import project as project_module
+
+        project_file = tmp_path / "project.json"
+        project = Project(name="Snapshot", themes=[{"title": "Original"}], tags=["a"])
+        Project(name="Warmup").save_to_file(tmp_path / "warmup.json", background=True).result()
+
+        release = threading.Event()
+        project_module._save_executor.submit(release.wait, 5)
+        future = project.save_to_file(project_file, background=True)
+        project.themes[0]["title"] = "Edited"
+        project.tags.append("b")
+        release.set()
+        future.result(timeout=5)
+
+        loaded = Project.load_from_file(project_file)
+        assert loaded.themes == [{"title": "Original"}]
+        assert loaded.tags == ["a"]
+
+    def test_background_save_failure_logged(self, tmp_path, caplog):
+        """Test a failed background write is logged and raised from the future."""
+        project_file = tmp_path / "missing" / "project.json"
+
+        future = Project(name="Broken").save_to_file(project_file, background=True)
+
+        with pytest.raises(OSError):
+            future.result(timeout=5)
+        assert "Background save" in caplog.text
+
     def test_update_timestamp(self):
         """Test timestamp updates."""
         project = Project(name="Test")
@@ -449,6 +728,51 @@ class TestProject:
         project.update_timestamp()
         assert project.updated_at > old_timestamp
 
+    def test_to_dict_tracks_timestamp_changes(self):
+        """Test cached ISO strings follow reassigned timestamps."""
+        project = Project(name="Test")
+        first = project.to_dict()
+        assert first["last_opened_at"] is None
+
+        project.updated_at = datetime(2030, 1, 2, 3, 4, 5)
+        project.mark_opened()
+        second = project.to_dict()
+
+        assert second["updated_at"] == "2030-01-02T03:04:05"
+        assert second["last_opened_at"] == project.last_opened_at.isoformat()
+        assert second["created_at"] == first["created_at"]
+
+    def test_iso_caches_are_not_fields(self):
+        """Test the cached ISO strings stay out of fields() and asdict()."""
+        import dataclasses
+
+        doc = DocumentInfo(id="d1", file_path="/p", title="D", file_size=100)
+        doc.to_dict()
+
+        assert set(dataclasses.asdict(doc)) == set(doc.to_dict())
+        assert not any(f.name.endswith("_iso") for f in dataclasses.fields(Project))
+
+    def test_statistics_cache_is_not_a_field(self):
+        """Test the memoized statistics stay out of asdict()."""
+        import dataclasses
+
+        project = Project(name="Test")
+        project.get_statistics()
+
+        assert not any(name.startswith("_") for name in dataclasses.asdict(project))
+
+    def test_document_indexes_are_not_fields(self):
+        """Test the document lookup indexes stay out of asdict() and are rebuilt on copies."""
+        import dataclasses
+
+        project = Project(name="Test")
+        project.add_document(DocumentInfo(id="d1", file_path="/p", title="D", file_size=100))
+
+        assert not any(name.startswith("_docs") for name in dataclasses.asdict(project))
+        copy = dataclasses.replace(project, documents=[])
+        assert copy.get_document("d1") is None
+        assert project.get_document("d1") is not None
+
     def test_mark_opened(self):
         """Test marking project as opened."""
         project = Project(name="Test")
@@ -469,5 +793,46 @@ class TestProject:
         assert "1 themes" in string
 
 
+class TestConvertUuidsToStrings:
+    """Tests for convert_uuids_to_strings helper."""
+
+    def test_uuid_free_structure_is_not_copied(self):
+        """Test structures without UUIDs are returned unchanged."""
+        themes = [{"id": "t1", "chunk_ids": ["a", "b"], "score": 0.5}]
+
+        assert convert_uuids_to_strings(themes) is themes
+
+    def test_nested_uuids_converted(self):
+        """Test UUIDs in nested dicts, lists and tuples become strings."""
+        import uuid
+
+        theme_id = uuid.uuid4()
+        chunk_id = uuid.uuid4()
+        themes = [{"id": theme_id, "chunk_ids": [chunk_id], "pair": (1, (chunk_id,))}]
+
+        converted = convert_uuids_to_strings(themes)
+
+        assert converted == [
+            {"id": str(theme_id), "chunk_ids": [str(chunk_id)], "pair": (1, (str(chunk_id),))}
+        ]
+        assert list(converted[0]) == ["id", "chunk_ids", "pair"]
+        # Input is left untouched
+        assert themes[0]["id"] is theme_id
+
+    def test_container_subclasses_converted(self):
+        """Test dict/tuple subclasses take the fallback path and are rebuilt."""
+        import uuid
+        from collections import OrderedDict, namedtuple
+
+        Pair = namedtuple("Pair", "left right")
+        value = uuid.uuid4()
+
+        converted = convert_uuids_to_strings(OrderedDict(pair=Pair(value, "x")))
+
+        assert converted == {"pair": (str(value), "x")}
+        assert type(converted) is dict
+        assert type(converted["pair"]) is tuple
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,47 @@
+"""Unit tests for PromptManager."""
+
+from docprocessor.llm.prompt_manager import PromptManager
+
+
+class TestPromptManager:
+    """Test prompt loading and lookup."""
+
+    def test_prompts_loaded_lazily(self, tmp_path):
+        """Test the prompts file is only parsed on first access."""
+        prompts_file = tmp_path / "prompts.yaml"
+        prompts_file.write_text(
+            "greeting:\n  system: Be nice\n  user: 'Hello {name}'\n", encoding="utf-8"
+        )
+
+        manager = PromptManager(prompts_file)
+        assert manager._prompts is None
+
+        system, user = manager.get_prompt("greeting", name="Ada")
+        assert system == "Be nice"
+        assert user == "Hello Ada"
+        assert manager.list_prompts() == ["greeting"]
+
+    def test_missing_file_uses_defaults(self, tmp_path):
+        """Test default prompts are used when the file does not exist."""
+        manager = PromptManager(tmp_path / "missing.yaml")
+
+        assert "rag_query" in manager.list_prompts()
+
+    def test_add_prompt_before_first_access(self, tmp_path):
+        """Test add_prompt keeps the templates loaded from file."""
+        prompts_file = tmp_path / "prompts.yaml"
+        prompts_file.write_text("greeting:\n  system: s\n  user: u\n", encoding="utf-8")
+
+        manager = PromptManager(prompts_file)
+        manager.add_prompt("custom", "sys", "{x}")
+
+        assert sorted(manager.list_prompts()) == ["custom", "greeting"]
+        assert manager.get_prompt("custom", x="1") == ("sys", "1")
+
+    def test_resource_path_is_cached(self):
+        """Test repeated resource lookups return the cached Path."""
+        from docprocessor.llm.prompt_manager import get_resource_path
+
+        first = get_resource_path("config/prompts.yaml")
+        assert get_resource_path("config/prompts.yaml") is first
+        assert first.parts[-2:] == ("config", "prompts.yaml")
@@ -0,0 +1,34 @@
+"""Unit tests for Theme model."""
+
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from docprocessor.models import Theme
+
+
+class TestTheme:
+    """Test Theme construction paths."""
+
+    def test_validated_construction(self):
+        """Test the normal constructor still enforces the score range."""
+        with pytest.raises(ValidationError):
+            Theme(label="Budget", importance_score=1.5)
+
+    def test_unknown_keys_ignored(self):
+        """Test extra keys from saved data are dropped."""
+        theme = Theme(label="Budget", obsolete_field=True)
+
+        assert not hasattr(theme, "obsolete_field")
+
+    def test_model_construct_fills_defaults(self):
+        """Test model_construct skips validation but keeps default factories."""
+        chunk_ids = [uuid4(), uuid4()]
+        theme = Theme.model_construct(label="Budget", chunk_ids=chunk_ids, keywords=["tax"])
+
+        assert isinstance(theme.id, UUID)
+        assert theme.chunk_count == 2
+        assert theme.merged_from == []
+        assert theme.importance_score == 0.0
+        assert str(theme) == "Theme('Budget', 2 chunks)"
@@ -19,8 +19,7 @@ def temp_import_dir():
     temp_dir = Path(tempfile.mkdtemp())
     yield temp_dir
     # Cleanup
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 @pytest.mark.unit
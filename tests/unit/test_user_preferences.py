@@ -0,0 +1,256 @@
+"""Unit tests for UserPreferencesManager."""
+
+import json
+import time
+
+import pytest
+
+from docprocessor.gui.theme_manager import ThemeType
+from docprocessor.utils.user_preferences import UserPreferencesManager
+
+
+@pytest.fixture
+def prefs_file(tmp_path):
+    """Path of the preferences file used by the manager under test."""
+    return tmp_path / "preferences.json"
+
+
+@pytest.fixture
+def manager(prefs_file, monkeypatch):
+    """Fresh UserPreferencesManager writing to a temporary file."""
+    monkeypatch.setattr(UserPreferencesManager, "_preferences_file", prefs_file)
+    monkeypatch.setattr(UserPreferencesManager, "_instance", None)
+    manager = UserPreferencesManager()
+    yield manager
+    manager.flush()
+
+
+class TestSaving:
+    """Test debounced preference writes."""
+
+    def test_save_is_deferred_until_flush(self, manager, prefs_file):
+        """Test setters do not write until the debounce fires or flush is called."""
+        manager.set_theme(ThemeType.LIGHT)
+        manager.set_language("en")
+        assert not prefs_file.exists()
+
+        assert manager.flush()
+        data = json.loads(prefs_file.read_text(encoding="utf-8"))
+        assert data["theme"] == ThemeType.LIGHT.value
+        assert data["language"] == "en"
+
+    def test_burst_of_saves_writes_once(self, manager, prefs_file, monkeypatch):
+        """Test many setter calls collapse into a single write."""
+        writes = []
+        original = manager._write_to_disk
+        monkeypatch.setattr(manager, "_write_to_disk", lambda: writes.append(1) or original())
+
+        for width in range(50):
+            manager.set_window_geometry({"width": width})
+        manager.flush()
+        manager.flush()
+
+        assert len(writes) == 1
+        assert json.loads(prefs_file.read_text(encoding="utf-8"))["window_geometry"] == {
+            "width": 49
+        }
+
+    def test_write_replaces_file_atomically(self, manager, prefs_file):
+        """Test the write goes through a temp file that is renamed into place."""
+        prefs_file.write_text("{}", encoding="utf-8")
+
+        manager.set_language("en")
+        assert manager.flush()
+
+        assert json.loads(prefs_file.read_text(encoding="utf-8"))["language"] == "en"
+        assert [p.name for p in prefs_file.parent.iterdir()] == ["preferences.json"]
+
+    def test_unchanged_preferences_not_rewritten(self, manager, prefs_file):
+        """Test saving identical content leaves the file untouched."""
+        manager.set_language("en")
+        manager.flush()
+        written = prefs_file.read_bytes()
+        prefs_file.unlink()
+
+        manager.set_language("en")
+        assert manager.flush()
+        assert not prefs_file.exists()
+
+        prefs_file.write_bytes(written)
+        manager.set_language("ar")
+        manager.flush()
+        assert json.loads(prefs_file.read_text(encoding="utf-8"))["language"] == "ar"
+
+    def test_failed_write_stays_pending(self, manager, prefs_file, monkeypatch):
+        """Test a failed write is retried by the next flush instead of being dropped."""
+        manager.set_language("en")
+        with monkeypatch.context() as patch:
+            patch.setattr(manager, "_write_to_disk", lambda: False)
+            assert not manager.flush()
+        assert not prefs_file.exists()
+
+        assert manager.flush()
+        assert json.loads(prefs_file.read_text(encoding="utf-8"))["language"] == "en"
+
+    def test_timer_flushes_automatically(self, manager, prefs_file, monkeypatch):
+        """Test the debounce timer writes without an explicit flush."""
+        monkeypatch.setattr(manager, "SAVE_DELAY_SECONDS", 0.01)
+        manager.set_language("ar")
+
+        deadline = time.monotonic() + 5
+        while not prefs_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert json.loads(prefs_file.read_text(encoding="utf-8"))["language"] == "ar"
+
+
+class TestLoading:
+    """Test reading preferences back from disk."""
+
+    def test_preferences_loaded_lazily(self, tmp_path, monkeypatch):
+        """Test creating the manager touches no files until first use."""
+        prefs_file = tmp_path / "nested" / "preferences.json"
+        monkeypatch.setattr(UserPreferencesManager, "_preferences_file", prefs_file)
+        monkeypatch.setattr(UserPreferencesManager, "_instance", None)
+
+        manager = UserPreferencesManager()
+        assert manager._preferences is None
+        assert not prefs_file.parent.exists()
+
+        manager.set_language("en")
+        assert manager.flush()
+        assert prefs_file.exists()
+
+    def test_default_path_resolved_on_first_use(self, tmp_path, monkeypatch):
+        """Test the home-directory path is only computed when first needed."""
+        monkeypatch.setattr(UserPreferencesManager, "_instance", None)
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        manager = UserPreferencesManager()
+        assert UserPreferencesManager._preferences_file is None
+
+        path = manager.get_preferences_file_path()
+        assert path == tmp_path / ".docprocessor" / "preferences.json"
+        assert manager.get_preferences_file_path() is path
+        assert UserPreferencesManager._preferences_file is None
+
+    def test_saved_preferences_reload(self, manager, prefs_file, monkeypatch):
+        """Test a new manager instance reads what the previous one wrote."""
+        manager.set_language("en")
+        manager.set_last_project_id("project-1")
+        manager.flush()
+
+        monkeypatch.setattr(UserPreferencesManager, "_instance", None)
+        reloaded = UserPreferencesManager()
+
+        assert reloaded.get_language() == "en"
+        assert reloaded.get_last_project_id() == "project-1"
+
+    def test_corrupt_file_uses_defaults(self, manager, prefs_file):
+        """Test an unreadable preferences file falls back to defaults."""
+        prefs_file.write_bytes(b"{not json")
+
+        assert manager.load().language == "fr"
+
+    def test_stdlib_json_fallback(self, manager, prefs_file, monkeypatch):
+        """Test preferences round-trip without orjson installed."""
+        from docprocessor.utils import fast_json
+
+        monkeypatch.setattr(fast_json, "orjson", None)
+        manager.set_language("ar")
+        manager.flush()
+
+        assert manager.load().language == "ar"
+
+
+class TestSearchHistory:
+    """Test search history bookkeeping."""
+
+    def test_history_entries_newest_first(self, manager):
+        """Test new entries go to the front and carry timestamps."""
+        manager.add_search_history_entry("first", ["a.tn"], "auto", 1, "google")
+        manager.add_search_history_entry(
+            "second", ["b.tn"], "native", 2, "ckan", timestamp="2025-01-01T00:00:00"
+        )
+
+        history = manager.get_search_history()
+
+        assert [e.query for e in history] == ["second", "first"]
+        assert history[0].timestamp == "2025-01-01T00:00:00"
+        assert history[1].timestamp
+
+    def test_history_capped_and_removable(self, manager):
+        """Test history keeps the newest MAX_SEARCH_HISTORY entries."""
+        from docprocessor.utils.user_preferences import MAX_SEARCH_HISTORY
+
+        for i in range(MAX_SEARCH_HISTORY + 5):
+            manager.add_search_history_entry(f"q{i}", [], "auto", i, "google")
+
+        queries = [e.query for e in manager.get_search_history()]
+        assert len(queries) == MAX_SEARCH_HISTORY
+        assert queries[0] == f"q{MAX_SEARCH_HISTORY + 4}"
+        assert queries[-1] == "q5"
+
+        assert manager.remove_search_history_entry(0)
+        assert manager.get_search_history()[0].query == f"q{MAX_SEARCH_HISTORY + 3}"
+        assert not manager.remove_search_history_entry(MAX_SEARCH_HISTORY)
+
+        assert manager.clear_search_history()
+        assert manager.get_search_history() == []
+        assert manager.get_preferences().to_dict()["search_history"] == []
+
+    def test_history_parsed_once(self, manager, monkeypatch):
+        """Test repeated reads reuse the parsed entries until history changes."""
+        from docprocessor.utils.user_preferences import SearchHistoryEntry
+
+        manager.add_search_history_entry("q", [], "auto", 1, "google")
+        first = manager.get_search_history()
+
+        def fail(data):
+            raise AssertionError("history should not be re-parsed")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(SearchHistoryEntry, "from_dict", fail)
+            second = manager.get_search_history()
+        assert second == first and second is not first
+
+        manager.add_search_history_entry("r", [], "auto", 1, "google")
+        assert [e.query for e in manager.get_search_history()] == ["r", "q"]
+
+
+class TestEnumPreferences:
+    """Test theme and size profile lookups."""
+
+    def test_invalid_values_fall_back(self, manager):
+        """Test unknown stored values map to the default enum members."""
+        from docprocessor.gui.size_profile import SizeProfileType
+
+        prefs = manager.get_preferences()
+        prefs.theme = "neon"
+        prefs.size_profile = "huge"
+
+        assert manager.get_theme() is ThemeType.DARK
+        assert manager.get_size_profile() is SizeProfileType.SMALL
+
+    def test_coercion_cached_per_value(self, manager):
+        """Test repeated lookups of the same stored value hit the cache."""
+        from docprocessor.utils.user_preferences import _to_theme
+
+        manager.set_theme(ThemeType.LIGHT)
+        manager.get_theme()
+        hits = _to_theme.cache_info().hits
+
+        assert manager.get_theme() is ThemeType.LIGHT
+        assert _to_theme.cache_info().hits == hits + 1
+
+
+class TestModels:
+    """Test the preference data models."""
+
+    def test_models_are_slotted(self):
+        """Test preference models carry no per-instance __dict__."""
+        from docprocessor.utils.user_preferences import SearchHistoryEntry, UserPreferences
+
+        entry = SearchHistoryEntry("q", "2025-01-01T00:00:00", [], "auto", 0, "google")
+        assert not hasattr(entry, "__dict__")
+        assert not hasattr(UserPreferences(), "__dict__")
@@ -18,10 +18,12 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def vector_store(temp_dir):
-    """Create a VectorStore instance."""
-    return VectorStore(collection_name="test_collection", persist_directory=temp_dir)
+@pytest.fixture(params=["chroma", "memory"])
+def vector_store(request, temp_dir):
+    """Create a VectorStore instance for each backend."""
+    return VectorStore(
+        collection_name="test_collection", persist_directory=temp_dir, backend=request.param
+    )
 
 
 @pytest.fixture
@@ -86,7 +88,7 @@ class TestVectorStore:
         vector_store.add_chunks(sample_chunks)
 
         # Search with first chunk's embedding
-        query_embedding = np.array(sample_chunks[0].embedding)
+        query_embedding = sample_chunks[0].embedding_array
         results = vector_store.search(query_embedding, n_results=3)
 
         assert isinstance(results, list)
@@ -104,7 +106,7 @@ class TestVectorStore:
         vector_store.add_chunks(sample_chunks)
 
         # Search with exact chunk embedding - should return itself first
-        query_embedding = np.array(sample_chunks[0].embedding)
+        query_embedding = sample_chunks[0].embedding_array
         results = vector_store.search(query_embedding, n_results=1)
 
         assert len(results) == 1
@@ -186,6 +188,24 @@ class TestVectorStore:
         with pytest.raises((ValueError, AttributeError, TypeError)):
             vector_store.add_chunks([chunk])
 
+    def test_mixed_embedding_dimensions_rejected(self, vector_store):
+        """Test chunks whose embeddings differ in length are not re-split into rows."""
+        chunks = [
+            Chunk(
+                document_id=str(uuid4()),
+                text=f"chunk {dim}",
+                chunk_index=i,
+                start_char=0,
+                end_char=10,
+                embedding=np.ones(dim, dtype=np.float32),
+            )
+            for i, dim in enumerate([2, 4, 3])
+        ]
+
+        with pytest.raises(ValueError, match=str(chunks[1].id)):
+            vector_store.add_chunks(chunks)
+        assert vector_store.count() == 0
+
     def test_metadata_preservation(self, vector_store, sample_chunks):
         """Test that metadata is preserved in storage and retrieval."""
         vector_store.add_chunks(sample_chunks)
@@ -202,6 +222,59 @@ class TestVectorStore:
             )
 
 
+class TestMemoryBackend:
+    """Test behavior specific to the in-memory backend."""
+
+    def test_memory_backend_writes_nothing(self, temp_dir, sample_chunks):
+        """Test the in-memory backend leaves the persist directory untouched."""
+        persist_dir = temp_dir / "unused"
+        store = VectorStore(persist_directory=persist_dir, backend="memory")
+        store.add_chunks(sample_chunks)
+
+        assert store.count() == len(sample_chunks)
+        assert not persist_dir.exists()
+
+    def test_memory_search_distances_ordered(self, sample_chunks):
+        """Test results come back nearest first with cosine distances."""
+        store = VectorStore(backend="memory")
+        store.add_chunks(sample_chunks)
+
+        results = store.search(sample_chunks[2].embedding_array, n_results=5)
+
+        assert results[0]["id"] == str(sample_chunks[2].id)
+        assert results[0]["distance"] == pytest.approx(0.0, abs=1e-5)
+        distances = [r["distance"] for r in results]
+        assert distances == sorted(distances)
+
+    def test_memory_search_where_filter(self, sample_chunks):
+        """Test metadata equality filters restrict the candidates."""
+        store = VectorStore(backend="memory")
+        store.add_chunks(sample_chunks)
+
+        document_id = str(sample_chunks[1].document_id)
+        results = store.search(
+            sample_chunks[0].embedding_array, n_results=5, where={"document_id": document_id}
+        )
+
+        assert [r["id"] for r in results] == [str(sample_chunks[1].id)]
+
+    def test_memory_rejects_dimension_change(self, sample_chunks):
+        """Test later adds must match the dimension already stored, as in ChromaDB."""
+        store = VectorStore(backend="memory")
+        store.add_chunks(sample_chunks)
+
+        chunk = sample_chunks[0].model_copy(update={"id": uuid4()})
+        chunk.embedding = np.ones(8, dtype=np.float32)
+        with pytest.raises(ValueError, match="dimension"):
+            store.add_chunk(chunk)
+        assert store.count() == len(sample_chunks)
+
+    def test_unknown_backend(self, temp_dir):
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ValueError, match="Unknown vector store backend"):
+            VectorStore(persist_directory=temp_dir, backend="faiss")
+
+
 class TestVectorStoreEdgeCases:
     """Test edge cases and error handling."""
 